@@ -0,0 +1,95 @@
+""" Child process script of benchmarks.startup, running frontend.src.__main__ against an
+    in-memory database stand-in, within a working directory holding a logged in user
+    and their state snapshot, and reporting the time elapsed since the passed process
+    start timestamp at each milestone as JSON on stdout
+
+    Usage:
+        python -m benchmarks._startup_milestones --seed
+            stores logged in user and state snapshot in the current working directory
+        python -m benchmarks._startup_milestones PROCESS_START_TIMESTAMP """
+
+import json
+import os
+import runpy
+import sys
+import time
+
+
+_USERNAME = 'benchmark_user'
+
+_milestones: dict[str, float] = {}
+
+
+def _seed():
+    from frontend.src import logged_in_user, state_snapshot
+    from frontend.src.paths import KEYS_DIR_PATH
+    from frontend.src.state import State, UserData
+
+    KEYS_DIR_PATH.mkdir(exist_ok=True)
+    logged_in_user.store(_USERNAME)
+
+    State(_USERNAME, is_new_user=False, user_data=UserData(languages={'Italian'}, vocabulary_possessing_languages=set(), reference_language=None))
+    state_snapshot.store()
+
+
+class _FirstPrompt(Exception):
+    pass
+
+
+def _measure(process_start: float):
+    def reached(milestone: str):
+        _milestones[milestone] = time.time() - process_start
+
+    # substitute in-memory database stand-in before the import of any module instantiating a client
+    import mongomock
+    import pymongo
+
+    pymongo.MongoClient = mongomock.MongoClient  # type: ignore
+
+    from frontend.src import database_connection, state_snapshot
+    from frontend.src.utils.prompt.input_reader import input_reader
+
+    # __main__ establishes the connection subsequent to all of its imports
+    establish_in_background = database_connection.establish_in_background
+
+    def timed_establish_in_background():
+        reached('imports')
+        establish_in_background()
+        database_connection.submit(lambda: reached('database_client_connected'))
+
+    database_connection.establish_in_background = timed_establish_in_background
+
+    restore = state_snapshot.restore
+
+    def timed_restore(username: str):
+        if (state := restore(username)) is not None:
+            reached('state_built')
+        return state
+
+    state_snapshot.restore = timed_restore
+
+    def abort_on_prompt(*_, **__):
+        raise _FirstPrompt
+
+    # all prompts being read through the input reader
+    input_reader.read_line = abort_on_prompt  # type: ignore
+    sys.stdout = open(os.devnull, 'w')
+
+    try:
+        runpy.run_module('frontend.src.__main__', run_name='__main__')
+    except _FirstPrompt:
+        pass
+
+    if 'state_built' not in _milestones:
+        sys.exit('State snapshot restoration failed, seed working directory by --seed')
+    reached('home_screen_rendered')
+
+    database_connection.await_established()
+    print(json.dumps(_milestones), file=sys.__stdout__)
+
+
+if __name__ == '__main__':
+    if sys.argv[1] == '--seed':
+        _seed()
+    else:
+        _measure(process_start=float(sys.argv[1]))
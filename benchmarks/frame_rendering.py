@@ -0,0 +1,159 @@
+""" Frame rendering benchmark, comparing the bytes and write syscalls per item
+    the output of simulated sentence translation and vocable trainer sessions
+    results in, if
+        - printed directly, partially updated by erasing and reprinting, as done previously
+        - composed in frames, partially updated by repainting merely the altered rows
+
+    Writes are counted at a line buffered terminal stand-in, as stdout is if
+    connected to a terminal
+
+    Usage: python -m benchmarks.frame_rendering [--items N] """
+
+from __future__ import annotations
+
+from contextlib import nullcontext, redirect_stdout
+from typing import Callable
+import argparse
+import datetime
+import io
+import json
+import os
+import sys
+
+from termcolor import colored
+
+from benchmarks.startup import RESULTS_DIR_PATH
+from frontend.src.utils import output as op
+
+
+class _LineBufferedTerminal(io.TextIOBase):
+    def __init__(self):
+        self.n_bytes = 0
+        self.n_writes = 0
+        self._n_pending_bytes = 0
+
+    def isatty(self) -> bool:
+        return True
+
+    def write(self, string: str) -> int:
+        self._n_pending_bytes += len(string.encode())
+        if '\n' in string:
+            self.flush()
+        return len(string)
+
+    def flush(self):
+        if self._n_pending_bytes:
+            self.n_bytes += self._n_pending_bytes
+            self.n_writes += 1
+            self._n_pending_bytes = 0
+
+
+class _ErasingRedoPrint(op.RedoPrint):
+    def redo_partially(self, n_deletion_rows: int):
+        op.erase_lines(self._n_buffered_terminal_rows)
+
+        for _ in range(n_deletion_rows):
+            self._popleft()
+
+        self.redo()
+
+
+_SENTENCE = 'Quando eravamo giovani, passavamo ogni estate al mare con i nostri nonni.'
+_INDENTATION = ' ' * 18
+
+
+def _awaited_input():
+    """ Flushes stdout, as done by input() """
+
+    sys.stdout.flush()
+
+
+def _sentence_translation_session(n_items: int, redo_print: op.RedoPrint):
+    for i in range(n_items):
+        redo_print(f'{_INDENTATION}{_SENTENCE}')
+        print(colored(f'{_INDENTATION}pending... ', 'cyan', attrs=['dark']))
+        print(f'{_INDENTATION}$ ', end='')
+        _awaited_input()
+
+        op.erase_lines(2)
+        redo_print(f'{_INDENTATION}{_SENTENCE}')
+        redo_print(f'{_INDENTATION}{colored("─────────────────", "red")}')
+        op.flush()
+
+        if i >= 5:
+            redo_print.redo_partially(n_deletion_rows=3)
+
+
+def _vocable_trainer_session(n_items: int, undo_print: op.UndoPrint):
+    for i in range(n_items):
+        op.centered(f'Current streak: {colored(str(i), "red", attrs=["bold"])}', end='', line_counter=undo_print)
+        undo_print('\n\n')
+        percentage = i / n_items
+        op.centered(f'[{"=" * int(70 * percentage)}{"-" * (70 - int(70 * percentage))}]', end=' ', line_counter=undo_print)
+        undo_print(f'{int(round(percentage * 100))}%\n\n')
+        undo_print('\t\tgiovane = ', end='')
+        _awaited_input()
+
+        op.erase_lines(1)
+        undo_print('\t\tgiovane = ', end='')
+        undo_print(f'young | {colored("CORRECT", "green")} | New Score: 2', end='')
+        undo_print('\n')
+        for _ in range(2):
+            op.centered(f'{_SENTENCE} - {_SENTENCE}', line_counter=undo_print)
+        undo_print('')
+        undo_print('')
+        undo_print.add_rows_to_buffer(1)
+        print(f'{op.column_percentual_indentation(0.49)}$ ', end='')
+        _awaited_input()
+
+        undo_print.undo()
+
+
+def _measured(session: Callable[[], None], framed: bool) -> dict[str, float]:
+    terminal = _LineBufferedTerminal()
+    with redirect_stdout(terminal), (op.frame() if framed else nullcontext()):
+        session()
+    return {'n_bytes': terminal.n_bytes, 'n_writes': terminal.n_writes}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark frame rendering')
+    parser.add_argument('--items', type=int, default=1_000)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('TERM', 'xterm-256color')
+
+    result = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'n_items': args.items,
+        'per_item': {
+            trainer: {
+                kind: {metric: value / args.items for metric, value in _measured(session, framed=kind == 'framed').items()}
+                for kind, session in (
+                    ('direct', lambda: session_function(args.items, direct_printer())),
+                    ('framed', lambda: session_function(args.items, framed_printer()))
+                )
+            }
+            for trainer, session_function, direct_printer, framed_printer in (
+                ('sentence_translation', _sentence_translation_session, _ErasingRedoPrint, op.RedoPrint),
+                ('vocable_trainer', _vocable_trainer_session, op.UndoPrint, op.UndoPrint)
+            )
+        }
+    }
+
+    RESULTS_DIR_PATH.mkdir(exist_ok=True)
+    result_path = RESULTS_DIR_PATH / f'frame-rendering-{result["timestamp"].replace(":", "-")}.json'
+    with open(result_path, 'w') as f:
+        json.dump(result, f, indent=4)
+
+    for trainer, kind_2_metrics in result['per_item'].items():
+        print(f'{trainer}, per item:')
+        for kind, metrics in kind_2_metrics.items():
+            print(f'\t{kind:<8}{metrics["n_bytes"]:>10.0f} bytes{metrics["n_writes"]:>8.1f} writes')
+    print(f'\nStored result at {result_path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+""" Line counting micro-benchmark, comparing the time taken by a simulated
+    session of RedoPrint/UndoPrint usage whose terminal row counts are
+        - recounted from the entire buffer upon each query, as done previously
+        - maintained incrementally
+
+    Usage: python -m benchmarks.line_counting [--items N] [--buffered-items N] [--runs N] """
+
+from __future__ import annotations
+
+from contextlib import redirect_stdout
+from statistics import median
+import argparse
+import datetime
+import io
+import json
+import sys
+import time
+
+from termcolor import colored
+
+from benchmarks.startup import RESULTS_DIR_PATH
+from frontend.src.utils.output.clearing import erase_lines
+from frontend.src.utils.output._utils import _terminal_columns, display_width
+from frontend.src.utils.output.undoing import RedoPrint, UndoPrint
+
+
+class _RecountingRedoPrint(RedoPrint):
+    @property
+    def _n_buffered_terminal_rows(self) -> int:
+        return sum(map(_recounted_terminal_rows, self._buffer))
+
+    def redo_partially(self, n_deletion_rows: int):
+        erase_lines(self._n_buffered_terminal_rows)
+
+        for _ in range(n_deletion_rows):
+            self._popleft()
+
+        self.redo()
+
+
+class _RecountingUndoPrint(UndoPrint):
+    @property
+    def _n_buffered_terminal_rows(self) -> int:
+        return sum(map(_recounted_terminal_rows, self._buffer))
+
+
+def _recounted_terminal_rows(buffer_element: str) -> int:
+    rows = buffer_element.split('\n')
+    return len(rows) + sum(display_width(row) // _terminal_columns() for row in rows)
+
+
+def _session(redo_print: RedoPrint, undo_print: UndoPrint, n_items: int, n_buffered_items: int):
+    """ Sentence translation trainer alike redo printing, retaining the output of the last
+        n_buffered_items items, alongside vocable trainer alike undo printing of multiple
+        colored, partially continued rows per item """
+
+    sentence = 'Quando eravamo giovani, passavamo ogni estate al mare con i nostri nonni.'
+
+    for i in range(n_items):
+        redo_print(f'\t{sentence}')
+        redo_print(f'\t{sentence}')
+        redo_print(f'\t{colored("─────────────────", "red")}')
+        if i >= n_buffered_items:
+            redo_print.redo_partially(n_deletion_rows=3)
+
+        undo_print('\t\tgiovane = ', end='')
+        undo_print(colored('young', 'green'), end='')
+        undo_print(f' | {colored("CORRECT", "green")} | New Score: 2\n')
+        for _ in range(2):
+            undo_print(f'{sentence} - {sentence}')
+        undo_print.undo()
+
+
+def _median_duration(redo_print_type: type[RedoPrint], undo_print_type: type[UndoPrint], args: argparse.Namespace) -> float:
+    durations = []
+    for _ in range(args.runs):
+        redo_print, undo_print = redo_print_type(), undo_print_type()
+
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            _session(redo_print, undo_print, n_items=args.items, n_buffered_items=args.buffered_items)
+            durations.append(time.perf_counter() - start)
+    return median(durations)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark line counting')
+    parser.add_argument('--items', type=int, default=2_000)
+    parser.add_argument('--buffered-items', type=int, default=50)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    recounting = _median_duration(_RecountingRedoPrint, _RecountingUndoPrint, args)
+    incremental = _median_duration(RedoPrint, UndoPrint, args)
+
+    result = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'n_items': args.items,
+        'n_buffered_items': args.buffered_items,
+        'session_s': {'recounting': recounting, 'incremental': incremental}
+    }
+
+    RESULTS_DIR_PATH.mkdir(exist_ok=True)
+    result_path = RESULTS_DIR_PATH / f'line-counting-{result["timestamp"].replace(":", "-")}.json'
+    with open(result_path, 'w') as f:
+        json.dump(result, f, indent=4)
+
+    print(f'{args.items} items, {args.buffered_items} of which retained by the RedoPrint at a time:')
+    print(f'\t{"recounting":<14}{recounting * 1000:>10.1f}ms')
+    print(f'\t{"incremental":<14}{incremental * 1000:>10.1f}ms ({recounting / incremental:.1f}x)')
+    print(f'\nStored result at {result_path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
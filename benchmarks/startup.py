@@ -0,0 +1,185 @@
+""" Startup benchmark recording
+        - the per-module import cost of the modules loaded prior to the first prompt
+        - the wall time elapsed since process start up until each startup milestone,
+          i.e. imports done, State restored from the snapshot, home screen rendered, as well
+          as the database client connected in the background, by running frontend.src.__main__
+          as a logged in user against an in-memory database stand-in
+
+    Results are stored as JSON within benchmarks/results and checked against
+    the budgets denoted in benchmarks/budgets.json, the exceedance of any of
+    which results in a non-zero exit code
+
+    Usage: python -m benchmarks.startup [--runs N] [--budgets PATH] [--baseline RESULT_PATH] """
+
+from __future__ import annotations
+
+from pathlib import Path
+from statistics import median
+from typing import Iterator
+import argparse
+import datetime
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+_BENCHMARKS_DIR_PATH = Path(__file__).parent
+
+RESULTS_DIR_PATH = _BENCHMARKS_DIR_PATH / 'results'
+DEFAULT_BUDGETS_PATH = _BENCHMARKS_DIR_PATH / 'budgets.json'
+
+# modules imported by frontend.src.__main__ up until the first prompt
+_STARTUP_MODULES = (
+    'frontend.src.logged_in_user',
+    'frontend.src.model_downloads',
+    'frontend.src.screen.authentication',
+    'frontend.src.screen.home',
+    'frontend.src.state'
+)
+
+
+# ------------------
+# Import Costs
+# ------------------
+def import_costs() -> list[dict]:
+    """ Returns:
+            structured output of python -X importtime for a cold import of the startup
+            modules, sorted by self import time in descending order """
+
+    completed_process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {", ".join(_STARTUP_MODULES)}'],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return sorted(_parsed_importtime_output(completed_process.stderr), key=lambda cost: cost['self_us'], reverse=True)
+
+
+def _parsed_importtime_output(importtime_output: str) -> Iterator[dict]:
+    """ >>> list(_parsed_importtime_output('import time: self [us] | cumulative | imported package\\nimport time:       356 |        356 |   _io'))
+        [{'module': '_io', 'self_us': 356, 'cumulative_us': 356}] """
+
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        yield {'module': module.strip(), 'self_us': int(self_us), 'cumulative_us': int(cumulative_us)}
+
+
+# ------------------
+# Milestones
+# ------------------
+def milestone_times(n_runs: int) -> dict[str, float]:
+    """ Returns:
+            median wall time in seconds elapsed from process start up until
+            the respective milestone over n_runs cold starts of a logged in user,
+            within a working directory isolated from the one of actual usage """
+
+    with tempfile.TemporaryDirectory() as working_dir_path:
+        _run_milestones_script('--seed', working_dir_path=working_dir_path)
+        runs = [json.loads(_run_milestones_script(str(time.time()), working_dir_path=working_dir_path)) for _ in range(n_runs)]
+    return {milestone: median(run[milestone] for run in runs) for milestone in runs[0]}
+
+
+def _run_milestones_script(argument: str, working_dir_path: str) -> str:
+    """ Returns:
+            stdout of benchmarks._startup_milestones """
+
+    completed_process = subprocess.run(
+        [sys.executable, '-m', 'benchmarks._startup_milestones', argument],
+        cwd=working_dir_path,
+        stdin=subprocess.DEVNULL,
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [str(_BENCHMARKS_DIR_PATH.parent), os.environ.get('PYTHONPATH')]))},
+        capture_output=True,
+        text=True
+    )
+    if completed_process.returncode:
+        raise SystemExit(f'benchmarks._startup_milestones {argument} failed:\n{completed_process.stderr}')
+    return completed_process.stdout
+
+
+# ------------------
+# Budgets
+# ------------------
+def budget_exceedances(result: dict, budgets: dict) -> list[str]:
+    """ Returns:
+            descriptions of exceeded budgets
+
+        >>> budget_exceedances(
+        ...     {'milestones_s': {'state_built': 1.2}, 'import_costs': [{'module': 'a', 'self_us': 5, 'cumulative_us': 80}]},
+        ...     {'milestones_s': {'state_built': 1.0}, 'cumulative_import_us': {'a': 100}}
+        ... )
+        ['state_built: 1.200s > budget of 1.000s'] """
+
+    exceedances = []
+
+    for milestone, budget in budgets.get('milestones_s', {}).items():
+        if (elapsed := result['milestones_s'].get(milestone)) is not None and elapsed > budget:
+            exceedances.append(f'{milestone}: {elapsed:.3f}s > budget of {budget:.3f}s')
+
+    cumulative_import_us = {cost['module']: cost['cumulative_us'] for cost in result['import_costs']}
+    for module, budget in budgets.get('cumulative_import_us', {}).items():
+        if (cost := cumulative_import_us.get(module)) is not None and cost > budget:
+            exceedances.append(f'import {module}: {cost}us > budget of {budget}us')
+
+    return exceedances
+
+
+# ------------------
+# Reporting
+# ------------------
+def _report(result: dict, baseline: dict | None, n_displayed_imports=15):
+    print('Milestones:')
+    for milestone, elapsed in result['milestones_s'].items():
+        delta = ''
+        if baseline and (baseline_elapsed := baseline['milestones_s'].get(milestone)) is not None:
+            delta = f' ({elapsed - baseline_elapsed:+.3f}s)'
+        print(f'\t{milestone:<30}{elapsed:.3f}s{delta}')
+
+    print(f'\nMost expensive imports (self/cumulative):')
+    for cost in result['import_costs'][:n_displayed_imports]:
+        print(f'\t{cost["module"]:<60}{cost["self_us"]:>10}us{cost["cumulative_us"]:>12}us')
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark frontend startup')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budgets', type=Path, default=DEFAULT_BUDGETS_PATH)
+    parser.add_argument('--baseline', type=Path, help='previously stored result to be compared against')
+    args = parser.parse_args(argv)
+
+    result = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'milestones_s': milestone_times(n_runs=args.runs),
+        'import_costs': import_costs()
+    }
+
+    RESULTS_DIR_PATH.mkdir(exist_ok=True)
+    result_path = RESULTS_DIR_PATH / f'startup-{result["timestamp"].replace(":", "-")}.json'
+    with open(result_path, 'w') as f:
+        json.dump(result, f, indent=4)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    _report(result, baseline)
+    print(f'\nStored result at {result_path}')
+
+    with open(args.budgets) as f:
+        exceedances = budget_exceedances(result, budgets=json.load(f))
+
+    if exceedances:
+        print('\nBUDGETS EXCEEDED:', *exceedances, sep='\n\t')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,66 +1,67 @@
 from pathlib import Path
-import subprocess
+import logging
 
-from pymongo import errors
-from backend.src.database import connect_database_client
 from backend.src.logging import enable_backend_logging
 
-# maximize terminal window, line position not to be altered
-subprocess.run(['wmctrl', '-r', ':ACTIVE:', '-b', 'add,maximized_vert,maximized_horz'])
+from frontend.src.paths import CACHE_DIR_PATH
+from frontend.src.utils.view import terminal
+from frontend.src.utils.view.render_cache import render_cache
 
-from frontend.src import logged_in_user, screen
+# maximize terminal window
+terminal.maximize()
+
+from frontend.src import database_connection, logged_in_user, screen, state_snapshot
+from frontend.src.model_downloads import model_downloads
+from frontend.src.navigation import Navigator
 from frontend.src.state import State
 from frontend.src.reentrypoint import ReentryPoint
 
 
-def __call__():
-    """ Program entry point
+def _authenticate() -> ReentryPoint:
+    """ Triggers authentication
 
-        Triggers authentication and consecutively invokes procedure depending
-        on whether account has just been created """
+        Returns:
+            LanguageAddition in case of new user, subsequent to the display of
+            post signup information, otherwise Home """
 
     screen.authentication.__call__()
 
-    # display post signup information, reentry at language addition
-    # in case of new user, otherwise proceed directly to home screen
-    # of locally cached user
     if State.instance().is_new_user:
         screen.post_signup_information.__call__()
-        return reentry_at(reentry_point=screen.language_addition.__call__())
-    return reentry_at(reentry_point=screen.home.__call__())
-
-
-def reentry_at(reentry_point: ReentryPoint):
-    """ Central menu shifting function
-
-        Kicks off program anew from passed reentry point """
-
-    if reentry_point is ReentryPoint.Login:
-        logged_in_user.remove()
-        return __call__()
-
-    elif reentry_point is ReentryPoint.LanguageAddition:
-        return reentry_at(reentry_point=screen.language_addition.__call__())
-
-    elif reentry_point is ReentryPoint.Home:
-        return reentry_at(reentry_point=screen.home.__call__())
-
-    elif reentry_point is ReentryPoint.TrainingSelection:
-        return reentry_at(reentry_point=screen.training_selection.__call__())
-
-    elif reentry_point is ReentryPoint.Exit:
-        return screen.exit.generic.__call__()
-
+        return ReentryPoint.LanguageAddition
+    return ReentryPoint.Home
+
+
+def _login() -> ReentryPoint:
+    logged_in_user.remove()
+    state_snapshot.remove()
+    return _authenticate()
+
+
+# screens are merely imported upon their first invocation
+navigator = Navigator(
+    {
+        ReentryPoint.Login: _login,
+        ReentryPoint.LanguageAddition: lambda: screen.language_addition.__call__(),
+        ReentryPoint.Home: lambda: screen.home.__call__(),
+        ReentryPoint.TrainingSelection: lambda plot_parameters=None: screen.training_selection.__call__(plot_parameters),
+        ReentryPoint.Exit: lambda: screen.exit.generic.__call__()
+    }
+)
+# apply the user data reconciling the state snapshot at the next screen entry,
+# as to not have the background thread mutate state
+navigator.transition_listeners.append(lambda _: screen.authentication.apply_reconciled_user_data())
+navigator.transition_listeners.append(
+    lambda timing: logging.debug(f'{timing.origin.name} -> {getattr(timing.destination, "name", None)}: {timing.duration:.3f}s')
+)
 
 enable_backend_logging(file_path=Path.cwd() / 'logging.txt')
-
-# check for pymongo-related, insurmountable initialization errors,
-# invoke corresponding exit screen in case of occurrence, otherwise
-# run program
-if instantiation_error := connect_database_client(server_selection_timeout=1_500):
-    if instantiation_error is errors.ServerSelectionTimeoutError:
-        screen.exit.on_connection_error.__call__()
-    elif instantiation_error is errors.ConfigurationError:
-        screen.exit.on_missing_internet.__call__()
-else:
-    __call__()
+render_cache.persist(CACHE_DIR_PATH / 'renderings.pickle')
+
+# connect database client in the background, pymongo-related, insurmountable
+# initialization errors will invoke the corresponding exit screen as soon
+# as the database is required
+database_connection.establish_in_background()
+# resume model downloads interrupted during the previous run
+model_downloads.resume_pending()
+navigator(_authenticate())
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import wraps
+from typing import Callable, Optional, Type, TypeVar
+
+from backend.src.database import connect_database_client
+from pymongo import errors
+
+from frontend.src import screen
+
+
+SERVER_SELECTION_TIMEOUT = 1_500
+
+# single worker, such that submitted tasks are executed in order,
+# subsequent to the connection establishment
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='database')
+_pending_tasks: list[Future] = []
+
+_failure: Type[Exception] | None = None
+
+_T = TypeVar('_T')
+
+
+def establish_in_background():
+    """ Connects database client on a background thread, any failure
+        of which is merely surfaced once await_established gets invoked """
+
+    def connect():
+        global _failure
+        _failure = connect_database_client(server_selection_timeout=SERVER_SELECTION_TIMEOUT)
+
+    _pending_tasks.append(_executor.submit(connect))
+
+
+def submit(task: Callable[[], _T]) -> Future[Optional[_T]]:
+    """ Schedules task for background execution subsequent to the successful
+        establishment of the connection as well as all previously submitted tasks
+
+        Returns:
+            future of the task's result, None if the connection failed """
+
+    def run_if_connected() -> Optional[_T]:
+        if _failure is None:
+            return task()
+        return None
+
+    future = _executor.submit(run_if_connected)
+    _pending_tasks.append(future)
+    return future
+
+
+def await_established():
+    """ Blocks until the connection has been established and all submitted
+        tasks have been completed
+
+        Invokes exit screen corresponding to the encountered error and exits
+        program in case of connection failure """
+
+    global _failure
+
+    while _pending_tasks:
+        try:
+            _pending_tasks.pop(0).result()
+        except errors.PyMongoError as error:
+            _failure = _failure or type(error)
+
+    if _failure is not None:
+        _exit(failure=_failure)
+
+
+def required(function: Callable) -> Callable:
+    """ Decorator for functions relying on the database, awaiting the
+        connection establishment prior to their execution """
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        await_established()
+        return function(*args, **kwargs)
+    return wrapper
+
+
+def _exit(failure: Type[Exception]):
+    if failure is errors.ConfigurationError:
+        screen.exit.on_missing_internet.__call__()
+    else:
+        screen.exit.on_connection_error.__call__()
+    raise SystemExit(1)
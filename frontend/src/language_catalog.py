@@ -0,0 +1,187 @@
+""" Index of the languages available for addition, comprising their capability tiers
+    and formatted sentence counts, built once from the backend metadata and component
+    modules and persisted henceforth, such that the language addition screens render
+    without the TTS, spaCy and stemming modules being imported """
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+import hashlib
+import importlib.metadata
+import locale
+import pickle
+
+from frontend.src.paths import CACHE_DIR_PATH
+from frontend.src.utils.output.styling import Style, styled
+
+
+class NormalizationQuality(Enum):
+    Low = 'cyan'
+    Medium = 'magenta'
+    High = 'red'
+
+    @property
+    def color(self) -> str:
+        return self.value
+
+
+TTS_ATTRS = ('underline',)
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    language: str
+    normalization_quality: NormalizationQuality
+    tts_available: bool
+    n_sentences: Optional[int]
+    sentence_count: str
+    """ n_sentences formatted by the numeric locale, '∞' if None """
+
+    @property
+    def starting_letter(self) -> str:
+        return self.language[0]
+
+    def label(self, reference=False) -> str:
+        """ Returns:
+                language colored with respect to its capabilities, or uniformly if
+                reference, followed by its sentence count """
+
+        if reference:
+            style = Style(NormalizationQuality.High.color, attrs=TTS_ATTRS)
+        else:
+            style = Style(self.normalization_quality.color, attrs=TTS_ATTRS if self.tts_available else ())
+        return f'{styled(self.language, style)}({self.sentence_count})'
+
+
+class LanguageCatalog:
+    def __init__(self, entries: Iterable[CatalogEntry]):
+        self._language_2_entry: Dict[str, CatalogEntry] = {entry.language: entry for entry in sorted(entries, key=lambda entry: entry.language)}
+
+    @property
+    def languages(self) -> List[str]:
+        return list(self._language_2_entry)
+
+    def __getitem__(self, language: str) -> CatalogEntry:
+        return self._language_2_entry[language]
+
+    def __contains__(self, language: object) -> bool:
+        return language in self._language_2_entry
+
+    def label_rows(self, excluded_languages: Iterable[str] = (), reference=False) -> List[str]:
+        """ Returns:
+                space joined labels of the languages not contained in excluded_languages,
+                one row per starting letter """
+
+        excluded_languages = set(excluded_languages)
+        entries = (entry for entry in self._language_2_entry.values() if entry.language not in excluded_languages)
+
+        return [
+            ' '.join(entry.label(reference) for entry in letter_entries)
+            for _, letter_entries in groupby(entries, key=lambda entry: entry.starting_letter)
+        ]
+
+    # -----------------
+    # Building
+    # -----------------
+    @classmethod
+    def build(cls) -> LanguageCatalog:
+        from backend.src.components.tts import GoogleTTSClient
+        from backend.src.metadata import language_metadata
+        from backend.src.ops import spacy_models, stemming
+
+        def normalization_quality(language: str) -> NormalizationQuality:
+            if language in spacy_models.AVAILABLE_LANGUAGES:
+                return NormalizationQuality.High
+            elif language.lower() in stemming.AVAILABLE_LANGUAGES:
+                return NormalizationQuality.Medium
+            return NormalizationQuality.Low
+
+        return cls(
+            _entry(
+                language,
+                normalization_quality=normalization_quality(language),
+                tts_available=language in GoogleTTSClient.AVAILABLE_LANGUAGES,
+                n_sentences=metadata.get('nSentences')
+            )
+            for language, metadata in language_metadata.items()
+        )
+
+
+def _entry(language: str, normalization_quality: NormalizationQuality, tts_available: bool, n_sentences: Optional[int]) -> CatalogEntry:
+    return CatalogEntry(
+        language=language,
+        normalization_quality=normalization_quality,
+        tts_available=tts_available,
+        n_sentences=n_sentences,
+        sentence_count='∞' if n_sentences is None else f'{n_sentences:n}'
+    )
+
+
+# -----------------
+# Persistence
+# -----------------
+_CATALOG_FILE_PATH = CACHE_DIR_PATH / 'language-catalog.pickle'
+_FORMAT_VERSION = 3
+_BACKEND_DISTRIBUTION_NAME = 'backend'
+
+
+def _version_key() -> Hashable:
+    """ Returns:
+            key changing along with the catalog format, the numeric locale the sentence
+            counts have been formatted with, or the installed backend distribution """
+
+    return (
+        _FORMAT_VERSION,
+        locale.getlocale(locale.LC_NUMERIC),
+        _backend_distribution_key()
+    )
+
+
+def _backend_distribution_key() -> Optional[Tuple[str, str]]:
+    """ Returns:
+            version of the backend distribution alongside the digest of its record of
+            installed files, which lists the language metadata files, amongst all others,
+            with their hashes, thus changing on reinstallation of an altered backend of
+            the same version; None if the backend isn't installed as distribution """
+
+    try:
+        distribution = importlib.metadata.distribution(_BACKEND_DISTRIBUTION_NAME)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+    return distribution.version, hashlib.sha256((distribution.read_text('RECORD') or '').encode()).hexdigest()
+
+
+def load(file_path: Path = _CATALOG_FILE_PATH) -> LanguageCatalog:
+    """ Returns:
+            catalog stored at file_path if its version key hasn't changed,
+            otherwise the newly built and stored one """
+
+    version_key = _version_key()
+
+    try:
+        with open(file_path, 'rb') as f:
+            stored_version_key, catalog = pickle.load(f)
+        if stored_version_key == version_key:
+            return catalog
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        pass
+
+    catalog = LanguageCatalog.build()
+    _store(catalog, version_key, file_path)
+    return catalog
+
+
+def _store(catalog: LanguageCatalog, version_key: Hashable, file_path: Path):
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, 'wb') as f:
+        pickle.dump((version_key, catalog), f)
+
+
+@lru_cache(maxsize=1)
+def language_catalog() -> LanguageCatalog:
+    return load()
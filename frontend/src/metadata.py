@@ -1,15 +1,100 @@
-from backend.src.utils import io
-from frontend.src.paths import DATA_DIR_PATH
+""" Country metadata, loaded on first use from a marshalled cache which is rebuilt from the
+    json files whenever they have been modified, and indexed such that each lookup
+    amounts to a single dict access """
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Tuple
+import json
+import marshal
+
+from frontend.src.paths import CACHE_DIR_PATH, DATA_DIR_PATH
 
 
 COUNTRY_METADATA_PATH = DATA_DIR_PATH / 'country-metadata.json'
 MAIN_COUNTRY_DATA_PATH = DATA_DIR_PATH / 'main-countries.json'
 
-country_metadata = io.load_json(COUNTRY_METADATA_PATH)
+
+class CountryIndexes(NamedTuple):
+    country_metadata: Dict[str, Dict[str, str]]
+    flag_by_language: Dict[str, str]
+    country_by_ris_code: Dict[str, str]
+    ris_code_by_country: Dict[str, str]
 
 
 def main_country_flag(language: str) -> str:
-    return country_metadata[_main_country_data[language]]['flag']
+    return _indexes().flag_by_language[language]
+
+
+def country(ris_code: str) -> str:
+    return _indexes().country_by_ris_code[ris_code]
+
+
+def ris_code(country: str) -> str:
+    return _indexes().ris_code_by_country[country]
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'country_metadata':
+        return _indexes().country_metadata
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+# -----------------
+# Loading
+# -----------------
+_CACHE_FILE_PATH = CACHE_DIR_PATH / 'country-metadata.marshal'
+_FORMAT_VERSION = 1
+
+
+def _built(country_metadata_path: Path, main_country_data_path: Path) -> CountryIndexes:
+    with open(country_metadata_path, encoding='utf-8') as f:
+        country_metadata = json.load(f)
+    with open(main_country_data_path, encoding='utf-8') as f:
+        main_country_data = json.load(f)
+
+    return CountryIndexes(
+        country_metadata=country_metadata,
+        flag_by_language={language: country_metadata[country]['flag'] for language, country in main_country_data.items()},
+        country_by_ris_code={metadata['RIS']: country for country, metadata in country_metadata.items()},
+        ris_code_by_country={country: metadata['RIS'] for country, metadata in country_metadata.items()}
+    )
+
+
+def _version_key(*json_file_paths: Path) -> Tuple[int, ...]:
+    return (_FORMAT_VERSION, *(file_path.stat().st_mtime_ns for file_path in json_file_paths))
+
+
+def load(country_metadata_path: Path = COUNTRY_METADATA_PATH,
+         main_country_data_path: Path = MAIN_COUNTRY_DATA_PATH,
+         cache_file_path: Path = _CACHE_FILE_PATH) -> CountryIndexes:
+    """ Returns:
+            indexes stored at cache_file_path if built from the json files in their current
+            state, otherwise the newly built and stored ones """
+
+    version_key = _version_key(country_metadata_path, main_country_data_path)
+
+    try:
+        with open(cache_file_path, 'rb') as f:
+            stored_version_key, indexes = marshal.load(f)
+        if stored_version_key == version_key:
+            return CountryIndexes(*indexes)
+    except (FileNotFoundError, EOFError, ValueError, TypeError):
+        pass
+
+    indexes = _built(country_metadata_path, main_country_data_path)
+    _store(indexes, version_key, cache_file_path)
+    return indexes
+
+
+def _store(indexes: CountryIndexes, version_key: Tuple[int, ...], cache_file_path: Path):
+    cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_file_path, 'wb') as f:
+        marshal.dump((version_key, tuple(indexes)), f)
 
 
-_main_country_data = io.load_json(MAIN_COUNTRY_DATA_PATH)
+@lru_cache(maxsize=1)
+def _indexes() -> CountryIndexes:
+    return load(cache_file_path=_CACHE_FILE_PATH)
@@ -0,0 +1,240 @@
+""" Installations of spaCy language models by means of the backend's download function,
+    running in detached processes rather than blocking the language addition, such that
+    they survive the program's exit, and resumed on the next startup if having failed
+
+    Usage:
+        python -m frontend.src.model_downloads LANGUAGE
+            installs the model of language, unless installed by a concurrent process in the meantime """
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar
+import fcntl
+import http.client
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from frontend.src.paths import CACHE_DIR_PATH
+
+
+_logger = logging.getLogger(__name__)
+
+_T = TypeVar('_T')
+
+
+def _retried(function: Callable[[], _T], n_attempts: int, retry_delay: float) -> _T:
+    """ Invokes function until succeeding, at most n_attempts times, sleeping
+        for exponentially increasing durations, starting at retry_delay, in between """
+
+    for attempt in range(n_attempts):
+        try:
+            return function()
+        except (OSError, http.client.HTTPException) as e:
+            if attempt == n_attempts - 1:
+                raise
+            _logger.warning(f'Attempt {attempt + 1}/{n_attempts} failed: {e!r}')
+            time.sleep(retry_delay * 2 ** attempt)
+    raise ValueError('n_attempts has to be positive')
+
+
+# -----------------
+# Pending Languages
+# -----------------
+_DOWNLOADS_DIR_PATH = CACHE_DIR_PATH / 'models'
+
+
+@contextmanager
+def _locked(lock_file_path: Path) -> Iterator[None]:
+    """ Holds an exclusive lock on lock_file_path for the duration of the context,
+        serializing the context across processes """
+
+    lock_file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_file_path, 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+@contextmanager
+def _pending_languages(dir_path: Path) -> Iterator[List[str]]:
+    """ Yields languages whose model installation is pending, storing
+        their modification upon exiting the context """
+
+    pending_file_path = dir_path / 'pending.json'
+
+    with _locked(dir_path / '.pending.lock'):
+        try:
+            with open(pending_file_path) as f:
+                languages = json.load(f)
+        except (FileNotFoundError, ValueError):
+            languages = []
+
+        yield languages
+
+        with open(pending_file_path, 'w') as f:
+            json.dump(languages, f)
+
+
+def _add_pending(dir_path: Path, language: str):
+    with _pending_languages(dir_path) as languages:
+        if language not in languages:
+            languages.append(language)
+
+
+def _remove_pending(dir_path: Path, language: str):
+    with _pending_languages(dir_path) as languages:
+        if language in languages:
+            languages.remove(language)
+
+
+def _log_file_path(dir_path: Path, language: str) -> Path:
+    return dir_path / f'{language}.log'
+
+
+# -----------------
+# Installation Process
+# -----------------
+_REPOSITORY_ROOT_PATH = Path(__file__).parent.parent.parent
+
+
+def _download_model(language: str):
+    from backend.src.ops.spacy_models.download import download_model
+
+    _retried(lambda: download_model(language), n_attempts=5, retry_delay=1.0)
+
+
+def _install(language: str, dir_path: Path = _DOWNLOADS_DIR_PATH, download_model: Callable[[str], None] = _download_model):
+    """ Installs the model of language, unless no longer pending by the time of having
+        acquired the language's lock, as is the case if a preceding process has installed
+        it already, and removes language from the pending ones on success """
+
+    with _locked(dir_path / f'.{language}.lock'):
+        with _pending_languages(dir_path) as languages:
+            if language not in languages:
+                return
+
+        download_model(language)
+        _remove_pending(dir_path, language)
+
+
+def _installation_command(language: str) -> List[str]:
+    return [sys.executable, '-m', __name__, language]
+
+
+# -----------------
+# Model Downloads
+# -----------------
+class _Installation:
+    def __init__(self, process: subprocess.Popen):
+        self.process = process
+        self.settled = threading.Event()
+
+    @property
+    def succeeded(self) -> bool:
+        return self.settled.is_set() and self.process.returncode == 0
+
+    @property
+    def failed(self) -> bool:
+        return self.settled.is_set() and self.process.returncode != 0
+
+
+class ModelDownloads:
+    """ Runs model installations in processes of their own session, such that neither
+        quitting the program nor its terminal's hangup interrupts them, whilst recording
+        the pending ones in order for failed ones to be resumed on the next startup
+
+        Installation output is written to a log file per language, which failures refer to """
+
+    def __init__(self,
+                 dir_path: Path = _DOWNLOADS_DIR_PATH,
+                 installation_command: Callable[[str], List[str]] = _installation_command):
+
+        self._dir_path = dir_path
+        self._installation_command = installation_command
+
+        self._language_2_installation: Dict[str, _Installation] = {}
+        self._lock = threading.Lock()
+        self._pending_resumed = False
+
+    def submit(self, language: str):
+        """ Submits the installation of the model of language, unless running or completed """
+
+        with self._lock:
+            if (installation := self._language_2_installation.get(language)) is not None and not installation.failed:
+                return
+
+            _add_pending(self._dir_path, language)
+            with open(_log_file_path(self._dir_path, language), 'w') as log_file:
+                process = subprocess.Popen(
+                    self._installation_command(language),
+                    stdin=subprocess.DEVNULL,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    env={**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [str(_REPOSITORY_ROOT_PATH), os.environ.get('PYTHONPATH')]))},
+                    start_new_session=True
+                )
+            installation = self._language_2_installation[language] = _Installation(process)
+
+        # merely observes the process, which doesn't depend on it
+        threading.Thread(target=self._await, args=(language, installation), name=f'model-download-{language}', daemon=True).start()
+
+    def _await(self, language: str, installation: _Installation):
+        if installation.process.wait():
+            _logger.error(f'{language} model installation failed with exit code {installation.process.returncode}, see {_log_file_path(self._dir_path, language)}')
+        installation.settled.set()
+
+    def resume_pending(self):
+        """ Submits the installations having been pending at the last program exit,
+            merely once per program run """
+
+        if self._pending_resumed:
+            return
+        self._pending_resumed = True
+
+        with _pending_languages(self._dir_path) as languages:
+            pending_languages = list(languages)
+
+        for language in pending_languages:
+            self.submit(language)
+
+    def ready(self, language: str) -> bool:
+        """ Returns:
+                whether no installation of the model of language is running or has failed """
+
+        if (installation := self._language_2_installation.get(language)) is None:
+            return True
+        return installation.succeeded
+
+    def wait(self, language: str, timeout: Optional[float] = None) -> bool:
+        """ Returns:
+                whether the model of language is ready after having awaited its installation """
+
+        if (installation := self._language_2_installation.get(language)) is not None:
+            installation.settled.wait(timeout)
+        return self.ready(language)
+
+    def status_rows(self) -> List[str]:
+        """ Returns:
+                status row per running or failed installation """
+
+        rows = []
+        for language, installation in list(self._language_2_installation.items()):
+            if not installation.settled.is_set():
+                rows.append(f'Downloading {language} language model...')
+            elif installation.failed:
+                rows.append(f'{language} language model download failed, retrying on next startup, see {_log_file_path(self._dir_path, language)}')
+        return rows
+
+
+model_downloads = ModelDownloads()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    _install(sys.argv[1])
@@ -0,0 +1,70 @@
+""" Dispatcher shifting between the screens associated with the ReentryPoints,
+    looping over the transitions returned by the respective screens rather than
+    invoking the successive screen from within the preceding one """
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Union
+import time
+
+from frontend.src.reentrypoint import ReentryPoint
+
+
+@dataclass(frozen=True)
+class Transition:
+    """ Transition to reentry_point, whose screen is to be invoked with payload if not None """
+
+    reentry_point: ReentryPoint
+    payload: Any = None
+
+
+Screen = Callable[..., Union[ReentryPoint, Transition, None]]
+""" Returns:
+        successive ReentryPoint, optionally wrapped into a Transition carrying a payload,
+        None if terminal """
+
+
+@dataclass(frozen=True)
+class TransitionTiming:
+    origin: ReentryPoint
+    destination: ReentryPoint | None
+    duration: float
+    """ wall time in seconds spent within the origin screen """
+
+
+class Navigator:
+    def __init__(self, reentry_point_2_screen: dict[ReentryPoint, Screen], n_retained_timings=256):
+        self._reentry_point_2_screen = reentry_point_2_screen
+
+        self.timings: Deque[TransitionTiming] = deque(maxlen=n_retained_timings)
+        self.transition_listeners: list[Callable[[TransitionTiming], None]] = []
+
+    def __call__(self, reentry_point: ReentryPoint | Transition):
+        """ Invokes the screen associated with reentry_point, as well as
+            all successive ones until one of them returns None """
+
+        transition: Transition | None = reentry_point if isinstance(reentry_point, Transition) else Transition(reentry_point)
+
+        while transition is not None:
+            screen = self._reentry_point_2_screen[transition.reentry_point]
+
+            start = time.perf_counter()
+            successor = screen() if transition.payload is None else screen(transition.payload)
+            if isinstance(successor, ReentryPoint):
+                successor = Transition(successor)
+
+            self._record(
+                TransitionTiming(
+                    origin=transition.reentry_point,
+                    destination=successor.reentry_point if successor is not None else None,
+                    duration=time.perf_counter() - start
+                )
+            )
+            transition = successor
+
+    def _record(self, timing: TransitionTiming):
+        self.timings.append(timing)
+        for listener in self.transition_listeners:
+            listener(timing)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from typing import Callable, Iterator
+from functools import cached_property
+from itertools import count
+from typing import Callable
 import dataclasses
 
 from termcolor import colored
 
 from frontend.src.reentrypoint import ReentryPoint
+from frontend.src.utils import output
+from frontend.src.utils.output.percentual_indenting import column_percentual_indentation, IndentedPrint
+from frontend.src.utils.prompt.resolution import OptionResolver
 
 
 @dataclasses.dataclass
@@ -23,15 +28,27 @@ OFFSET = ' ' * 7
 
 
 class OptionCollection(dict):
+    """ Registry of options, mapping their keywords onto their callbacks
+
+        Renders its descriptions, instructions and compiles its resolver
+        merely once """
+
     def __init__(self, options: list[Option], highlight_color='red'):
         super().__init__({option.keyword: option.callback for option in options})
 
-        self.formatted_descriptions = list(
-            map(
-                lambda option: formatted_description(option, color=highlight_color),
-                options
-            )
-        )
+        self._options = options
+        self._highlight_color = highlight_color
+
+    @cached_property
+    def resolver(self) -> OptionResolver:
+        return OptionResolver(list(self))
+
+    # -----------------
+    # Rendering
+    # -----------------
+    @cached_property
+    def formatted_descriptions(self) -> list[str]:
+        return [formatted_description(option, color=self._highlight_color) for option in self._options]
 
     def as_row(self, inter_indentation=OFFSET, with_delimiter=True) -> str:
         if with_delimiter:
@@ -40,15 +57,51 @@ class OptionCollection(dict):
             inter_indentation = str().join(indentation_chars)
         return inter_indentation.join(self.formatted_descriptions)
 
+    @cached_property
+    def _instruction_rows(self) -> list[str]:
+        """ Returns:
+                aligned rows of colored keyword and description """
 
-def formatted_description(option: Option, color='red') -> str:
-    def formatted_splits(splits: list[str]) -> Iterator[str]:
-        for split in splits:
-            coloring_function = _colored_keyword if split.lower() == option.keyword else colored
-            yield coloring_function(split, color)  # type: ignore
+        return output.align(
+            [colored(option.keyword, self._highlight_color) for option in self._options],
+            [option.description for option in self._options]
+        )
+
+    def display_instructions(self, row_index_2_insertion_string: dict[int, str] | None = None):
+        if not row_index_2_insertion_string:
+            row_index_2_insertion_string = {}
+
+        _print = IndentedPrint(indentation=column_percentual_indentation(0.35))
 
-    return ' '.join(formatted_splits(splits=option.description.split(' ')))
+        _print('Enter:')
 
+        row_iterator = iter(self._instruction_rows)
+        for i in count(0, step=1):
+            if (string := row_index_2_insertion_string.get(i)) is not None:
+                output.centered(f'\n{string}\n')
+            else:
+                try:
+                    _print(f'    {next(row_iterator)}')
+                except StopIteration:
+                    break
 
-def _colored_keyword(keyword: str, color: str) -> str:
-    return '(' + colored(keyword[0], color) + ')' + colored(keyword[1:], color)
+        output.empty_row()
+
+
+def formatted_description(option: Option, color='red') -> str:
+    """ Returns:
+            description colored in its entirety, the keyword's first char being enclosed
+            in uncolored parentheses, thus comprising at most three colored runs """
+
+    style = output.Style(color)
+    description = output.StyledText()
+
+    for i, split in enumerate(option.description.split(' ')):
+        if i:
+            description.append(' ', style)
+
+        if split.lower() == option.keyword:
+            description.append('(').append(split[0], style).append(')').append(split[1:], style)
+        else:
+            description.append(split, style)
+    return str(description)
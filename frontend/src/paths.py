@@ -2,6 +2,7 @@ from pathlib import Path
 
 
 KEYS_DIR_PATH = Path().cwd() / '.keys'
+CACHE_DIR_PATH = Path().cwd() / '.cache'
 
 _PACKAGE_ROOT = Path(__file__).parent.parent
 
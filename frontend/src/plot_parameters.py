@@ -1,11 +1,17 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 import datetime
+import time
 from typing import Iterable, Iterator
 
 from backend.src.database.user_database import UserDatabase
-from backend.src.utils.date import string_2_date
 
-from frontend.src.utils.iterables import first
+from frontend.src import database_connection
+from frontend.src.state import State
+
+
+_STARTING_DATE_DELTA = 14
 
 
 @dataclass(frozen=True)
@@ -15,21 +21,14 @@ class PlotParameters:
     item_name: str
 
     @classmethod
-    @UserDatabase.receiver
-    def assemble(cls, trainer_shortform: str, item_name_plural: str, user_database: UserDatabase):
-        # query language training history of respective trainer
-        training_chronic = user_database.training_chronic_collection.training_chronic()
-        training_chronic = {
-            date: day_dict[trainer_shortform] for date, day_dict in training_chronic.items() if day_dict and day_dict.get(trainer_shortform)  # faulty None's amongst trainer dicts
-        }
+    def assemble(cls, trainer_shortform: str, item_name_plural: str):
+        windowed_training_chronic = training_chronic_window(trainer_shortform)
 
         # get plotting dates
-        STARTING_DATE_DELTA = 14
-
-        dates = list(_plotting_dates(training_dates=iter(training_chronic.keys()), starting_date_delta=STARTING_DATE_DELTA))
+        dates = list(_plotting_dates(training_dates=sorted(windowed_training_chronic.keys()), starting_date_delta=_STARTING_DATE_DELTA))
 
         # get training item sequences, conduct zero-padding on dates on which no training took place
-        sequence = [training_chronic.get(date, 0) for date in dates]
+        sequence: list[float] = [windowed_training_chronic.get(date, 0) for date in dates]
 
         return cls(sequence, dates, item_name=item_name_plural)
 
@@ -45,8 +44,114 @@ class PlotParameters:
     #     return f"{abs(yesterday_exceedance_difference)} {item_name} left to top yesterdays score"
 
 
-def _plotting_dates(training_dates: Iterable[str], starting_date_delta: int) -> Iterator[str]:
+# ------------------
+# Training Chronic Window
+# ------------------
+
+# (username, language, trainer shortform, today's date) -> window, whereby the date
+# invalidates the windows of processes running past midnight
+_ChronicWindowKey = tuple[str, str, str, str]
+
+
+@dataclass(frozen=True)
+class _ChronicWindow:
+    n_faced_items: dict[str, int]
+    """ {date: n faced items} comprising merely the dates of the plotting window on which training took place """
+    fetched_at: float
+    """ time.monotonic() upon query completion """
+
+
+_training_chronic_windows: dict[_ChronicWindowKey, _ChronicWindow] = {}
+
+
+@State.receiver
+def _chronic_window_key(trainer_shortform: str, state: State) -> _ChronicWindowKey:
+    return state.username, state.language, trainer_shortform, str(datetime.date.today())
+
+
+def training_chronic_window(trainer_shortform: str) -> dict[str, int]:
+    """ Returns:
+            {date: n faced items} of the trainer corresponding to trainer_shortform
+            for the dates of the plotting window, queried merely if not cached yet """
+
+    key = _chronic_window_key(trainer_shortform)
+    database_connection.await_established()
+
+    if (window := _training_chronic_windows.get(key)) is None:
+        window = _training_chronic_windows[key] = _fetched_chronic_window(trainer_shortform)
+    return window.n_faced_items
+
+
+def prefetch_training_chronic_window(trainer_shortform: str):
+    """ Queries training chronic window in the background if not cached yet """
+
+    key = _chronic_window_key(trainer_shortform)
+
+    def prefetch():
+        if key not in _training_chronic_windows:
+            _training_chronic_windows[key] = _fetched_chronic_window(trainer_shortform)
+
+    database_connection.submit(prefetch)
+
+
+def merge_session_into_training_chronic_window(trainer_shortform: str, n_faced_items: int, upserted_since: float):
+    """ Adds n_faced_items to today's entry of the cached training chronic window,
+        if existent and fetched prior to the session statistics upsert, having commenced
+        at upserted_since, as per time.monotonic(), sparing a database read for the post
+        session plot
+
+        Windows fetched thereafter, which may comprise the session already, are discarded
+        instead, such that they get queried anew """
+
+    database_connection.await_established()
+
+    key = _chronic_window_key(trainer_shortform)
+    if not n_faced_items or (window := _training_chronic_windows.get(key)) is None:
+        return
+
+    if window.fetched_at < upserted_since:
+        today = str(datetime.date.today())
+        window.n_faced_items[today] = window.n_faced_items.get(today, 0) + n_faced_items
+    else:
+        del _training_chronic_windows[key]
+
+
+def _fetched_chronic_window(trainer_shortform: str) -> _ChronicWindow:
+    n_faced_items = _queried_training_chronic_window(trainer_shortform, dates=_window_dates(_STARTING_DATE_DELTA))
+    return _ChronicWindow(n_faced_items, fetched_at=time.monotonic())
+
+
+@UserDatabase.receiver
+def _queried_training_chronic_window(trainer_shortform: str, dates: Iterable[str], user_database: UserDatabase) -> dict[str, int]:
+    """ Looks up dates within the training chronic rather than traversing the entirety
+        of the latter and converting each of its date strings """
+
+    training_chronic = user_database.training_chronic_collection.training_chronic()
+
+    return {
+        date: n_faced_items for date in dates
+        if (day_dict := training_chronic.get(date)) and (n_faced_items := day_dict.get(trainer_shortform))  # faulty None's amongst trainer dicts
+    }
+
+
+def _window_dates(starting_date_delta: int) -> list[str]:
     """ Returns:
+            dates from (todays date - starting_date_delta) up to todays date
+
+        >>> len(_window_dates(14))
+        15
+        >>> _window_dates(14)[-1] == str(datetime.date.today())
+        True """
+
+    today = datetime.date.today()
+    return [str(today - datetime.timedelta(days=delta)) for delta in range(starting_date_delta, -1, -1)]
+
+
+def _plotting_dates(training_dates: Iterable[str], starting_date_delta: int) -> Iterator[str]:
+    """ Args:
+            training_dates: ISO formatted, sorted in ascending order
+
+        Returns:
             continuous sequences of plotting dates to be seized as x-axis ticks
             starting from earliest day with (todays date - respective date) <= starting_date_delta,
             going up to todays date
@@ -74,11 +179,12 @@ def _plotting_dates(training_dates: Iterable[str], starting_date_delta: int) ->
 def _get_starting_date(training_dates: Iterable[str], day_delta: int) -> datetime.date:
     """ Returns:
             earliest date comprised within training_dates for which (todays date - respective date) <= starting_date_delta
-            holds true """
+            holds true, todays date if there's none
+
+        Compares the ISO formatted dates lexicographically, sparing their conversion """
 
-    earliest_possible_date: datetime.date = (datetime.date.today() - datetime.timedelta(days=day_delta))
+    earliest_possible_date = str(datetime.date.today() - datetime.timedelta(days=day_delta))
 
-    return first(
-        map(string_2_date, training_dates),
-        key=lambda date: date >= earliest_possible_date
+    return datetime.date.fromisoformat(
+        next((date for date in training_dates if date >= earliest_possible_date), str(datetime.date.today()))
     )
@@ -1,9 +1,31 @@
-from . import (
-    authentication,
-    home,
-    training_selection,
-    post_signup_information,
-    language_addition,
-    exit,
-    account_deletion
+from typing import TYPE_CHECKING
+
+from frontend.src.utils.lazy_importing import submodule_getattr
+
+if TYPE_CHECKING:
+    from frontend.src.screen import (
+        account_deletion,
+        authentication,
+        exit,
+        home,
+        language_addition,
+        post_signup_information,
+        training_selection
+    )
+
+
+# import screen modules on their first access only, such that the dependencies
+# of screens entered post authentication, i.a. the trainer frontends alongside
+# their backends, aren't loaded before they're actually required
+__getattr__ = submodule_getattr(
+    __name__,
+    submodule_names=[
+        'authentication',
+        'home',
+        'training_selection',
+        'post_signup_information',
+        'language_addition',
+        'exit',
+        'account_deletion'
+    ]
 )
@@ -4,11 +4,12 @@ from frontend.src.state import State
 from frontend.src.utils import prompt, output
 from frontend.src.utils import view
 from frontend.src.reentrypoint import ReentryPoint
-from frontend.src import logged_in_user
+from frontend.src import database_connection, logged_in_user, state_snapshot
 from frontend.src.utils.prompt.repetition import prompt_relentlessly
 from frontend.src.utils.view import Banner
 
 
+@database_connection.required
 @view.creator(banner=Banner('lingularity/impossible', 'yellow'))
 @State.receiver
 def __call__(state: State) -> ReentryPoint:
@@ -18,5 +19,6 @@ def __call__(state: State) -> ReentryPoint:
     if prompt_relentlessly('', indentation_percentage=0.5, options=prompt.YES_NO_OPTIONS) == 'yes':
         CredentialsDatabase.instance().remove_user(state.username)
         logged_in_user.remove()
+        state_snapshot.remove()
         return ReentryPoint.Exit
     return ReentryPoint.Home
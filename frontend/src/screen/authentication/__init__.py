@@ -1,21 +1,43 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from functools import partial
+from typing import Optional
+
 from backend.src.database.user_database import UserDatabase
 
-from frontend.src import logged_in_user
-from frontend.src.state import State
+from frontend.src import database_connection, logged_in_user, state_snapshot
+from frontend.src.state import State, UserData
 from frontend.src.screen.authentication import landing as front_screen
 
 
+_reconciled_user_data: Future[Optional[UserData]] | None = None
+
+
 def __call__():
     """ Attempts to retrieve locally cashed user,
         if unfeasible proceeds to front screen into
         either log in/sign up
 
-        Inserts user, is_new_user flag into State, mongodb client """
+        Inserts user, is_new_user flag into State, mongodb client
+
+        Restores State from the snapshot of the locally cached user if
+        available, in which case the database connection is awaited merely
+        by the first action relying on it, and the user data reconciling the
+        snapshot with the database prefetched in the background """
+
+    global _reconciled_user_data
 
     is_new_user = False
 
     # try to retrieve logged in user from disk
-    if (username := logged_in_user.retrieve()) is None:
+    if (username := logged_in_user.retrieve()) is not None and state_snapshot.restore(username) is not None:
+        _reconciled_user_data = database_connection.submit(partial(_prefetched_user_data, username))
+        return
+
+    database_connection.await_established()
+
+    if username is None:
         username, is_new_user = front_screen.__call__()
 
         # store username in encrypted manner
@@ -25,3 +47,26 @@ def __call__():
 
     UserDatabase(username, language=str())
     State(username, is_new_user=is_new_user)
+    state_snapshot.store()
+
+
+def _prefetched_user_data(username: str) -> UserData:
+    UserDatabase(username, language=str())
+    return UserData.prefetch()
+
+
+@State.receiver
+def apply_reconciled_user_data(state: State):
+    """ Updates state by the user data prefetched in the background, as well as the
+        snapshot, if available; to be invoked on the main thread, which is the only
+        one to read and mutate state """
+
+    global _reconciled_user_data
+
+    if _reconciled_user_data is None or not _reconciled_user_data.done():
+        return
+
+    reconciled_user_data, _reconciled_user_data = _reconciled_user_data, None
+    if reconciled_user_data.exception() is None and (user_data := reconciled_user_data.result()) is not None:
+        state.update(user_data)
+        state_snapshot.store()
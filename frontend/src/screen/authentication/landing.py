@@ -1,30 +1,47 @@
+from __future__ import annotations
+
 from frontend.src.option import Option, OptionCollection
 from frontend.src.screen.authentication import login, sign_up
 from frontend.src.screen.authentication._utils import authentication_screen
 from frontend.src.utils import output, view
 from frontend.src.utils.prompt.repetition import prompt_relentlessly
 from frontend.src.utils.view import Banner
+from frontend.src.utils.view.render_cache import render_cache
 from frontend.src.utils.view.terminal import DEFAULT_TERMINAL_TITLE
 
 
-@view.creator(title=DEFAULT_TERMINAL_TITLE, banner=Banner('lingularity/5line-oblique', 'blue'))
-@authentication_screen
+_OPTIONS = OptionCollection(
+    [
+        Option('Log In', callback=login.__call__),
+        Option('Sign Up', callback=sign_up.__call__)
+    ]
+)
+
+
 def __call__() -> tuple[str, bool]:
-    """ Returns:
+    """ Redisplays landing screen until successful authentication
+
+        Returns:
             username: str,
             is_new_user_flag: bool """
 
-    options = OptionCollection(
-        [
-            Option('Log In', callback=login.__call__),
-            Option('Sign Up', callback=sign_up.__call__)
-        ]
-    )
+    while (authentication_result := _authentication_attempt()) is None:
+        continue
+    return authentication_result
+
+
+@view.creator(title=DEFAULT_TERMINAL_TITLE, banner=Banner('lingularity/5line-oblique', 'blue'))
+@authentication_screen
+def _authentication_attempt() -> tuple[str, bool] | None:
+    """ Returns:
+            authentication result of selected option, None if cancelled """
+
+    _display_options()
 
-    output.centered(options.as_row(inter_indentation=output.column_percentual_indentation(0.08)), '\n')
+    selection = prompt_relentlessly('', indentation_percentage=0.49, options=_OPTIONS.resolver)
+    return _OPTIONS[selection].__call__()
 
-    selection = prompt_relentlessly('', indentation_percentage=0.49, options=list(options))
 
-    if authentication_result := options[selection].__call__():
-        return authentication_result
-    return __call__()
+@render_cache.static
+def _display_options():
+    output.centered(_OPTIONS.as_row(inter_indentation=output.column_percentual_indentation(0.08)), '\n')
@@ -1,5 +1,16 @@
-from . import (
-    on_connection_error,
-    on_missing_internet,
-    generic
+from typing import TYPE_CHECKING
+
+from frontend.src.utils.lazy_importing import submodule_getattr
+
+if TYPE_CHECKING:
+    from frontend.src.screen.exit import generic, on_connection_error, on_missing_internet
+
+
+__getattr__ = submodule_getattr(
+    __name__,
+    submodule_names=[
+        'on_connection_error',
+        'on_missing_internet',
+        'generic'
+    ]
 )
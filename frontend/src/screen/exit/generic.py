@@ -5,6 +5,7 @@ from termcolor import colored
 
 from frontend.src.utils import output, view
 from frontend.src.utils.view import Banner, terminal
+from frontend.src.utils.view.render_cache import render_cache
 
 
 def _day_of_the_month() -> int:
@@ -15,6 +16,7 @@ def _day_of_the_month() -> int:
     title=terminal.DEFAULT_TERMINAL_TITLE,
     banner=Banner(random.choice(['lingularity/slant-relief', 'lingularity/sub-zero']), 'cyan')
 )
+@render_cache.static
 def __call__():
     display_signum()
     display_sentence_data_reference()
@@ -1,11 +1,13 @@
 from frontend.src.screen.exit._utils import error_exit_screen
 from frontend.src.utils import output, view
 from frontend.src.utils.view import Banner, terminal
+from frontend.src.utils.view.render_cache import render_cache
 
 
 @view.creator(title=terminal.DEFAULT_TERMINAL_TITLE, banner=Banner('lingularity/ticks-slant', 'blue'), vertical_offsets=2)
 @output.cursor_hider
 @error_exit_screen
+@render_cache.static
 def __call__():
     output.centered('Lingularity relies on an internet connection in order to retrieve and store data.')
     output.centered('Please establish one and restart the program.')
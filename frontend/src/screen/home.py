@@ -1,8 +1,10 @@
+from functools import lru_cache
+
 from backend.src.database.user_database import UserDatabase
 from backend.src.string_resources import string_resources
 from termcolor import colored
 
-from frontend.src import option
+from frontend.src import database_connection, option, state_snapshot
 from frontend.src.option import Option, OptionCollection
 from frontend.src.reentrypoint import ReentryPoint
 from frontend.src.screen import account_deletion
@@ -11,6 +13,7 @@ from frontend.src.utils import output, prompt, view
 from frontend.src.utils.prompt._ops import indicate_erroneous_input
 from frontend.src.utils.prompt.cancelling import QUERY_CANCELLED
 from frontend.src.utils.prompt.repetition import prompt_relentlessly
+from frontend.src.utils.prompt.resolution import OptionResolver
 from frontend.src.utils.view import Banner, terminal
 
 
@@ -29,7 +32,15 @@ def __call__() -> ReentryPoint:
                 all of which are denoted in _OPTION_2_REENTRY_POINT and _OPTION_2_REENTRY_POINT_PROVIDER,
                 ReentryPoint.TrainingSelection in case of language selection """
 
-    options = OptionCollection(
+    options = _options()
+
+    _render_screen(options)
+    return _proceed(options)
+
+
+@lru_cache(maxsize=None)
+def _options() -> OptionCollection:
+    return OptionCollection(
         [
             Option('Add language', ReentryPoint.LanguageAddition),
             Option('Remove language', _language_removal),
@@ -41,9 +52,6 @@ def __call__() -> ReentryPoint:
         ]
     )
 
-    _render_screen(options)
-    return _proceed(options)
-
 
 @State.receiver
 def _render_screen(options: OptionCollection, state: State):
@@ -70,7 +78,7 @@ def _proceed(options: OptionCollection, state: State) -> ReentryPoint:
     selection = prompt_relentlessly(
         prompt='Select Language/Option: ',
         indentation_percentage=0.35,
-        options=list(state.user_languages) + list(options)
+        options=OptionResolver(list(state.user_languages) + list(options))
     )
 
     if (callback := options.get(selection)) is not None:
@@ -80,24 +88,39 @@ def _proceed(options: OptionCollection, state: State) -> ReentryPoint:
 
     # query reference language in case of English being selected
     if train_english := selection == string_resources['english']:
-        user_database: UserDatabase = UserDatabase.instance()
-
-        selection = user_database.language_metadata_collection.query_reference_language()
-        user_database.language_metadata_collection.set_reference_language(reference_language=selection)
+        selection = _reference_language()
 
     # write selected language into state
     state.set_language(non_english_language=selection, train_english=train_english)
+    state_snapshot.store()
 
     return ReentryPoint.TrainingSelection
 
 
+@State.receiver
+def _reference_language(state: State) -> str:
+    """ Returns:
+            prefetched reference language if available, otherwise queried one """
+
+    if (reference_language := state.reference_language) is None:
+        database_connection.await_established()
+        reference_language = state.reference_language = UserDatabase.instance().language_metadata_collection.query_reference_language()
+
+    database_connection.submit(
+        lambda: UserDatabase.instance().language_metadata_collection.set_reference_language(reference_language=reference_language)
+    )
+    return reference_language
+
+
+@database_connection.required
 @State.receiver
 def _language_removal(state: State) -> ReentryPoint:
     """ Queries language whose user wishes to erase from his profile with confirmation query,
         thereupon removes language from user languages stored in State, respective user data
         from database if applicable
 
-        Invokes home screen afterwards """
+        Returns:
+            ReentryPoint.Home """
 
     # erase everything until before option row
     output.erase_lines(3)
@@ -106,7 +129,7 @@ def _language_removal(state: State) -> ReentryPoint:
     # exit in case of nonexistence of removable languages
     if not len(state.user_languages):
         indicate_erroneous_input('THERE ARE NO LANGUAGES TO BE REMOVED', sleep_duration=1.5)
-        return __call__()
+        return ReentryPoint.Home
 
     # query removal language
     if (removal_language := prompt_relentlessly(
@@ -115,7 +138,7 @@ def _language_removal(state: State) -> ReentryPoint:
             options=list(state.user_languages),
             cancelable=True
     )) == QUERY_CANCELLED:
-        return __call__()
+        return ReentryPoint.Home
 
     output.erase_lines(1)
 
@@ -127,5 +150,7 @@ def _language_removal(state: State) -> ReentryPoint:
     if prompt_relentlessly('', indentation_percentage=0.5, options=prompt.YES_NO_OPTIONS) == 'yes':
         UserDatabase.instance().remove_language_related_documents()
         state.user_languages.remove(removal_language)
+        state.vocabulary_possessing_languages.discard(removal_language)
+        state_snapshot.store()
 
-    return __call__()
\ No newline at end of file
+    return ReentryPoint.Home
\ No newline at end of file
@@ -1,14 +1,12 @@
 import locale
 from typing import List
 
-from backend.src.components.tts import GoogleTTSClient
 from backend.src.database.user_database import UserDatabase
-from backend.src.metadata import language_metadata
-from backend.src.ops import spacy_models, stemming
-from backend.src.ops.spacy_models.download import download_model
 from backend.src.string_resources import string_resources
-from termcolor import colored
 
+from frontend.src import database_connection, state_snapshot
+from frontend.src.language_catalog import language_catalog, NormalizationQuality, TTS_ATTRS
+from frontend.src.model_downloads import model_downloads
 from frontend.src.reentrypoint import ReentryPoint
 from frontend.src.state import State
 from frontend.src.utils import output, view
@@ -22,6 +20,7 @@ from frontend.src.utils.view import Banner, terminal
 locale.setlocale(locale.LC_ALL, str())
 
 
+@database_connection.required
 @view.creator(banner=Banner('languages/3d-ascii', 'cyan'))
 @State.receiver
 def __call__(state: State) -> ReentryPoint:
@@ -29,33 +28,29 @@ def __call__(state: State) -> ReentryPoint:
         tts/tokenization availability in block indented manner, writes selected
         language into global state """
 
-    eligible_languages = list(set(language_metadata.keys()) - state.user_languages)
+    eligible_languages = [language for language in language_catalog().languages if language not in state.user_languages]
 
-    _render_screen(eligible_languages, state)
+    _render_screen(state)
     return _proceed(eligible_languages)
 
 
-def _render_screen(eligible_languages: list[str], state: State):
+def _render_screen(state: State):
     terminal.set_title(['Add a new language', "Select a language you'd like to learn"][state.is_new_user])
 
-    # group by starting letter, highlight_color languages according to tts/tokenizing availability,
-    # display in output-block-indented manner
-    starting_letter_grouped_languages = output.group_by_starting_letter(eligible_languages, is_sorted=False)
-    colored_joined_language_groups = [
-        ' '.join(map(lambda language: f'{_color_language_wrt_available_components(language)}({language_metadata[language].get("nSentences", -69):n})'.replace('-69', '∞'), language_group)) for
-        language_group in starting_letter_grouped_languages]
-    _display_eligible_languages(colored_joined_language_groups)
+    # display labels colored in regard to tts/tokenizing availability,
+    # grouped by starting letter, in output-block-indented manner
+    _display_eligible_languages(language_catalog().label_rows(excluded_languages=state.user_languages))
 
     # display legend
     legend_section_indentation = output.column_percentual_indentation(0.02)
 
     output.centered(
         f'Legend:{legend_section_indentation}'
-        f'{colored("low", _LOW_QUALITY_NORMALIZATION_COLOR)}/'
-        f'{colored("medium", _MEDIUM_QUALITY_NORMALIZATION_COLOR)}/'
-        f'{colored("high", _HIGH_QUALITY_NORMALIZATION_COLOR)} '
+        f'{output.styled("low", output.Style(NormalizationQuality.Low.color))}/'
+        f'{output.styled("medium", output.Style(NormalizationQuality.Medium.color))}/'
+        f'{output.styled("high", output.Style(NormalizationQuality.High.color))} '
         f'quality word normalization{legend_section_indentation}'
-        f'{colored("text-to-speech available", attrs=_TTS_ATTRS)}{legend_section_indentation}'
+        f'{output.styled("text-to-speech available", output.Style(attrs=TTS_ATTRS))}{legend_section_indentation}'
         f'(number of available sentences)',
         end=view.VERTICAL_OFFSET
     )
@@ -68,28 +63,6 @@ def _display_eligible_languages(grouped_eligible_languages: List[str]):
     output.empty_row()
 
 
-_HIGH_QUALITY_NORMALIZATION_COLOR = 'red'
-_MEDIUM_QUALITY_NORMALIZATION_COLOR = 'magenta'
-_LOW_QUALITY_NORMALIZATION_COLOR = 'cyan'
-_TTS_ATTRS = ['underline']
-
-
-def _color_language_wrt_available_components(language: str) -> str:
-    color, attrs = None, None
-
-    if language in GoogleTTSClient.AVAILABLE_LANGUAGES:
-        attrs = _TTS_ATTRS
-
-    if language in spacy_models.AVAILABLE_LANGUAGES:
-        color = _HIGH_QUALITY_NORMALIZATION_COLOR
-    elif language.lower() in stemming.AVAILABLE_LANGUAGES:
-        color = _MEDIUM_QUALITY_NORMALIZATION_COLOR
-    else:
-        color = _LOW_QUALITY_NORMALIZATION_COLOR
-
-    return colored(language, color=color, attrs=attrs)
-
-
 @State.receiver
 @UserDatabase.receiver
 def _proceed(eligible_languages: list[str], state: State, user_database: UserDatabase) -> ReentryPoint:
@@ -104,8 +77,8 @@ def _proceed(eligible_languages: list[str], state: State, user_database: UserDat
 
     user_database.training_chronic_collection.upsert_language_placeholder_document(language=selection)
 
-    if selection in spacy_models.AVAILABLE_LANGUAGES:
-        download_model(selection)
+    if language_catalog()[selection].normalization_quality is NormalizationQuality.High:
+        model_downloads.submit(selection)
 
     # query desired reference language if English selected
     if selection == string_resources['english']:
@@ -113,6 +86,7 @@ def _proceed(eligible_languages: list[str], state: State, user_database: UserDat
 
     # write language selection into state
     state.set_language(non_english_language=selection, train_english=False)
+    state_snapshot.store()
     return ReentryPoint.TrainingSelection
 
 
@@ -120,12 +94,9 @@ def _proceed(eligible_languages: list[str], state: State, user_database: UserDat
 @State.receiver
 @UserDatabase.receiver
 def _reference_language_selection_screen(state: State, user_database: UserDatabase) -> ReentryPoint:
-    eligible_languages = list(set(language_metadata.keys()) - {string_resources.ENGLISH})
-    starting_letter_grouped_languages = output.group_by_starting_letter(eligible_languages, is_sorted=False)
+    eligible_languages = [language for language in language_catalog().languages if language != string_resources.ENGLISH]
     _display_eligible_languages(
-        grouped_eligible_languages=[
-            ' '.join(map(lambda language: f'{colored(language, _HIGH_QUALITY_NORMALIZATION_COLOR, attrs=_TTS_ATTRS)}({language_metadata[language]["nSentences"]:n})', language_group)) for
-            language_group in starting_letter_grouped_languages]
+        grouped_eligible_languages=language_catalog().label_rows(excluded_languages={string_resources.ENGLISH}, reference=True)
     )
 
     # query desired language
@@ -139,5 +110,7 @@ def _reference_language_selection_screen(state: State, user_database: UserDataba
         return ReentryPoint.LanguageAddition
 
     user_database.language_metadata_collection.set_reference_language(reference_language=selection)
+    state.reference_language = selection
     state.set_language(non_english_language=selection, train_english=True)
+    state_snapshot.store()
     return ReentryPoint.TrainingSelection
\ No newline at end of file
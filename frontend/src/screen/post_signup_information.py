@@ -2,6 +2,7 @@ from frontend.src.utils import output, prompt
 from frontend.src.utils import view
 from frontend.src.utils.output.percentual_indenting import IndentedPrint
 from frontend.src.utils.view import Banner
+from frontend.src.utils.view.render_cache import render_cache
 
 
 @view.creator(
@@ -10,6 +11,14 @@ from frontend.src.utils.view import Banner
     additional_vertical_offset=output.row_percentual_indentation(0.15)
 )
 def __call__():
+    _display_information()
+
+    output.centered('HIT ENTER TO PROCEED')
+    prompt.centered()
+
+
+@render_cache.static
+def _display_information():
     INFORMATION_BLOCK = ("All requested inputs may be entered in lowercase, as well as merely",
                          "up to a point allowing for an unambiguous identification of the ",
                          "intended choice amongst the respectively eligible options.",
@@ -20,6 +29,3 @@ def __call__():
     for row in INFORMATION_BLOCK:
         _print(row)
     print(view.VERTICAL_OFFSET)
-
-    output.centered('HIT ENTER TO PROCEED')
-    prompt.centered()
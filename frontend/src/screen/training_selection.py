@@ -1,27 +1,36 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import random
+from typing import TYPE_CHECKING
 
 import asciiplot
-from backend.src.database.user_database import UserDatabase
 from backend.src.metadata import language_metadata
 
+from frontend.src import database_connection
+from frontend.src.model_downloads import model_downloads
+from frontend.src.navigation import Transition
 from frontend.src.reentrypoint import ReentryPoint
 from frontend.src.option import Option, OptionCollection
 from frontend.src.state import State
-from frontend.src.trainer_frontends.sentence_translation import SentenceTranslationTrainerFrontend
 from frontend.src.plot_parameters import PlotParameters
-from frontend.src.trainer_frontends.trainer_frontend import TrainerFrontend
-from frontend.src.trainer_frontends.vocable_adder import VocableAdderFrontend
-from frontend.src.trainer_frontends.vocable_trainer import VocableTrainerFrontend
 from frontend.src.utils import output, view
+from frontend.src.utils.lazy_importing import deferred
 from frontend.src.utils.prompt.cancelling import QUERY_CANCELLED
 from frontend.src.utils.prompt.repetition import prompt_relentlessly
 from frontend.src.utils.view import Banner
 
+if TYPE_CHECKING:
+    from frontend.src.trainer_frontends.trainer_frontend import TrainerFrontend
 
+
+@database_connection.required
 @view.creator(banner=Banner('lingularity/3d-ascii', 'green'), title='Training Selection')
-def __call__(training_item_sequence_plot_data: PlotParameters | None = None) -> ReentryPoint:
+def __call__(training_item_sequence_plot_data: PlotParameters | None = None) -> ReentryPoint | Transition:
+    """ Returns:
+            Transition to training selection, carrying the plot parameters of the
+            training item sequence, subsequent to a training session """
+
     options = _get_options()
 
     _render_screen(training_item_sequence_plot_data, options)
@@ -29,7 +38,7 @@ def __call__(training_item_sequence_plot_data: PlotParameters | None = None) ->
     # query desired action
     if (action_selection_keyword := prompt_relentlessly(
             prompt=output.centering_indentation(' '),
-            options=list(options),
+            options=options.resolver,
             cancelable=True
         )
     ) == QUERY_CANCELLED:
@@ -37,22 +46,56 @@ def __call__(training_item_sequence_plot_data: PlotParameters | None = None) ->
 
     callback = options[action_selection_keyword]
 
-    # instantiate frontend if selected
     if isinstance(callback, ReentryPoint):
         return callback
-    assert issubclass(callback, TrainerFrontend)
-    trainer_frontend = callback()
-    return __call__(training_item_sequence_plot_data=trainer_frontend())
 
+    # import selected frontend, whilst awaiting the language model if pending, and instantiate it
+    trainer_frontend_type: type[TrainerFrontend] = callback()
+    if not _language_model_installed(State.instance().non_english_language):
+        return ReentryPoint.TrainingSelection
+
+    trainer_frontend = trainer_frontend_type()
+    return Transition(ReentryPoint.TrainingSelection, payload=trainer_frontend())
+
+
+def _language_model_installed(language: str) -> bool:
+    """ Awaits the installation of the model of language if running, retrying it once if having failed
+
+        Returns:
+            whether installed, the failure being displayed on the reentered screen otherwise """
+
+    if model_downloads.ready(language):
+        return True
+
+    output.centered(f'Awaiting {language} language model download...')
+    if model_downloads.wait(language):
+        return True
+
+    model_downloads.submit(language)
+    return model_downloads.wait(language)
 
-@UserDatabase.receiver
-def _get_options(user_database: UserDatabase) -> OptionCollection:
-    options = [Option('Translate Sentences', callback=SentenceTranslationTrainerFrontend, keyword='sentences')]
 
-    if user_database.language in user_database.vocabulary_collection.vocabulary_possessing_languages():
-        options.append(Option('Train Vocabulary', callback=VocableTrainerFrontend, keyword='vocabulary'))
+# trainer frontends, alongside their backends, are merely imported on selection
+_TRAINER_FRONTENDS_PACKAGE = 'frontend.src.trainer_frontends'
 
-    options.append(Option('Add Vocabulary', callback=VocableAdderFrontend))
+_sentence_translation_trainer_frontend = deferred(f'{_TRAINER_FRONTENDS_PACKAGE}.sentence_translation', 'SentenceTranslationTrainerFrontend')
+_vocable_trainer_frontend = deferred(f'{_TRAINER_FRONTENDS_PACKAGE}.vocable_trainer', 'VocableTrainerFrontend')
+_vocable_adder_frontend = deferred(f'{_TRAINER_FRONTENDS_PACKAGE}.vocable_adder', 'VocableAdderFrontend')
+
+
+@State.receiver
+def _get_options(state: State) -> OptionCollection:
+    return _options(vocabulary_trainable=state.language in state.vocabulary_possessing_languages)
+
+
+@lru_cache(maxsize=None)
+def _options(vocabulary_trainable: bool) -> OptionCollection:
+    options = [Option('Translate Sentences', callback=_sentence_translation_trainer_frontend, keyword='sentences')]
+
+    if vocabulary_trainable:
+        options.append(Option('Train Vocabulary', callback=_vocable_trainer_frontend, keyword='vocabulary'))
+
+    options.append(Option('Add Vocabulary', callback=_vocable_adder_frontend))
     options.append(Option('Home Screen', callback=ReentryPoint.Home))
 
     return OptionCollection(options)
@@ -65,6 +108,9 @@ def _render_screen(training_item_sequence_plot_data: PlotParameters | None, opti
     else:
         _display_whats_up(username=state.username, language=state.language)
 
+    for status_row in model_downloads.status_rows():
+        output.centered(status_row)
+
     output.centered(options.as_row(), '\n')
 
 
@@ -1,27 +1,73 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
 from backend.src.database.user_database import UserDatabase
 from backend.src.string_resources import string_resources
 from monostate import MonoState
 
 
+@dataclass(frozen=True)
+class UserData:
+    """ Integral per-user data, being required by the screens following
+        the authentication """
+
+    languages: set[str]
+    vocabulary_possessing_languages: set[str]
+    reference_language: str | None
+
+    @classmethod
+    @UserDatabase.receiver
+    def prefetch(cls, user_database: UserDatabase) -> UserData:
+        """ Issues the per-user database reads concurrently, rather than
+            sequentially on the respective screens' entry """
+
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix='prefetch') as executor:
+            languages = executor.submit(user_database.training_chronic_collection.comprised_languages)
+            vocabulary_possessing_languages = executor.submit(user_database.vocabulary_collection.vocabulary_possessing_languages)
+            reference_language = executor.submit(user_database.language_metadata_collection.query_reference_language)
+
+        return cls(
+            languages=set(languages.result()),
+            vocabulary_possessing_languages=set(vocabulary_possessing_languages.result()),
+            reference_language=reference_language.result() or None
+        )
+
+
 class State(MonoState):
     """ Global state persisting throughout program runtime, carrying entirety
         of integral user data required by a multitude of components
         and thus allowing for prevention of redundant database queries """
 
-    @UserDatabase.receiver
-    def __init__(self, username: str, is_new_user: bool, user_database: UserDatabase):
+    def __init__(self, username: str, is_new_user: bool, user_data: UserData | None = None):
+        """ Args:
+                user_data: to be passed if already known, e.g. from a state snapshot,
+                    will be prefetched from the database otherwise """
+
         super().__init__()
 
         self.username = username
         self.is_new_user = is_new_user
 
-        self.user_languages: set[str] = user_database.training_chronic_collection.comprised_languages()
-
         self._language: str = None  # type: ignore
 
         self.non_english_language: str = None  # type: ignore
         self.train_english: bool = None  # type: ignore
 
+        self.user_languages: set[str] = set()
+        self.vocabulary_possessing_languages: set[str] = set()
+        self.reference_language: str | None = None
+
+        self.update(user_data or UserData.prefetch())
+
+    def update(self, user_data: UserData):
+        """ Overwrites user data, retaining the current language """
+
+        self.user_languages = user_data.languages | ({self._language} if self._language else set())
+        self.vocabulary_possessing_languages = user_data.vocabulary_possessing_languages
+        self.reference_language = user_data.reference_language
+
     @property
     def language(self) -> str:
         return self._language
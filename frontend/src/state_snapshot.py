@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import Optional
+import json
+
+from cryptography.fernet import InvalidToken
+
+from frontend.src.paths import CACHE_DIR_PATH
+from frontend.src.state import State, UserData
+from frontend.src.utils import fernet
+
+
+_snapshot_fp = CACHE_DIR_PATH / 'state'
+
+
+@State.receiver
+def store(state: State):
+    """ Stores encrypted snapshot of the user data held by state, enabling
+        the display of the home screen on the next startup prior to the
+        establishment of the database connection """
+
+    CACHE_DIR_PATH.mkdir(exist_ok=True)
+
+    # write to a temporary file replacing the snapshot thereupon, such that
+    # a concurrently restoring process never reads a partially written one
+    temporary_fp = _snapshot_fp.with_name(f'{_snapshot_fp.name}.tmp')
+    with open(temporary_fp, 'wb') as f:
+        f.write(
+            fernet.encrypt(
+                json.dumps(
+                    {
+                        'username': state.username,
+                        'user_languages': sorted(state.user_languages),
+                        'vocabulary_possessing_languages': sorted(state.vocabulary_possessing_languages),
+                        'reference_language': state.reference_language,
+                        'non_english_language': state.non_english_language,
+                        'train_english': state.train_english
+                    }
+                )
+            )
+        )
+    temporary_fp.replace(_snapshot_fp)
+
+
+def restore(username: str) -> Optional[State]:
+    """ Instantiates State from the stored snapshot
+
+        Returns:
+            None if there's no snapshot stored for username """
+
+    try:
+        with open(_snapshot_fp, 'rb') as f:
+            snapshot = json.loads(fernet.decrypt(f.read()))
+    except (FileNotFoundError, InvalidToken, ValueError):
+        return None
+
+    if snapshot['username'] != username:
+        return None
+
+    state = State(
+        username,
+        is_new_user=False,
+        user_data=UserData(
+            languages=set(snapshot['user_languages']),
+            vocabulary_possessing_languages=set(snapshot.get('vocabulary_possessing_languages', [])),
+            reference_language=snapshot.get('reference_language')
+        )
+    )
+    if snapshot['non_english_language'] is not None:
+        state.set_language(snapshot['non_english_language'], train_english=snapshot['train_english'])
+    return state
+
+
+def remove():
+    _snapshot_fp.unlink(missing_ok=True)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Generic, Optional, TypeVar
+
+
+_Item = TypeVar('_Item')
+_Resolution = TypeVar('_Resolution')
+
+
+class LookaheadPrefetcher(Generic[_Item, _Resolution]):
+    """ Retrieves items from item_provider up to lookahead items ahead of their
+        consumption, resolving each of them by means of resolve on a worker thread,
+        such that the resolution is ready by the time it's needed
+
+        >>> prefetcher = LookaheadPrefetcher(iter([1, 2, 3]).__next__, resolve=lambda item: item * 2, lookahead=2)
+        >>> item, resolution = prefetcher.get()
+        >>> item, prefetcher.result(resolution)
+        (1, 2)
+        >>> len(prefetcher._upcoming)
+        2
+        >>> [prefetcher.get()[0] for _ in range(2)], prefetcher.get()
+        ([2, 3], None)
+        >>> prefetcher.close() """
+
+    def __init__(self,
+                 item_provider: Callable[[], Optional[_Item]],
+                 resolve: Callable[[_Item], _Resolution],
+                 lookahead: int = 3,
+                 n_workers: int = 1):
+
+        """ Args:
+                item_provider: returning None, or raising StopIteration, once depleted
+                lookahead: number of items to be resolved in advance
+                n_workers: number of resolving threads """
+
+        self._item_provider = item_provider
+        self._resolve = resolve
+        self.lookahead = lookahead
+
+        self._executor = ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix='lookahead-prefetcher')
+        self._upcoming: deque[tuple[_Item, Future[_Resolution]]] = deque()
+        self._depleted = False
+
+        self.n_hits = 0
+        self.n_misses = 0
+
+    @property
+    def hit_rate(self) -> float | None:
+        """ Share of resolutions having been completed by the time they were requested """
+
+        if not (n_requested := self.n_hits + self.n_misses):
+            return None
+        return self.n_hits / n_requested
+
+    def get(self) -> tuple[_Item, Future[_Resolution]] | None:
+        """ Returns:
+                next item alongside the future of its resolution, None if depleted """
+
+        self._replenish(n_items=1)
+        if not self._upcoming:
+            return None
+
+        upcoming = self._upcoming.popleft()
+        self._replenish(n_items=self.lookahead)
+        return upcoming
+
+    def result(self, resolution: Future[_Resolution]) -> _Resolution:
+        """ Awaits resolution if not done yet, records hit/miss """
+
+        if resolution.done():
+            self.n_hits += 1
+        else:
+            self.n_misses += 1
+        return resolution.result()
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _replenish(self, n_items: int):
+        while not self._depleted and len(self._upcoming) < n_items:
+            try:
+                item = self._item_provider()
+            except StopIteration:
+                item = None
+
+            if item is None:
+                self._depleted = True
+            else:
+                self._upcoming.append((item, self._executor.submit(self._resolve, item)))
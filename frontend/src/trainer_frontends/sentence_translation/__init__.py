@@ -1,26 +1,36 @@
 from __future__ import annotations
 
+from collections import deque
+import logging
 import time
 
 from backend.src.trainers.sentence_translation import SentenceTranslationTrainerBackend
 from cursor import cursor
-from pynput.keyboard import Controller as Keyboard
 import stringcase
 from termcolor import colored
 
 from frontend.src.plot_parameters import PlotParameters
 from frontend.src.trainer_frontends.sentence_translation.modes import get_sentence_filter, MODE_2_EXPLANATION, SentenceFilterMode
 from frontend.src.trainer_frontends.sentence_translation.screens import mode_selection, tts_accent_selection
+from frontend.src.trainer_frontends.sentence_translation.tts_audio_cache import TTSAudioCache
+from frontend.src.trainer_frontends.sentence_translation.tts_prefetching import tts_audio_prefetcher, TTSAudioPrefetcher
 from frontend.src.trainer_frontends.trainer_frontend import TrainerFrontend
 from frontend.src.utils import output, output as op, prompt, view
 from frontend.src.utils.prompt.cancelling import QUERY_CANCELLED
 from frontend.src.utils.prompt.repetition import prompt_relentlessly
 
 
+_logger = logging.getLogger(__name__)
+
+
 _SENTENCE_INDENTATION = op.column_percentual_indentation(0.15)
 
+SentencePair = list[str]
+
 
 class SentenceTranslationTrainerFrontend(TrainerFrontend[SentenceTranslationTrainerBackend]):
+    TTS_AUDIO_CACHE_MAX_BYTES = 256 * 2 ** 20
+
     def __init__(self):
         super().__init__(
             backend_type=SentenceTranslationTrainerBackend,
@@ -39,17 +49,33 @@ class SentenceTranslationTrainerFrontend(TrainerFrontend[SentenceTranslationTrai
         self._current_translation = str()
         self._redo_print = op.RedoPrint()
 
+        self._upcoming_sentence_pairs: deque[SentencePair] = deque()
+        self._item_iterator_depleted = False
+        self._tts_audio_prefetcher: TTSAudioPrefetcher | None = None
+
     def __call__(self) -> PlotParameters:
         self._set_terminal_title()
+        self._prefetch_training_item_sequence_plot_data()
 
         self._set_tts_accent_if_applicable()
 
         self._set_training_mode()
         self._backend.set_item_iterator()
 
+        if self._backend.tts_available:
+            self._tts_audio_prefetcher = tts_audio_prefetcher(
+                self._backend.tts,
+                create_cache=lambda: TTSAudioCache(max_bytes=self.TTS_AUDIO_CACHE_MAX_BYTES)
+            )
+
         self._display_training_screen_header_section()
         self._training_loop()
 
+        if self._tts_audio_prefetcher is not None:
+            self._tts_audio_prefetcher.close()
+            if (cache := self._tts_audio_prefetcher.cache) is not None and cache.hit_rate is not None:
+                _logger.info(cache.report())
+
         self._upsert_session_statistics()
 
         return self._training_item_sequence_plot_data()
@@ -109,52 +135,53 @@ class SentenceTranslationTrainerFrontend(TrainerFrontend[SentenceTranslationTrai
 
     @op.cursor_hider
     def _training_loop(self):
-        if translation := self._process_procured_sentence_pair():
-            self._current_translation = translation
+        super()._training_loop()
 
-            if self._backend.tts_available and not self._backend.tts.audio_available:
-                self._backend.tts.download_audio(translation)
+    def _procured_training_item(self) -> str | None:
+        return self._process_procured_sentence_pair()
 
-            # get response, run selected option if applicable
-            if self._inquire_option_selection() and self._quit_training:
-                return
+    def _train_item(self, translation: str):
+        self._current_translation = translation
+        self._prefetch_tts_audio()
 
-            # ----ENTER-STROKE----
+        # get response, run selected option if applicable
+        if self._inquire_option_selection() and self._quit_training:
+            return
 
-            # erase pending... + entered option identifier
-            op.erase_lines(2)
+        # ----ENTER-STROKE----
 
-            # output translation_field
-            self._redo_print(f'{_SENTENCE_INDENTATION}{translation}')
-            self._redo_print(f'{_SENTENCE_INDENTATION}{colored("─────────────────", "red")}')
+        # erase pending... + entered option identifier
+        op.erase_lines(2)
 
-            # play tts audio if available, otherwise suspend program
-            # for some time to encourage gleaning over translation_field
-            if self._backend.tts_available and self._backend.tts.enabled and self._backend.tts.audio_available:
-                self._backend.tts.play_audio()
-            else:
-                time.sleep(len(translation) * 0.05)
+        # output translation_field
+        self._redo_print(f'{_SENTENCE_INDENTATION}{translation}')
+        self._redo_print(f'{_SENTENCE_INDENTATION}{colored("─────────────────", "red")}')
 
-            self._n_trained_items += 1
+        # play tts audio if available, otherwise suspend program
+        # for some time to encourage gleaning over translation_field
+        op.flush()
+        if self._tts_enabled:
+            self._tts_audio_prefetcher.play(translation)  # type: ignore
+        else:
+            time.sleep(len(translation) * 0.05)
 
-            if self._n_trained_items >= 5:
-                self._redo_print.redo_partially(n_deletion_rows=3)
+        self._n_trained_items += 1
 
-            return self._training_loop()
+    def _post_item(self):
+        if self._n_trained_items >= 5:
+            self._redo_print.redo_partially(n_deletion_rows=3)
 
+    def _on_training_items_depleted(self):
         print('\nSentence data depleted')
 
     def _process_procured_sentence_pair(self) -> str | None:
         """ Returns:
                 translation_field of procured sentence pair, None in case of depleted item iterator """
 
-        if (sentence_pair := self._backend.get_training_item()) is None:
+        if (sentence_pair := self._procured_sentence_pair()) is None:
             return None
 
-        # try to convert forenames, output reference language sentence
-        if self._backend.forename_converter is not None:
-            sentence_pair = self._backend.forename_converter(sentence_pair)
-
+        # output reference language sentence
         reference_sentence, translation = sentence_pair
 
         self._redo_print(f'{_SENTENCE_INDENTATION}{reference_sentence}')
@@ -162,12 +189,55 @@ class SentenceTranslationTrainerFrontend(TrainerFrontend[SentenceTranslationTrai
 
         return translation
 
+    def _procured_sentence_pair(self) -> SentencePair | None:
+        """ Returns:
+                next sentence pair with converted forenames if feasible,
+                None in case of depleted item iterator
+
+            Buffers as many upcoming sentence pairs as the tts audio prefetcher
+            is to synthesize in advance """
+
+        self._buffer_upcoming_sentence_pairs(n=1)
+        if not self._upcoming_sentence_pairs:
+            return None
+
+        sentence_pair = self._upcoming_sentence_pairs.popleft()
+        self._buffer_upcoming_sentence_pairs(n=self._tts_audio_prefetcher.lookahead if self._tts_enabled else 0)  # type: ignore
+        return sentence_pair
+
+    def _buffer_upcoming_sentence_pairs(self, n: int):
+        while not self._item_iterator_depleted and len(self._upcoming_sentence_pairs) < n:
+            if (sentence_pair := self._backend.get_training_item()) is None:
+                self._item_iterator_depleted = True
+                break
+
+            # try to convert forenames
+            if self._backend.forename_converter is not None:
+                sentence_pair = self._backend.forename_converter(sentence_pair)
+            self._upcoming_sentence_pairs.append(sentence_pair)
+
+    # -----------------
+    # .TTS
+    # -----------------
+    @property
+    def _tts_enabled(self) -> bool:
+        return self._tts_audio_prefetcher is not None and self._backend.tts.enabled
+
+    def _prefetch_tts_audio(self):
+        """ Prefetches audio of current, upcoming translations if tts enabled """
+
+        if self._tts_enabled:
+            self._tts_audio_prefetcher.prefetch(  # type: ignore
+                [self._current_translation] + [translation for _, translation in self._upcoming_sentence_pairs]
+            )
+
     @staticmethod
     def _pending_output():
         print(colored(f"{_SENTENCE_INDENTATION}pending... ", "cyan", attrs=['dark']))
 
     def _enable_tts(self):
         self._backend.tts.enabled = True
+        self._prefetch_tts_audio()
         output.erase_lines(1)
 
     def _disable_tts(self):
@@ -177,12 +247,12 @@ class SentenceTranslationTrainerFrontend(TrainerFrontend[SentenceTranslationTrai
     def _change_playback_speed(self):
         def display_prompt():
             print(f'Playback speed:\n{prompt.PROMPT_INDENTATION}', end='')
-            Keyboard().type(str(self._backend.tts.playback_speed))
             cursor.show()
 
         altered_playback_speed = prompt_relentlessly(
             prompt=str(),
             prompt_display_function=display_prompt,
+            prefill=str(self._backend.tts.playback_speed),
             applicability_verifier=self._backend.tts.is_valid_playback_speed,
             error_indication_message='PLAYBACK SPEED HAS TO LIE BETWEEN 0.5 AND 2',
             cancelable=True,
@@ -200,11 +270,14 @@ class SentenceTranslationTrainerFrontend(TrainerFrontend[SentenceTranslationTrai
 
     def _change_accent(self):
         self._set_tts_accent_if_applicable()
-
-        if self._backend.tts.audio_available:
-            self._backend.tts.download_audio(self._current_translation)
+        self._invalidate_prefetched_tts_audio()
 
         # redo previous output
         self._display_training_screen_header_section()
         self._redo_print.redo()
-        self._pending_output()
\ No newline at end of file
+        self._pending_output()
+
+    def _invalidate_prefetched_tts_audio(self):
+        if self._tts_audio_prefetcher is not None:
+            self._tts_audio_prefetcher.invalidate()
+            self._prefetch_tts_audio()
\ No newline at end of file
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, TYPE_CHECKING
+import fcntl
+import hashlib
+import os
+import tempfile
+
+from frontend.src.paths import CACHE_DIR_PATH
+
+if TYPE_CHECKING:
+    from frontend.src.trainer_frontends.sentence_translation.tts_prefetching import SynthesizingTTSClient
+
+
+_AUDIO_FILE_SUFFIX = '.mp3'
+
+
+class TTSAudioCache:
+    """ Persistent, content-addressed store of synthesized audio, keyed by the hash
+        of (text, language, accent) and bounded to max_bytes by evicting the least
+        recently used audio files
+
+        Safe to be used by multiple processes simultaneously, as audio files are
+        written atomically and evictions serialized by means of a lock file """
+
+    _EVICTION_TARGET_RATIO = 0.9
+
+    def __init__(self, dir_path: Path = CACHE_DIR_PATH / 'tts', max_bytes: int = 256 * 2 ** 20):
+        self._dir_path = dir_path
+        self._dir_path.mkdir(parents=True, exist_ok=True)
+
+        self._max_bytes = max_bytes
+        self._approximate_size = sum(size for _, size, _ in self._audio_files())
+
+        self.n_hits = 0
+        self.n_misses = 0
+        self.n_saved_bytes = 0
+
+    @staticmethod
+    def key(text: str, language: str, accent: str | None) -> str:
+        """ >>> key = TTSAudioCache.key('Ciao', 'Italian', None)
+            >>> key == TTSAudioCache.key('Ciao', 'Italian', None), key == TTSAudioCache.key('Ciao', 'Italian', 'Swiss')
+            (True, False) """
+
+        return hashlib.sha256('\0'.join([text, language, accent or '']).encode()).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            with open(self._file_path(key), 'rb') as f:
+                audio = f.read()
+        except FileNotFoundError:
+            self.n_misses += 1
+            return None
+
+        # mark as recently used
+        try:
+            os.utime(self._file_path(key))
+        except FileNotFoundError:  # evicted by another process in the meantime
+            pass
+
+        self.n_hits += 1
+        self.n_saved_bytes += len(audio)
+        return audio
+
+    def put(self, key: str, audio: bytes):
+        # write to temporary file first, such that concurrent readers never encounter partial audio
+        file_descriptor, temporary_file_path = tempfile.mkstemp(dir=self._dir_path, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'wb') as f:
+            f.write(audio)
+        os.replace(temporary_file_path, self._file_path(key))
+
+        self._approximate_size += len(audio)
+        if self._approximate_size > self._max_bytes:
+            self._evict()
+
+    @property
+    def hit_rate(self) -> float | None:
+        if not (n_requests := self.n_hits + self.n_misses):
+            return None
+        return self.n_hits / n_requests
+
+    def report(self) -> str:
+        return (
+            f'TTS audio cache: {self.n_hits} hits, {self.n_misses} misses, '
+            f'hit rate {self.hit_rate or 0:.0%}, {self.n_saved_bytes / 2 ** 20:.2f} MiB saved'
+        )
+
+    def _evict(self):
+        """ Removes least recently used audio files until the total size
+            falls below the eviction target """
+
+        with open(self._dir_path / '.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            audio_files = sorted(self._audio_files(), key=lambda audio_file: audio_file[2])
+            size = sum(size for _, size, _ in audio_files)
+
+            for file_path, file_size, _ in audio_files:
+                if size <= self._max_bytes * self._EVICTION_TARGET_RATIO:
+                    break
+
+                file_path.unlink(missing_ok=True)
+                size -= file_size
+
+            self._approximate_size = size
+
+    def _audio_files(self) -> Iterator[tuple[Path, int, float]]:
+        """ Returns:
+                Iterator of (file path, size, last usage time) """
+
+        for entry in os.scandir(self._dir_path):
+            if entry.name.endswith(_AUDIO_FILE_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                yield Path(entry.path), stat.st_size, stat.st_mtime
+
+    def _file_path(self, key: str) -> Path:
+        return self._dir_path / f'{key}{_AUDIO_FILE_SUFFIX}'
+
+
+class CachingTTSClient:
+    """ Wraps tts, serving audio previously synthesized for the same
+        text, language and accent from cache """
+
+    def __init__(self, tts: SynthesizingTTSClient, cache: TTSAudioCache):
+        self._tts = tts
+        self.cache = cache
+
+    @property
+    def language(self) -> str:
+        return self._tts.language
+
+    @property
+    def accent(self) -> str | None:
+        return self._tts.accent
+
+    def synthesize(self, text: str) -> bytes:
+        key = self.cache.key(text, language=self._tts.language, accent=self._tts.accent)
+
+        if (audio := self.cache.get(key)) is None:
+            audio = self._tts.synthesize(text)
+            self.cache.put(key, audio)
+        return audio
+
+    def play(self, audio: bytes):
+        self._tts.play(audio)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from math import ceil
+from typing import Any, Callable, Protocol, Sequence, runtime_checkable
+import time
+
+from frontend.src.trainer_frontends.sentence_translation.tts_audio_cache import CachingTTSClient, TTSAudioCache
+
+
+@runtime_checkable
+class SynthesizingTTSClient(Protocol):
+    """ TTS client synthesizing audio in a stateless manner, w.r.t. its
+        accent at the time of synthesis, and applying its playback speed
+        at the time of playback """
+
+    @property
+    def language(self) -> str:
+        ...
+
+    @property
+    def accent(self) -> str | None:
+        ...
+
+    def synthesize(self, text: str) -> bytes:
+        ...
+
+    def play(self, audio: bytes):
+        ...
+
+
+class TTSAudioPrefetcher(ABC):
+    """ Interface of classes synthesizing the audio of texts prior to their playback
+
+        Counts playbacks whose audio was ready by the time of their request as hits """
+
+    def __init__(self):
+        self.n_hits = 0
+        self.n_misses = 0
+        self.cache: TTSAudioCache | None = None
+
+    @property
+    @abstractmethod
+    def lookahead(self) -> int:
+        """ Number of texts succeeding the current one to be passed to prefetch """
+
+    @abstractmethod
+    def prefetch(self, texts: Sequence[str]):
+        """ Args:
+                texts: current text, followed by up to lookahead upcoming ones """
+
+    @abstractmethod
+    def play(self, text: str):
+        """ Plays audio of text, synthesizing it if not prefetched """
+
+    @abstractmethod
+    def invalidate(self):
+        """ Discards prefetched audio, to be invoked on change of accent """
+
+    def close(self):
+        pass
+
+    def _record(self, audio: Future[Any]):
+        if audio.done():
+            self.n_hits += 1
+        else:
+            self.n_misses += 1
+
+
+class PipelinedTTSAudioPrefetcher(TTSAudioPrefetcher):
+    """ Synthesizes the audio of upcoming texts on a small thread pool,
+        adapting the lookahead to the ratio of the measured synthesis
+        latency to the interval between the end of a playback and the
+        request of the next one """
+
+    _SMOOTHING_FACTOR = 0.3
+
+    def __init__(self, tts: SynthesizingTTSClient, n_workers: int = 2, max_lookahead: int = 6):
+        super().__init__()
+
+        self._tts = tts
+        self._max_lookahead = max_lookahead
+
+        self._executor = ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix='tts-prefetcher')
+        self._text_2_audio: dict[str, Future[bytes]] = {}
+
+        self._mean_synthesis_latency: float | None = None
+        self._mean_playback_interval: float | None = None
+        self._latest_playback_time: float | None = None
+
+    @property
+    def lookahead(self) -> int:
+        """ Number of syntheses to be in flight, such that each is done by the
+            time of its playback, at least 1, at most max_lookahead
+
+            >>> prefetcher = PipelinedTTSAudioPrefetcher(tts=None)  # type: ignore
+            >>> prefetcher._mean_synthesis_latency, prefetcher._mean_playback_interval = 2.5, 1.0
+            >>> prefetcher.lookahead
+            3 """
+
+        if not (self._mean_synthesis_latency and self._mean_playback_interval):
+            return 1
+        return max(1, min(ceil(self._mean_synthesis_latency / self._mean_playback_interval), self._max_lookahead))
+
+    def prefetch(self, texts: Sequence[str]):
+        # discard audio prefetched for texts that have been skipped, thus bounding
+        # the number of held syntheses to the size of texts
+        for text in self._text_2_audio.keys() - set(texts):
+            self._text_2_audio.pop(text).cancel()
+
+        for text in texts:
+            if text not in self._text_2_audio:
+                self._text_2_audio[text] = self._executor.submit(self._timed_synthesis, text)
+
+    def play(self, text: str):
+        self._update_playback_interval()
+
+        if (audio := self._text_2_audio.pop(text, None)) is None:
+            audio = self._executor.submit(self._timed_synthesis, text)
+
+        self._record(audio)
+        self._tts.play(audio.result())
+        self._latest_playback_time = time.perf_counter()
+
+    def invalidate(self):
+        for audio in self._text_2_audio.values():
+            audio.cancel()
+        self._text_2_audio.clear()
+
+    def close(self):
+        self.invalidate()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _timed_synthesis(self, text: str) -> bytes:
+        start = time.perf_counter()
+        audio = self._tts.synthesize(text)
+        self._mean_synthesis_latency = _smoothed(self._mean_synthesis_latency, time.perf_counter() - start, self._SMOOTHING_FACTOR)
+        return audio
+
+    def _update_playback_interval(self):
+        if self._latest_playback_time is not None:
+            self._mean_playback_interval = _smoothed(self._mean_playback_interval, time.perf_counter() - self._latest_playback_time, self._SMOOTHING_FACTOR)
+
+
+class SingleSlotTTSAudioPrefetcher(TTSAudioPrefetcher):
+    """ For TTS clients merely capable of holding the audio of a single text
+        at a time, i.e. exposing download_audio/play_audio
+
+        Downloads audio of the current text in the background, thus overlapping
+        its synthesis with the user's response rather than preceding it """
+
+    def __init__(self, tts):
+        super().__init__()
+
+        self._tts = tts
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tts-prefetcher')
+        self._text: str | None = None
+        self._download: Future[None] | None = None
+
+    @property
+    def lookahead(self) -> int:
+        return 0
+
+    def prefetch(self, texts: Sequence[str]):
+        if texts and texts[0] != self._text:
+            self._submit_download(texts[0])
+
+    def play(self, text: str):
+        if text != self._text or self._download is None:
+            self._submit_download(text)
+
+        assert self._download is not None
+        self._record(self._download)
+        self._download.result()
+
+        self._tts.play_audio()
+        self._text = self._download = None
+
+    def invalidate(self):
+        if self._text is not None:
+            self._submit_download(self._text)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit_download(self, text: str):
+        # await pending download, the client's audio slot being shared
+        if self._download is not None:
+            self._download.result()
+
+        self._text = text
+        self._download = self._executor.submit(self._tts.download_audio, text)
+
+
+def tts_audio_prefetcher(tts, create_cache: Callable[[], TTSAudioCache] | None = None) -> TTSAudioPrefetcher:
+    """ Args:
+            create_cache: returning the cache to serve previously synthesized audio from,
+                invoked unless tts is a single slot client, which the cache is inapplicable to """
+
+    if not isinstance(tts, SynthesizingTTSClient):
+        return SingleSlotTTSAudioPrefetcher(tts)
+
+    if create_cache is None:
+        return PipelinedTTSAudioPrefetcher(tts)
+
+    prefetcher = PipelinedTTSAudioPrefetcher(CachingTTSClient(tts, cache := create_cache()))
+    prefetcher.cache = cache
+    return prefetcher
+
+
+def _smoothed(mean: float | None, value: float, smoothing_factor: float) -> float:
+    """ Returns:
+            exponential moving average
+
+        >>> _smoothed(None, 2.0, 0.5), _smoothed(1.0, 2.0, 0.5)
+        (2.0, 1.5) """
+
+    if mean is None:
+        return value
+    return (1 - smoothing_factor) * mean + smoothing_factor * value
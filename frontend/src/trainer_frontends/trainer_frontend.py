@@ -1,22 +1,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from time import sleep
+from time import monotonic, sleep
 
-from typing import Callable, Generic, Type, TypeVar
+from typing import Any, Callable, Generic, Type, TypeVar
 
 from backend.src.database.user_database import UserDatabase
 from backend.src.metadata import language_metadata
 from backend.src.trainers.trainer_backend import TrainerBackend
 from backend.src.types.vocable_entry import VocableEntry
-from pynput.keyboard import Controller as KeyboardController
 
+from frontend.src.option import Option, OptionCollection
 from frontend.src.state import State
-from frontend.src.trainer_frontends.option_collection import OptionCollection
+from frontend.src.trainer_frontends.vocabulary_write_queue import vocabulary_write_queue
+from frontend.src import plot_parameters, state_snapshot
 from frontend.src.plot_parameters import PlotParameters
 from frontend.src.utils import output, view
 from frontend.src.utils.prompt.cancelling import QUERY_CANCELLED
+from frontend.src.utils.prompt.input_reader import input_reader
 from frontend.src.utils.prompt.repetition import prompt_relentlessly
+from frontend.src.utils.prompt.resolution import OptionResolver
 from frontend.src.utils.view import terminal
 
 
@@ -36,9 +39,12 @@ class TrainerFrontend(ABC, Generic[_Backend]):
                  state: State,
                  option_keyword_2_instruction_and_function: OptionKeyword2InstructionAndFunction | None = None):
 
+        # let backend retrieve vocabulary subsequent to the execution of pending writes
+        vocabulary_write_queue.flush()
         self._backend: _Backend = backend_type(state.non_english_language, state.train_english)
 
         self._options: OptionCollection = self._assemble_options_collection(option_keyword_2_instruction_and_function)
+        self._option_resolver = OptionResolver(list(self._options) + [str()])
 
         self._n_trained_items: int = 0
         self._latest_created_vocable_entry: VocableEntry | None = None
@@ -56,17 +62,25 @@ class TrainerFrontend(ABC, Generic[_Backend]):
 
     @UserDatabase.receiver
     def _upsert_session_statistics(self, user_database: UserDatabase):
+        upserted_since = monotonic()
         user_database.training_chronic_collection.upsert_session_statistics(
             self._shortform,
             n_faced_items=self._n_trained_items
         )
+        plot_parameters.merge_session_into_training_chronic_window(
+            self._shortform,
+            n_faced_items=self._n_trained_items,
+            upserted_since=upserted_since
+        )
 
     def _assemble_options_collection(self, keyword_2_instruction_and_function: OptionKeyword2InstructionAndFunction | None) -> OptionCollection:
+        keyword_2_instruction_and_callback = {
+            'quit': ('Quit and return to training selection screen', self._quit),
+            'add': (f'Add a new vocable to your {State.instance().language} list', self._add_vocable)
+        } | (keyword_2_instruction_and_function or {})
+
         return OptionCollection(
-            {
-                'quit': ('Quit and return to training selection screen', self._quit),
-                'add': (f'Add a new vocable to your {State.instance().language} list', self._add_vocable)
-            } | (keyword_2_instruction_and_function or {})
+            [Option(instruction, callback=callback, keyword=keyword) for keyword, (instruction, callback) in keyword_2_instruction_and_callback.items()]
         )
 
     # -----------------
@@ -95,15 +109,53 @@ class TrainerFrontend(ABC, Generic[_Backend]):
     # -----------------
     # Training
     # -----------------
-    @abstractmethod
+    @output.framed
     def _training_loop(self):
+        """ Drives the training session item by item, until either the items
+            are depleted or the training has been quit
+
+            Iterates rather than recurses, such that sessions are of unbounded
+            length and the locals of bygone items are freed right away
+
+            Output is composed in frames, written at once upon each input query """
+
+        while True:
+            self._pre_item()
+
+            if (item := self._procured_training_item()) is None:
+                self._on_training_items_depleted()
+                return
+
+            self._train_item(item)
+            if self._quit_training:
+                return
+
+            self._post_item()
+
+    def _pre_item(self):
+        """ Invoked prior to the procurement of each item """
+
+    @abstractmethod
+    def _procured_training_item(self) -> Any | None:
+        """ Returns:
+                next item to be trained, None if depleted """
+
+    @abstractmethod
+    def _train_item(self, item: Any):
+        """ Presents item, evaluates the user's response and inquires option selection """
+
+    def _post_item(self):
+        """ Invoked subsequent to the training of each item, unless the training has been quit """
+
+    def _on_training_items_depleted(self):
         pass
 
     def _inquire_option_selection(self, indentation_percentage=0.0) -> bool:
         response = prompt_relentlessly(
             '$',
             indentation_percentage=indentation_percentage,
-            options=list(self._options.keys()) + [str()]
+            options=self._option_resolver,
+            single_key=True
         )
 
         try:
@@ -112,8 +164,7 @@ class TrainerFrontend(ABC, Generic[_Backend]):
         except KeyError:
             return False
 
-    @UserDatabase.receiver
-    def _add_vocable(self, user_database: UserDatabase, cancelable=False) -> bool:
+    def _add_vocable(self, cancelable=False) -> bool:
         """ Query, create new vocable entry,
             Enter it into database
             Update State.vocabulary_available
@@ -138,13 +189,14 @@ class TrainerFrontend(ABC, Generic[_Backend]):
 
         # create new vocable entry, enter into database
         self._latest_created_vocable_entry = VocableEntry.new(*entry_fields)
-        user_database.vocabulary_collection.upsert_entry(self._latest_created_vocable_entry)
+        vocabulary_write_queue.upsert_entry(self._latest_created_vocable_entry)
+        State.instance().vocabulary_possessing_languages.add(State.instance().language)
+        state_snapshot.store()
 
         output.erase_lines(3)
         return False
 
-    @UserDatabase.receiver
-    def _alter_vocable_entry(self, vocable_entry: VocableEntry, user_database: UserDatabase) -> int:
+    def _alter_vocable_entry(self, vocable_entry: VocableEntry) -> int:
         """ Returns:
                 number of printed lines: int """
 
@@ -152,16 +204,16 @@ class TrainerFrontend(ABC, Generic[_Backend]):
         old_line_repr = str(vocable_entry)
         old_vocable = vocable_entry.vocable
 
-        # type indented old representation
-        KeyboardController().type(f'{output.centering_indentation(old_line_repr)}{old_line_repr}')
-        # TODO: debug print(centering_indentation) into KeyboardController().type(old_line_repr)
-
-        # get new components, i.e. vocable + ground_truth
-        new_entry_components = input('').split(' - ')
+        # get new components, i.e. vocable + ground_truth, from the editable, indented old representation
+        new_entry_components = input_reader.read_line(
+            prompt=output.centering_indentation(old_line_repr),
+            prefill=old_line_repr
+        ).split(' - ')  # type: ignore
 
         # exit in case of invalid alteration
         if len(new_entry_components) != 2:
             output.centered('INVALID ALTERATION')
+            output.flush()
             sleep(1)
             return 3
 
@@ -171,12 +223,19 @@ class TrainerFrontend(ABC, Generic[_Backend]):
 
         # insert altered entry into database in case of alteration actually having taken place
         if str(vocable_entry) != old_line_repr:
-            user_database.vocabulary_collection.alter_entry(old_vocable, vocable_entry)
+            vocabulary_write_queue.alter_entry(old_vocable, vocable_entry)
 
         return 2
 
     def _quit(self):
         self._quit_training = True
+        vocabulary_write_queue.flush()
+
+    def _prefetch_training_item_sequence_plot_data(self):
+        """ To be invoked at session start, such that the post session plot
+            data is readily available """
+
+        plot_parameters.prefetch_training_chronic_window(self._shortform)
 
     def _training_item_sequence_plot_data(self) -> PlotParameters:
         return PlotParameters.assemble(
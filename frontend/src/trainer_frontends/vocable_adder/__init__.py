@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 from backend.src.trainers import VocableAdderBackend
+from backend.src.types.vocable_entry import VocableEntry
 from termcolor import colored
 
 from frontend.src.trainer_frontends.trainer_frontend import TrainerFrontend
@@ -27,19 +30,20 @@ class VocableAdderFrontend(TrainerFrontend):
         self._options.display_instructions()
         output.empty_row()
 
-    def _training_loop(self):
+    def _pre_item(self):
         output.empty_row()
 
+    def _procured_training_item(self) -> VocableEntry | None:
         if self._add_vocable(cancelable=True):
-            return
+            return None
+        return self._latest_created_vocable_entry
 
+    def _train_item(self, item: VocableEntry):
         self._output_vocable_addition_confirmation()
+        self._inquire_option_selection(indentation_percentage=0.49)
 
-        if self._inquire_option_selection(indentation_percentage=0.49) and self._quit_training:
-            return
-
+    def _post_item(self):
         output.erase_lines(2)
-        return self._training_loop()
 
     def _output_vocable_addition_confirmation(self):
         output.centered(f'{colored("Added", color="cyan")} {str(self._latest_created_vocable_entry)}')
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
+
 from backend.src.database.user_database import UserDatabase
 from backend.src.trainers.vocable_trainer import (
     VocableTrainerBackend
@@ -15,12 +17,32 @@ from backend.src.utils.strings.extraction import longest_common_prefix
 from backend.src.utils.strings.splitting import split_at_uppercase
 from termcolor import colored
 
+from frontend.src import state_snapshot
+from frontend.src.state import State
+from frontend.src.trainer_frontends.lookahead_prefetcher import LookaheadPrefetcher
 from frontend.src.trainer_frontends.trainer_frontend import PlotParameters, TrainerFrontend
+from frontend.src.trainer_frontends.vocabulary_write_queue import vocabulary_write_queue
 from frontend.src.utils import output, output as op, prompt, view
+from frontend.src.utils.prompt.input_reader import input_reader
 from frontend.src.utils.prompt.repetition import prompt_relentlessly
 
 
+SentencePair = list[str]
+
+_EVALUATION_2_COLOR = {
+    ResponseEvaluation.Wrong: 'red',
+    ResponseEvaluation.AccentError: 'yellow',
+    ResponseEvaluation.AlmostCorrect: 'yellow',
+    ResponseEvaluation.WrongArticle: 'cyan',
+    ResponseEvaluation.MissingArticle: 'cyan',
+    ResponseEvaluation.Correct: 'green'
+}
+
+
 class VocableTrainerFrontend(TrainerFrontend[VocableTrainerBackend]):
+    RELATED_SENTENCE_PAIRS_LOOKAHEAD = 3
+    N_RELATED_SENTENCE_PAIRS_PREFETCHING_WORKERS = 1
+
     def __init__(self):
         super().__init__(
             backend_type=VocableTrainerBackend,
@@ -40,17 +62,26 @@ class VocableTrainerFrontend(TrainerFrontend[VocableTrainerBackend]):
         self._n_perfected_entries: int = 0
 
         self._current_vocable_entry: VocableEntry = None
+        self._related_sentence_pairs_prefetcher: LookaheadPrefetcher[VocableEntry, list[SentencePair]] = None  # type: ignore
 
     def __call__(self) -> PlotParameters:
         self._set_terminal_title()
+        self._prefetch_training_item_sequence_plot_data()
 
         self._backend.set_item_iterator()
+        self._related_sentence_pairs_prefetcher = LookaheadPrefetcher(
+            item_provider=self._backend.get_training_item,
+            resolve=self._related_sentence_pairs,
+            lookahead=self.RELATED_SENTENCE_PAIRS_LOOKAHEAD,
+            n_workers=self.N_RELATED_SENTENCE_PAIRS_PREFETCHING_WORKERS
+        )
 
         if self._backend.new_vocable_entries_available:
             self._display_new_vocabulary_if_desired()
 
         self._display_training_screen_header_section()
         self._training_loop()
+        self._related_sentence_pairs_prefetcher.close()
 
         self._upsert_session_statistics()
 
@@ -101,106 +132,105 @@ class VocableTrainerFrontend(TrainerFrontend[VocableTrainerBackend]):
         # display lets go
         self._output_lets_go()
 
-    def _training_loop(self):
-        EVALUATION_2_COLOR = {
-             ResponseEvaluation.Wrong: 'red',
-             ResponseEvaluation.AccentError: 'yellow',
-             ResponseEvaluation.AlmostCorrect: 'yellow',
-             ResponseEvaluation.WrongArticle: 'cyan',
-             ResponseEvaluation.MissingArticle: 'cyan',
-             ResponseEvaluation.Correct: 'green'
-        }
-
-        if (entry := self._backend.get_training_item()) is not None:
-            self._display_streak()
-            self._display_progress_bar()
-
-            # display vocable in reference language, query ground_truth
-            translation_query_output = f'\t\t{entry.translation} = '
-            self._undo_print(translation_query_output, end='')
-
-            # get vocable identification aid if synonyms with identical
-            # english ground_truth amongst training vocables
-            vocable_identification_aid = ''
-            if synonyms := self._backend.paraphrases.get(entry.the_stripped_meaning):
-                vocable_identification_aid = entry.vocable[:len(longest_common_prefix(synonyms)) + 1]
-                print(vocable_identification_aid, end='')
-
-            response = input()
-
-            # concatenate vocable identification aid, get response evaluation,
-            # update vocable score, enter update into database
-            response, response_evaluation = get_response_evaluation(response, entry.vocable, vocable_identification_aid)
-            entry.update_post_training_encounter(increment=response_evaluation.value)
-            UserDatabase.instance().vocabulary_collection.update_entry(entry.vocable, entry.score)
-
-            # erase query line, redo ground_truth query
-            op.erase_lines(1)
-            self._undo_print(translation_query_output, end='')
-
-            ground_truth_output = f'{colored(entry.vocable, "green")}'
-
-            # merely display correct ground_truth if no response given,
-            # otherwise display response and evaluation
-            if response_evaluation is ResponseEvaluation.NoResponse:
-                self._undo_print(ground_truth_output, end='')
+    def _procured_training_item(self) -> tuple[VocableEntry, Future[list[SentencePair]]] | None:
+        return self._related_sentence_pairs_prefetcher.get()
 
-            else:
-                if response_evaluation is ResponseEvaluation.AlmostCorrect:
-                    response_deviation_mask, ground_truth_deviation_mask = deviation_masks(response=response, ground_truth=entry.vocable)
+    def _train_item(self, item: tuple[VocableEntry, Future[list[SentencePair]]]):
+        entry, related_sentence_pairs_resolution = item
+
+        self._display_streak()
+        self._display_progress_bar()
+
+        # display vocable in reference language, query ground_truth
+        translation_query_output = f'\t\t{entry.translation} = '
+        self._undo_print(translation_query_output, end='')
 
-                    response = op.colorize_chars(response, char_mask=response_deviation_mask, color_kwargs={'highlight_color': "red"})
-                    ground_truth_output = op.colorize_chars(entry.vocable, char_mask=ground_truth_deviation_mask, color_kwargs={'highlight_color': 'green', 'attrs': ['underline']}, fallback_color_kwargs={'highlight_color': 'green'})
+        # get vocable identification aid if synonyms with identical
+        # english ground_truth amongst training vocables
+        vocable_identification_aid = ''
+        if synonyms := self._backend.paraphrases.get(entry.the_stripped_meaning):
+            vocable_identification_aid = entry.vocable[:len(longest_common_prefix(synonyms)) + 1]
+            print(vocable_identification_aid, end='')
 
-                self._undo_print(f'{response} | {colored(" ".join(split_at_uppercase(response_evaluation.name)).upper(), EVALUATION_2_COLOR[response_evaluation])}', end='')
+        response: str = input_reader.read_line()  # type: ignore
 
-                # display correct ground_truth in case of imperfect response
-                if response_evaluation is not ResponseEvaluation.Correct:
-                    self._undo_print(f" | Correct translation: {ground_truth_output}", end='')
+        # concatenate vocable identification aid, get response evaluation,
+        # update vocable score, enter update into database
+        response, response_evaluation = get_response_evaluation(response, entry.vocable, vocable_identification_aid)
+        entry.update_post_training_encounter(increment=response_evaluation.value)
+        vocabulary_write_queue.update_entry(entry.vocable, entry.score)
 
-            # display new score in case of change having taken place
-            if response_evaluation not in {ResponseEvaluation.NoResponse, ResponseEvaluation.Wrong}:
-                if entry.score < 5:
-                    self._undo_print(f" | New Score: {[int(entry.score), entry.score][bool(entry.score % 1)]}", end='')
-                else:
-                    self._n_perfected_entries += 1
-                    self._undo_print(" | Entry Perfected", end='')
+        # erase query line, redo ground_truth query
+        op.erase_lines(1)
+        self._undo_print(translation_query_output, end='')
 
-            self._undo_print('\n')
+        ground_truth_output = f'{colored(entry.vocable, "green")}'
 
-            # get related sentence pairs, convert forenames if feasible
-            related_sentence_pairs = self._backend.related_sentence_pairs(entry.vocable, n=2)
-            if self._backend.forename_converter is not None:
-                related_sentence_pairs = list(map(self._backend.forename_converter, related_sentence_pairs))
+        # merely display correct ground_truth if no response given,
+        # otherwise display response and evaluation
+        if response_evaluation is ResponseEvaluation.NoResponse:
+            self._undo_print(ground_truth_output, end='')
 
-            # display sentence pairs
-            for sentence_pair in related_sentence_pairs:
-                op.centered(' - '.join(reversed(sentence_pair)), line_counter=self._undo_print)
-            self._undo_print('')
+        else:
+            if response_evaluation is ResponseEvaluation.AlmostCorrect:
+                response_deviation_mask, ground_truth_deviation_mask = deviation_masks(response=response, ground_truth=entry.vocable)
+
+                response = op.colorize_chars(response, char_mask=response_deviation_mask, color_kwargs={'color': 'red'})
+                ground_truth_output = op.colorize_chars(entry.vocable, char_mask=ground_truth_deviation_mask, color_kwargs={'color': 'green', 'attrs': ['underline']}, fallback_color_kwargs={'color': 'green'})
 
-            # increment/reassign attributes
-            # entry.increment_times_faced()
-            self._n_trained_items += 1
-            self._accumulated_score += EVALUATION_2_SCORE[response_evaluation]
-            self._current_vocable_entry = entry
-            self._update_streak(response_evaluation)
+            self._undo_print(f'{response} | {colored(" ".join(split_at_uppercase(response_evaluation.name)).upper(), _EVALUATION_2_COLOR[response_evaluation])}', end='')
 
-            # display absolute entry progress if n_trained_items divisible by 10
-            if not self._n_trained_items % 10 and self._n_trained_items != self._backend.n_training_items:
-                op.centered(f'\n{self._n_trained_items} Entries faced, {self._backend.n_training_items - self._n_trained_items} more to go\n', line_counter=self._undo_print)
-            self._undo_print('')
+            # display correct ground_truth in case of imperfect response
+            if response_evaluation is not ResponseEvaluation.Correct:
+                self._undo_print(f" | Correct translation: {ground_truth_output}", end='')
 
-            # query option/procedure, __call__ option if applicable
-            self._undo_print.add_rows_to_buffer(1)
+        # display new score in case of change having taken place
+        if response_evaluation not in {ResponseEvaluation.NoResponse, ResponseEvaluation.Wrong}:
+            if entry.score < 5:
+                self._undo_print(f" | New Score: {[int(entry.score), entry.score][bool(entry.score % 1)]}", end='')
+            else:
+                self._n_perfected_entries += 1
+                self._undo_print(" | Entry Perfected", end='')
 
-            if self._inquire_option_selection(indentation_percentage=0.49) and self._quit_training:
-                return
+        self._undo_print('\n')
 
-            # clear screen part pertaining to current entry
-            self._undo_print.undo()
+        # display related sentence pairs, having been prefetched meanwhile
+        for sentence_pair in self._related_sentence_pairs_prefetcher.result(related_sentence_pairs_resolution):
+            op.centered(' - '.join(reversed(sentence_pair)), line_counter=self._undo_print)
+        self._undo_print('')
 
-            return self._training_loop()
+        # increment/reassign attributes
+        # entry.increment_times_faced()
+        self._n_trained_items += 1
+        self._accumulated_score += EVALUATION_2_SCORE[response_evaluation]
+        self._current_vocable_entry = entry
+        self._update_streak(response_evaluation)
+
+        # display absolute entry progress if n_trained_items divisible by 10
+        if not self._n_trained_items % 10 and self._n_trained_items != self._backend.n_training_items:
+            op.centered(f'\n{self._n_trained_items} Entries faced, {self._backend.n_training_items - self._n_trained_items} more to go\n', line_counter=self._undo_print)
+        self._undo_print('')
+
+        # query option/procedure, __call__ option if applicable
+        self._undo_print.add_rows_to_buffer(1)
+        self._inquire_option_selection(indentation_percentage=0.49)
+
+    def _post_item(self):
+        # clear screen part pertaining to current entry
+        self._undo_print.undo()
+
+    def _on_training_items_depleted(self):
         # TODO: make display bar advance to 100% after completion of last vocable
+        pass
+
+    def _related_sentence_pairs(self, entry: VocableEntry) -> list[SentencePair]:
+        """ Returns:
+                sentence pairs related to entry, with converted forenames if feasible """
+
+        related_sentence_pairs = self._backend.related_sentence_pairs(entry.vocable, n=2)
+        if self._backend.forename_converter is not None:
+            related_sentence_pairs = list(map(self._backend.forename_converter, related_sentence_pairs))
+        return related_sentence_pairs
 
     def _display_progress_bar(self):
         BAR_LENGTH = 70
@@ -214,19 +244,19 @@ class VocableTrainerFrontend(TrainerFrontend[VocableTrainerBackend]):
         self._undo_print(f'{int(round(percentage * 100))}%{view.VERTICAL_OFFSET}')
 
     def _display_streak(self):
-        attrs = ['bold']
+        attrs: tuple[str, ...] = ('bold',)
 
         if self._streak >= 2:
             background = None
 
             if self._streak >= 5:
-                attrs.append('blink')
+                attrs += ('blink',)
 
                 # change background every second increment starting from 7
                 if self._streak >= 7:
                     background = ['on_green', 'on_yellow', 'on_blue', 'on_cyan', 'on_white'][min((self._streak - 7) // 2, 4)]
 
-            op.centered(f'Current streak: {colored(str(self._streak), "red", background, attrs=attrs)}', end='', line_counter=self._undo_print)
+            op.centered(f'Current streak: {op.styled(str(self._streak), op.Style("red", background, attrs))}', end='', line_counter=self._undo_print)
         self._undo_print('\n\n')
 
     def _update_streak(self, response_evaluation: ResponseEvaluation):
@@ -245,10 +275,21 @@ class VocableTrainerFrontend(TrainerFrontend[VocableTrainerBackend]):
         n_printed_lines = super()._alter_vocable_entry(self._current_vocable_entry)
         output.erase_lines(n_printed_lines - 1)
 
-    @UserDatabase.receiver
-    def _delete_vocable_entry(self, user_database: UserDatabase):
+    def _delete_vocable_entry(self):
         output.centered(f"\nAre you sure you want to irreversibly delete {self._current_vocable_entry}? {prompt.YES_NO_QUERY_OUTPUT}")
 
         if prompt_relentlessly(output.centering_indentation(' '), options=prompt.YES_NO_OPTIONS) == prompt.YES:
-            user_database.vocabulary_collection.delete_entry(self._current_vocable_entry)
-        output.erase_lines(3)
\ No newline at end of file
+            vocabulary_write_queue.delete_entry(self._current_vocable_entry)
+            self._withdraw_vocabulary_training_if_depleted()
+        output.erase_lines(3)
+
+    @UserDatabase.receiver
+    def _withdraw_vocabulary_training_if_depleted(self, user_database: UserDatabase):
+        """ Withdraws the vocabulary training option upon deletion of the last entry,
+            as determined by the vocabulary collection subsequent to the deletion """
+
+        vocabulary_write_queue.flush()
+
+        if (language := State.instance().language) not in user_database.vocabulary_collection.vocabulary_possessing_languages():
+            State.instance().vocabulary_possessing_languages.discard(language)
+            state_snapshot.store()
\ No newline at end of file
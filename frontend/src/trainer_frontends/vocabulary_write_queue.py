@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+import atexit
+import logging
+import threading
+import time
+
+from backend.src.database.user_database import UserDatabase
+from backend.src.types.vocable_entry import VocableEntry
+from pymongo import errors
+
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Write:
+    vocabulary_collection_method: str
+    args: tuple[Any, ...]
+
+    def __call__(self, user_database: UserDatabase):
+        getattr(user_database.vocabulary_collection, self.vocabulary_collection_method)(*self.args)
+
+
+class VocabularyWriteQueue:
+    """ Write-behind queue for the vocabulary mutations conducted during training,
+        sparing the user the database round trip between the evaluation of a response
+        and the display of the next item
+
+        Queued writes are executed in order, in batches, on
+            - a background thread every flush_interval seconds
+            - explicit flush, e.g. on training quit or prior to vocabulary reads
+            - interpreter exit
+
+        Score updates of the same vocable are coalesced into a single write,
+        provided that no other write concerning the vocable was enqueued in between """
+
+    def __init__(self, flush_interval: float = 2.0):
+        self._pending: list[_Write] = []
+        self._vocable_2_pending_update: dict[str, _Write] = {}
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+        self.flush_latencies: deque[float] = deque(maxlen=100)
+        self.n_coalesced_writes = 0
+
+        self._stopped = threading.Event()
+        self._flush_interval = flush_interval
+        self._flushing_thread = threading.Thread(target=self._flush_periodically, name='vocabulary-write-queue', daemon=True)
+        self._flushing_thread.start()
+
+        atexit.register(self.close)
+
+    # ------------------
+    # Monitoring
+    # ------------------
+    @property
+    def depth(self) -> int:
+        """ Number of pending writes """
+
+        return len(self._pending)
+
+    @property
+    def mean_flush_latency(self) -> float | None:
+        """ In seconds, over the last 100 flushes """
+
+        if not self.flush_latencies:
+            return None
+        return sum(self.flush_latencies) / len(self.flush_latencies)
+
+    # ------------------
+    # Enqueuing
+    # ------------------
+    def update_entry(self, vocable: str, score: float):
+        with self._lock:
+            if (pending_update := self._vocable_2_pending_update.get(vocable)) is not None:
+                pending_update.args = (vocable, score)
+                self.n_coalesced_writes += 1
+            else:
+                self._vocable_2_pending_update[vocable] = _Write('update_entry', (vocable, score))
+                self._pending.append(self._vocable_2_pending_update[vocable])
+
+    def upsert_entry(self, entry: VocableEntry):
+        self._enqueue_barrier(entry.vocable, _Write('upsert_entry', (entry,)))
+
+    def alter_entry(self, old_vocable: str, entry: VocableEntry):
+        self._enqueue_barrier(old_vocable, _Write('alter_entry', (old_vocable, entry)))
+
+    def delete_entry(self, entry: VocableEntry):
+        self._enqueue_barrier(entry.vocable, _Write('delete_entry', (entry,)))
+
+    def _enqueue_barrier(self, vocable: str, write: _Write):
+        """ Enqueues write, past which the pending update of vocable, if any,
+            isn't to be coalesced with subsequent ones anymore """
+
+        with self._lock:
+            self._vocable_2_pending_update.pop(vocable, None)
+            self._pending.append(write)
+
+    # ------------------
+    # Flushing
+    # ------------------
+    def flush(self):
+        """ Executes all pending writes in order, blocking until done
+
+            Writes failing due to database errors are retained for a
+            retry on the next flush, whereas ones failing otherwise are
+            discarded, as bound to fail again """
+
+        with self._flush_lock:
+            if not self._pending:
+                return
+
+            # retain pending writes if the database is unavailable
+            start = time.perf_counter()
+            user_database = UserDatabase.instance()
+
+            with self._lock:
+                batch, self._pending = self._pending, []
+                self._vocable_2_pending_update.clear()
+
+            for i, write in enumerate(batch):
+                try:
+                    write(user_database)
+                except errors.PyMongoError:
+                    _logger.exception(f'Vocabulary write failed, retaining {len(batch) - i} writes')
+                    with self._lock:
+                        self._pending[:0] = batch[i:]
+                    break
+                except Exception:
+                    _logger.exception(f'Vocabulary write {write} failed, discarding it')
+
+            self.flush_latencies.append(time.perf_counter() - start)
+
+    def _flush_periodically(self):
+        while not self._stopped.wait(self._flush_interval):
+            # keep the thread alive, e.g. whilst the database is unreachable
+            try:
+                self.flush()
+            except Exception:
+                _logger.exception('Periodic vocabulary flush failed')
+
+    def close(self):
+        self._stopped.set()
+        self.flush()
+
+
+vocabulary_write_queue = VocabularyWriteQueue()
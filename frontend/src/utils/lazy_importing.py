@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from types import ModuleType
+from typing import Any, Callable, Iterable
+import importlib
+
+
+def submodule_getattr(package_name: str, submodule_names: Iterable[str]) -> Callable[[str], ModuleType]:
+    """ Returns:
+            module level __getattr__ (PEP 562) for the package of package_name,
+            importing the requested submodule merely on its first access and
+            thereby deferring the loading of its dependencies up until the point
+            at which it's actually needed
+
+        >>> __getattr__ = submodule_getattr('frontend.src.utils', submodule_names=['iterables'])
+        >>> __getattr__('iterables').__name__
+        'frontend.src.utils.iterables' """
+
+    submodule_names = frozenset(submodule_names)
+
+    def __getattr__(name: str) -> ModuleType:
+        if name in submodule_names:
+            return importlib.import_module(f'{package_name}.{name}')
+        raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+    return __getattr__
+
+
+def deferred(module_name: str, attribute_name: str) -> Callable[[], Any]:
+    """ Returns:
+            function importing module_name on invocation and returning
+            its attribute_name attribute
+
+        >>> first = deferred('frontend.src.utils.iterables', 'first')
+        >>> first()([1, 2, 3], key=lambda x: x > 1)
+        2 """
+
+    def load() -> Any:
+        return getattr(importlib.import_module(module_name), attribute_name)
+    return load
@@ -2,12 +2,13 @@ from typing import Callable, Iterable, Iterator
 from functools import wraps
 from itertools import groupby
 
-import cursor
-
+from . import terminal_control
 from ._utils import ansi_escape_code_stripped
 from .colorizing import colorize_chars
+from .styling import Style, StyledText, styled
 from .undoing import LineCounter, UndoPrint, RedoPrint
 from .clearing import clear_screen, erase_lines
+from .framing import frame, framed, flush, repaint
 from .percentual_indenting import column_percentual_indentation, row_percentual_indentation
 from .centering import (
     centered,
@@ -24,9 +25,9 @@ def cursor_hider(function: Callable):
 
     @wraps(function)
     def wrapper(*args, **kwargs):
-        cursor.hide()
+        terminal_control.hide_cursor()
         result = function(*args, **kwargs)
-        cursor.show()
+        terminal_control.show_cursor()
         return result
     return wrapper
 
@@ -1,9 +1,13 @@
+from functools import lru_cache
 from typing import Pattern
 import re
-import shutil
+import unicodedata
+
+from .geometry import terminal_geometry
 
 
 _TAB_OUTPUT_LENGTH = 4
+_ZERO_WIDTH_CATEGORIES = {'Mn', 'Me', 'Cf'}
 _ANSI_ESCAPE_REGEX: Pattern[str] = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
 
 
@@ -17,22 +21,42 @@ def ansi_escape_code_stripped(string: str) -> str:
     return _ANSI_ESCAPE_REGEX.sub('', string)
 
 
-def _output_length(string: str) -> int:
+@lru_cache(maxsize=4096)
+def display_width(string: str) -> int:
     """ Args:
             string: string free of '\n's
 
         Returns:
-            length of output output which the passed string would produce
+            number of terminal columns the output of string occupies, disregarding
+            ANSI escape codes, expanding tabs, counting East Asian wide and fullwidth
+            chars twice and combining, as well as other zero width chars not at all
+
+        >>> display_width('\\x1b[35mHello Görl!\\x1b[0m\\t\\t')
+        19
+        >>> display_width('私は毎朝コーヒーを飲みます。'), display_width('他在看书'), display_width('ที่นี่')
+        (28, 8, 2) """
+
+    if '\x1b' in string:
+        string = ansi_escape_code_stripped(string)
+
+    if string.isascii():
+        return len(string) + string.count('\t') * (_TAB_OUTPUT_LENGTH - 1)
+    return sum(map(_char_width, string))
 
-        >>> _output_length('[35mHello Görl![0m\t\t')
-        27 """
 
-    return len(ansi_escape_code_stripped(string)) + string.count('\t') * (_TAB_OUTPUT_LENGTH - 1)
+def _char_width(char: str) -> int:
+    if char == '\t':
+        return _TAB_OUTPUT_LENGTH
+    elif unicodedata.combining(char) or unicodedata.category(char) in _ZERO_WIDTH_CATEGORIES:
+        return 0
+    elif unicodedata.east_asian_width(char) in 'WF':
+        return 2
+    return 1
 
 
 def _terminal_columns() -> int:
-    return int(shutil.get_terminal_size().columns)
+    return terminal_geometry.columns
 
 
 def _terminal_lines() -> int:
-    return int(shutil.get_terminal_size().lines)
+    return terminal_geometry.lines
@@ -1,13 +1,11 @@
 from typing import Iterable, List, Optional, Sequence
 
-from backend.src.utils.iterables import longest_value
-
-from ._utils import _terminal_columns, ansi_escape_code_stripped
+from ._utils import _terminal_columns, display_width
 from .undoing import LineCounter
 
 
 def centering_indentation(row: str) -> str:
-    return " " * ((_terminal_columns() - len(ansi_escape_code_stripped(row))) // 2)
+    return " " * ((_terminal_columns() - display_width(row)) // 2)
 
 
 def centered(*print_elements: str, end='\n', line_counter: Optional[LineCounter] = None):
@@ -44,14 +42,14 @@ def align(column1: Sequence[str], column2: Sequence[str]) -> List[str]:
         Join rows of column1 and column2 such that respective column beginnings
         vertically aligned """
 
-    max_length_first_column_element = max(map(len, column1))
-    return [f"{' ' * (max_length_first_column_element - len(column1[i]) + 1)}".join([column1[i], column2[i]]) for i in range(len(column1))]
+    max_width_first_column_element = max(map(display_width, column1))
+    return [f"{' ' * (max_width_first_column_element - display_width(column1[i]) + 1)}".join([column1[i], column2[i]]) for i in range(len(column1))]
 
 
 def block_centering_indentation(output_block: Iterable[str]) -> str:
     """ Returns:
-            indentation determined by length of longest output output row comprised by output_block,
+            indentation determined by display width of widest output row comprised by output_block,
             enabling center_message positioning of the aforementioned row and the others to start on the same
             output column, resulting in an uniform writing appearance """
 
-    return centering_indentation(longest_value(output_block))
+    return centering_indentation(max(output_block, key=display_width))
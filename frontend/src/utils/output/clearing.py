@@ -1,21 +1,9 @@
-import subprocess
-import sys
-import platform
-
-
-_CLEAR_COMMAND = ['clear', 'cls'][platform.system() == 'Windows']
+from . import terminal_control
 
 
 def clear_screen():
-    subprocess.run([_CLEAR_COMMAND])
-
-
-def _erase_previous_line():
-    sys.stdout.write("\033[F")
-    sys.stdout.write("\033[K")
+    terminal_control.clear_screen()
 
 
 def erase_lines(n_lines: int):
-    print('')
-    for _ in range(n_lines + 1):
-        _erase_previous_line()
+    terminal_control.erase_lines(n_lines)
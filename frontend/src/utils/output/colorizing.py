@@ -1,27 +1,21 @@
-from typing import Iterator, Optional, List, Dict, Union
+from typing import Iterable, Optional
 
-from termcolor import colored
-
-
-_ColorKwargs = Dict[str, Union[str, List[str]]]
+from .styling import ColorKwargs, Style, StyledText
 
 
 def colorize_chars(string: str,
-                   char_mask: Iterator[bool],
-                   color_kwargs: _ColorKwargs,
-                   fallback_color_kwargs: Optional[_ColorKwargs] = None) -> str:
+                   char_mask: Iterable[bool],
+                   color_kwargs: ColorKwargs,
+                   fallback_color_kwargs: Optional[ColorKwargs] = None) -> str:
     """ Args:
             string: whose chars ought to be colorized
             char_mask: to be of length parity with string; denoting chars
                 for which color_kwargs ought to be applied if corresponding
                 element set to True, fallback_kwargs otherwise if passed
             color_kwargs: {termcolor.colored keyword: value}
-            fallback_color_kwargs: see above """
+            fallback_color_kwargs: see above
+
+        Returns:
+            string whose runs of equally colorized chars share a single escape sequence """
 
-    chars = list(string)
-    for i, (apply, char) in enumerate(zip(char_mask, chars)):
-        if apply:
-            chars[i] = colored(char, **color_kwargs)  # type: ignore
-        elif fallback_color_kwargs:
-            chars[i] = colored(char, **fallback_color_kwargs)  # type: ignore
-    return ''.join(chars)
+    return str(StyledText().append_masked(string, char_mask, Style.of(color_kwargs), Style.of(fallback_color_kwargs)))
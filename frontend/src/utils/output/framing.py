@@ -0,0 +1,206 @@
+""" Frame-buffered output, composing everything printed in between two flushes,
+    e.g. the output preceding an input query, in memory and writing it at once,
+    as well as the repainting of already displayed rows by merely their changes """
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterator, List, Optional, Sequence, TextIO, Tuple
+import io
+import sys
+
+from . import terminal_control
+from ._utils import _terminal_columns
+
+
+class Frame(io.TextIOBase):
+    """ Stdout stand-in buffering received writes until being flushed,
+        which it conveys as a single write to the wrapped stream
+
+        Poses as the wrapped stream otherwise, such that terminal dependent
+        output, as well as input(), behaves as if writing to it directly """
+
+    defers_flushes = True
+    """ signals terminal_control to leave flushing to the frame's owner """
+
+    def __init__(self, stream: TextIO):
+        super().__init__()
+
+        self.stream = stream
+        self._pending: List[str] = []
+
+    # read-only at runtime, albeit declared as attributes
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return self.stream.encoding
+
+    @property
+    def errors(self) -> Optional[str]:  # type: ignore[override]
+        return self.stream.errors
+
+    def isatty(self) -> bool:
+        return self.stream.isatty()
+
+    def fileno(self) -> int:
+        return self.stream.fileno()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, string: str) -> int:
+        self._pending.append(string)
+        return len(string)
+
+    def flush(self):
+        if self._pending:
+            self.stream.write(str().join(self._pending))
+            self._pending.clear()
+        self.stream.flush()
+
+    def __getattr__(self, item):
+        return getattr(self.stream, item)
+
+
+@contextmanager
+def frame() -> Iterator[None]:
+    """ Composes the output of the enclosed block in frames, written upon each flush
+        of stdout, as done by input() and prompts, as well as upon exit
+
+        No-op if already within a frame """
+
+    if isinstance(sys.stdout, Frame):
+        yield
+        return
+
+    sys.stdout = _frame = Frame(sys.stdout)
+    try:
+        yield
+    finally:
+        sys.stdout = _frame.stream
+        _frame.flush()
+
+
+def framed(function: Callable) -> Callable:
+    """ Decorator composing the output of function in frames """
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with frame():
+            return function(*args, **kwargs)
+    return wrapper
+
+
+def flush():
+    """ To be invoked prior to blocking operations not flushing stdout
+        themselves, e.g. sleeping, such that the output preceding it gets displayed """
+
+    sys.stdout.flush()
+
+
+# ------------------
+# Repainting
+# ------------------
+Row = Tuple[str, int]
+""" newline free row, its output length """
+
+
+def repaint(painted_rows: Sequence[Row], rows: Sequence[Row]):
+    """ Replaces the displayed painted_rows, beneath which the cursor resides,
+        by rows, writing merely the rows deviating from the painted ones
+
+        Rows are written in full if stdout isn't connected to an ANSI capable terminal """
+
+    if not terminal_control.capabilities().ansi:
+        sys.stdout.write(str().join(f'{row}\n' for row, _ in rows))
+    else:
+        sys.stdout.write(_repainting_sequence(painted_rows, rows))
+
+    if not isinstance(sys.stdout, Frame):
+        sys.stdout.flush()
+
+
+def _repainting_sequence(painted_rows: Sequence[Row], rows: Sequence[Row]) -> str:
+    """ Returns:
+            sequence moving the cursor to the first painted row, subsequently either
+                - deleting the leading painted rows if the remaining ones equal the leading
+                  rows, writing the succeeding rows, or
+                - writing the rows deviating from the painted ones at the same position,
+                  erasing everything beneath the first row occupying a deviating number
+                  of terminal rows
+
+        >>> _repainting_sequence([('first', 5), ('second', 6)], [('second', 6), ('third', 5)])
+        '\\x1b[2F\\x1b[1M\\x1b[1E\\x1b[2Kthird\\n'
+        >>> _repainting_sequence([('a', 1), ('b', 1), ('c', 1)], [('a', 1), ('B', 1)])
+        '\\x1b[3F\\x1b[1E\\x1b[2KB\\n\\x1b[J' """
+
+    painted_heights = list(map(_n_terminal_rows, painted_rows))
+    heights = list(map(_n_terminal_rows, rows))
+
+    sequences = []
+    if n_painted_terminal_rows := sum(painted_heights):
+        sequences.append(terminal_control.cursor_to_previous_line(n_painted_terminal_rows))
+
+    n_unaltered_rows = _n_leading_equal(painted_rows, rows)
+    n_unaltered_terminal_rows = sum(heights[:n_unaltered_rows])
+
+    # shift painted rows up if amounting to more rows to be retained
+    if (n_shifted_rows := _n_shifted_rows(painted_rows, rows, n_unaltered_rows)) is not None:
+        n_retained_rows = len(painted_rows) - n_shifted_rows
+        sequences.append(terminal_control.deleted_lines(sum(painted_heights[:n_shifted_rows])))
+        if n_retained_terminal_rows := sum(heights[:n_retained_rows]):
+            sequences.append(terminal_control.cursor_to_next_line(n_retained_terminal_rows))
+        sequences.extend(terminal_control._ERASE_LINE + row + '\n' for row, _ in rows[n_retained_rows:])
+        return str().join(sequences)
+
+    n_skipped_terminal_rows = n_unaltered_terminal_rows
+    aligned = True
+    for i in range(n_unaltered_rows, len(rows)):
+        if aligned and i < len(painted_rows) and painted_rows[i][0] == rows[i][0]:
+            n_skipped_terminal_rows += heights[i]
+            continue
+
+        if n_skipped_terminal_rows:
+            sequences.append(terminal_control.cursor_to_next_line(n_skipped_terminal_rows))
+            n_skipped_terminal_rows = 0
+
+        # rows occupying differing numbers of terminal rows misalign all successive ones
+        if aligned and (i >= len(painted_rows) or heights[i] != 1 or painted_heights[i] != 1):
+            aligned = False
+            sequences.append(terminal_control._ERASE_BELOW)
+
+        sequences.append(f'{terminal_control._ERASE_LINE if aligned else ""}{rows[i][0]}\n')
+
+    if n_skipped_terminal_rows:
+        sequences.append(terminal_control.cursor_to_next_line(n_skipped_terminal_rows))
+    if aligned and len(painted_rows) > len(rows):
+        sequences.append(terminal_control._ERASE_BELOW)
+    return str().join(sequences)
+
+
+def _n_terminal_rows(row: Row) -> int:
+    return 1 + row[1] // _terminal_columns()
+
+
+def _n_leading_equal(painted_rows: Sequence[Row], rows: Sequence[Row]) -> int:
+    n = 0
+    for (painted_row, _), (row, _) in zip(painted_rows, rows):
+        if painted_row != row:
+            break
+        n += 1
+    return n
+
+
+def _n_shifted_rows(painted_rows: Sequence[Row], rows: Sequence[Row], n_unaltered_rows: int) -> int | None:
+    """ Returns:
+            smallest number of leading painted rows, whose removal renders the remaining
+            ones the leading rows, if retaining more than n_unaltered_rows, otherwise None """
+
+    painted_row_strings = [row for row, _ in painted_rows]
+    row_strings = [row for row, _ in rows]
+
+    for n_shifted_rows in range(1, len(painted_rows) - n_unaltered_rows):
+        n_retained_rows = len(painted_rows) - n_shifted_rows
+        if painted_row_strings[n_shifted_rows:] == row_strings[:n_retained_rows]:
+            return n_shifted_rows
+    return None
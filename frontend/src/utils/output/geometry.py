@@ -0,0 +1,93 @@
+""" Terminal size, queried once and refreshed upon SIGWINCH rather than on each
+    centered line, notifying the caches derived from it of changes
+
+    Output already displayed isn't reflowed on resize; screens pick up the
+    refreshed size upon their next rendering """
+
+from __future__ import annotations
+
+from typing import Callable, List, Optional
+import os
+import shutil
+import signal
+import threading
+
+
+class TerminalGeometry:
+    """ Caches the terminal size, which is refreshed by a SIGWINCH handler
+        installed on the first query from within the main thread
+
+        Where no such handler can be installed, e.g. on platforms lacking
+        SIGWINCH, the size is queried anew upon each access """
+
+    def __init__(self):
+        self._size: Optional[os.terminal_size] = None
+        self._sigwinch_handled = False
+        self._subscribers: List[Callable[[], None]] = []
+
+    @property
+    def columns(self) -> int:
+        return self._terminal_size().columns
+
+    @property
+    def lines(self) -> int:
+        return self._terminal_size().lines
+
+    def _terminal_size(self) -> os.terminal_size:
+        if not self._sigwinch_handled:
+            self._sigwinch_handled = self._install_sigwinch_handler()
+            if not self._sigwinch_handled:
+                self.refresh()
+
+        if self._size is None:
+            self._size = shutil.get_terminal_size()
+        return self._size
+
+    def subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """ Registers callback to be invoked upon each change of the terminal size,
+            usable as decorator
+
+            Callbacks are invoked from within the SIGWINCH handler, i.e. whilst the
+            main thread is interrupted at an arbitrary point, and are hence to merely
+            invalidate state derived from the size, rather than writing output
+
+            Returns:
+                callback """
+
+        self._subscribers.append(callback)
+        return callback
+
+    def refresh(self):
+        """ Queries the terminal size, notifying the subscribers if changed """
+
+        size = shutil.get_terminal_size()
+        if size == self._size:
+            return
+
+        previous_size, self._size = self._size, size
+        if previous_size is not None:
+            for callback in self._subscribers:
+                callback()
+
+    # ------------------
+    # SIGWINCH
+    # ------------------
+    def _install_sigwinch_handler(self) -> bool:
+        """ Returns:
+                whether handler installed, which is possible from within the main thread only """
+
+        if not hasattr(signal, 'SIGWINCH') or threading.current_thread() is not threading.main_thread():
+            return False
+
+        previous_handler = signal.getsignal(signal.SIGWINCH)
+
+        def handler(signum, frame):
+            self.refresh()
+            if callable(previous_handler):
+                previous_handler(signum, frame)
+
+        signal.signal(signal.SIGWINCH, handler)
+        return True
+
+
+terminal_geometry = TerminalGeometry()
@@ -1,6 +1,7 @@
 from functools import lru_cache
 
 from ._utils import _terminal_columns, _terminal_lines
+from .geometry import terminal_geometry
 
 
 _CASH_SIZE = 32
@@ -22,6 +23,10 @@ def row_percentual_indentation(percentage: float) -> str:
     return '\n' * int(_terminal_lines() * percentage)
 
 
+terminal_geometry.subscribe(column_percentual_indentation.cache_clear)
+terminal_geometry.subscribe(row_percentual_indentation.cache_clear)
+
+
 class IndentedPrint:
     def __init__(self, indentation: str):
         self._indentation = indentation
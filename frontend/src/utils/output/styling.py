@@ -0,0 +1,119 @@
+""" Styled text, rendering runs of adjacent equally styled chars by means of a single,
+    combined SGR escape sequence rather than termcolor's per attribute sequences
+    being repeated for each char """
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from termcolor import ATTRIBUTES, COLORS, HIGHLIGHTS, RESET, colored
+
+
+ColorKwargs = Dict[str, Union[str, List[str], None]]
+
+
+@dataclass(frozen=True)
+class Style:
+    """ termcolor.colored color, on_color and attrs """
+
+    color: Optional[str] = None
+    on_color: Optional[str] = None
+    attrs: Tuple[str, ...] = ()
+
+    @classmethod
+    def of(cls, color_kwargs: Optional[ColorKwargs]) -> Optional[Style]:
+        """ Returns:
+                style corresponding to color_kwargs, None if not passed
+
+            >>> Style.of({'color': 'red', 'attrs': ['underline']})
+            Style(color='red', on_color=None, attrs=('underline',)) """
+
+        if not color_kwargs:
+            return None
+        return cls(
+            color=color_kwargs.get('color'),  # type: ignore
+            on_color=color_kwargs.get('on_color'),  # type: ignore
+            attrs=tuple(color_kwargs.get('attrs') or ())
+        )
+
+    @cached_property
+    def escape_sequence(self) -> str:
+        """ >>> Style('red', 'on_green', ('bold', 'blink')).escape_sequence
+            '\\x1b[1;5;42;31m' """
+
+        codes = [ATTRIBUTES[attr] for attr in self.attrs]
+        if self.on_color is not None:
+            codes.append(HIGHLIGHTS[self.on_color])
+        if self.color is not None:
+            codes.append(COLORS[self.color])
+        return f'\033[{";".join(map(str, codes))}m' if codes else ''
+
+
+def _colorization_enabled() -> bool:
+    """ Returns:
+            whether termcolor currently colorizes, depending on both the
+            environment and stdout being connected to a terminal """
+
+    return bool(colored(' ', 'red').strip())
+
+
+def styled(text: str, style: Optional[Style]) -> str:
+    return _styled(text, style, _colorization_enabled())
+
+
+@lru_cache(maxsize=1024)
+def _styled(text: str, style: Optional[Style], colorize: bool) -> str:
+    if not colorize or style is None or not text or not style.escape_sequence:
+        return text
+    return f'{style.escape_sequence}{text}{RESET}'
+
+
+class StyledText:
+    """ Builder merging consecutively appended, equally styled texts into runs,
+        each of which is rendered as a single escape sequence, text and reset
+
+        >>> text = StyledText().append('(', None).append('q', Style('red')).append(')', None).append('uit', Style('red'))
+        >>> text.n_runs
+        4
+        >>> StyledText().append_masked('stratto', [False, False, True, True, False, False, False], Style('red')).n_runs
+        3 """
+
+    def __init__(self):
+        self._runs: List[Tuple[Optional[Style], List[str]]] = []
+
+    def append(self, text: str, style: Optional[Style] = None) -> StyledText:
+        if text:
+            if self._runs and self._runs[-1][0] == style:
+                self._runs[-1][1].append(text)
+            else:
+                self._runs.append((style, [text]))
+        return self
+
+    def append_masked(self,
+                      string: str,
+                      char_mask: Iterable[bool],
+                      style: Optional[Style],
+                      fallback_style: Optional[Style] = None) -> StyledText:
+
+        """ Appends chars of string, styled by style where the corresponding char_mask
+            element is True, by fallback_style otherwise; chars exceeding char_mask
+            are appended unstyled """
+
+        n_masked_chars = 0
+        for apply, run in groupby(zip(char_mask, string), key=itemgetter(0)):
+            chars = str().join(char for _, char in run)
+            self.append(chars, style if apply else fallback_style)
+            n_masked_chars += len(chars)
+        return self.append(string[n_masked_chars:])
+
+    @property
+    def n_runs(self) -> int:
+        return len(self._runs)
+
+    def __str__(self) -> str:
+        colorize = _colorization_enabled()
+        return str().join(_styled(str().join(texts), style, colorize) for style, texts in self._runs)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, TextIO
+import os
+import sys
+
+
+_ESC = '\033'
+_CSI = f'{_ESC}['
+_OSC = f'{_ESC}]'
+_BEL = '\a'
+
+_CURSOR_HOME = f'{_CSI}H'
+_ERASE_SCREEN = f'{_CSI}2J'
+_ERASE_SCROLLBACK = f'{_CSI}3J'
+_ERASE_BELOW = f'{_CSI}J'
+_ERASE_LINE = f'{_CSI}2K'
+_HIDE_CURSOR = f'{_CSI}?25l'
+_SHOW_CURSOR = f'{_CSI}?25h'
+_MAXIMIZE_WINDOW = f'{_CSI}9;1t'
+
+
+# ------------------
+# Capabilities
+# ------------------
+@dataclass(frozen=True)
+class Capabilities:
+    ansi: bool
+    title: bool
+
+
+_ANSI_INCAPABLE_TERMS = {'', 'dumb'}
+_TITLE_INCAPABLE_TERMS = {'linux', 'cons25'}  # virtual consoles
+
+
+def _detect_capabilities(stream: Optional[TextIO]) -> Capabilities:
+    try:
+        is_tty = stream is not None and stream.isatty()
+    except (AttributeError, ValueError):  # detached/closed streams
+        is_tty = False
+
+    term = os.environ.get('TERM', '')
+    ansi = is_tty and term not in _ANSI_INCAPABLE_TERMS
+    return Capabilities(ansi=ansi, title=ansi and term not in _TITLE_INCAPABLE_TERMS)
+
+
+_stdout_capabilities: Capabilities | None = None
+
+
+def capabilities() -> Capabilities:
+    """ Returns:
+            capabilities of the stream sys.stdout is currently pointing to,
+            cached for the original stdout, being determined anew if the latter
+            has been replaced, as is the case during doctests
+
+        >>> capabilities()
+        Capabilities(ansi=False, title=False) """
+
+    global _stdout_capabilities
+
+    if sys.stdout is not sys.__stdout__:
+        return _detect_capabilities(sys.stdout)
+
+    if _stdout_capabilities is None:
+        _stdout_capabilities = _detect_capabilities(sys.stdout)
+    return _stdout_capabilities
+
+
+# ------------------
+# Operations
+# ------------------
+def _emit(*sequences: str):
+    """ Writes sequences to stdout in a single batch, no-op if stdout not being
+        connected to an ANSI capable terminal, thereby sparing both the spawning
+        of processes such as clear/wmctrl and the pollution of redirected output """
+
+    if capabilities().ansi:
+        sys.stdout.write(str().join(sequences))
+        if not getattr(sys.stdout, 'defers_flushes', False):
+            sys.stdout.flush()
+
+
+def clear_screen():
+    _emit(_CURSOR_HOME, _ERASE_SCREEN, _ERASE_SCROLLBACK)
+
+
+def erase_lines(n_lines: int):
+    """ Erases the current line alongside the n_lines preceding it, placing the
+        cursor at the beginning of the uppermost erased line """
+
+    _emit('\n', cursor_to_previous_line(n_lines + 1), _ERASE_BELOW)
+
+
+def move_cursor_up(n_lines: int):
+    if n_lines:
+        _emit(f'{_CSI}{n_lines}A')
+
+
+def hide_cursor():
+    _emit(_HIDE_CURSOR)
+
+
+def show_cursor():
+    _emit(_SHOW_CURSOR)
+
+
+def set_title(title: str):
+    if capabilities().title:
+        _emit(f'{_OSC}0;{title}{_BEL}')
+
+
+def maximize_window():
+    if capabilities().title:
+        _emit(_MAXIMIZE_WINDOW)
+
+
+def cursor_to_previous_line(n_lines: int) -> str:
+    """ Returns:
+            sequence moving the cursor to the beginning of the line
+            lying n_lines above the current one """
+
+    return f'{_CSI}{n_lines}F'
+
+
+def cursor_to_next_line(n_lines: int) -> str:
+    """ Returns:
+            sequence moving the cursor to the beginning of the line
+            lying n_lines beneath the current one """
+
+    return f'{_CSI}{n_lines}E'
+
+
+def deleted_lines(n_lines: int) -> str:
+    """ Returns:
+            sequence deleting n_lines, starting at the current one, moving
+            the lines beneath them up """
+
+    return f'{_CSI}{n_lines}M'
@@ -1,20 +1,32 @@
-from typing import Union, Deque, List
+from typing import Union, Deque, Iterator, List
 from abc import ABC
 from collections import deque
 
 from .clearing import erase_lines
-from ._utils import _output_length, _terminal_columns
+from .framing import repaint, Row
+from ._utils import _terminal_columns, display_width
 
 
 class LineCounter(ABC):
     """ Interface for classes being capable of buffering the output
         passed to them and counting the number of rows
-        the output of the aforementioned resulted in """
+        the output of the aforementioned resulted in
+
+        Retains the output lengths of the newline delimited rows of each
+        buffer element alongside the latter, as well as the number of terminal
+        rows occupied by the entire buffer, updating both incrementally and
+        recounting the terminal rows merely on change of the terminal width """
 
     def __init__(self, buffer_container: Union[List, Deque]):
         self._buffer: Union[List, Deque] = buffer_container
         self._append_to_last_element: bool = False
 
+        # per buffer element: output lengths of its newline delimited rows
+        self._row_output_lengths: Union[List[List[int]], Deque[List[int]]] = type(buffer_container)()
+
+        self._n_terminal_rows = 0
+        self._terminal_columns = _terminal_columns()
+
     @property
     def _n_buffered_terminal_rows(self) -> int:
         """ Returns:
@@ -31,29 +43,75 @@ class LineCounter(ABC):
             >>> line_counter._n_buffered_terminal_rows
             4 """
 
-        return sum(map(self._n_comprised_terminal_output_rows, self._buffer))
+        self._recount_on_terminal_width_change()
+        return self._n_terminal_rows
 
-    @staticmethod
-    def _n_comprised_terminal_output_rows(buffer_element: str) -> int:
-        newline_delimited_rows = buffer_element.split('\n')
-        return len(newline_delimited_rows) + sum(map(LineCounter._n_additionally_occupied_terminal_rows, newline_delimited_rows))
+    def _recount_on_terminal_width_change(self):
+        if (terminal_columns := _terminal_columns()) != self._terminal_columns:
+            self._terminal_columns = terminal_columns
+            self._n_terminal_rows = sum(map(self._n_occupied_terminal_rows, self._row_output_lengths))
+
+    def _n_occupied_terminal_rows(self, row_output_lengths: List[int]) -> int:
+        return sum(1 + row_output_length // self._terminal_columns for row_output_length in row_output_lengths)
 
     @staticmethod
-    def _n_additionally_occupied_terminal_rows(buffer_element: str) -> int:
-        return _output_length(buffer_element) // _terminal_columns()
+    def _row_output_lengths_of(output: str) -> List[int]:
+        """ >>> LineCounter._row_output_lengths_of('first\\n\\tsecond')
+            [5, 10] """
+
+        return list(map(display_width, output.split('\n')))
+
+    def _rows(self) -> Iterator[Row]:
+        """ Yields:
+                newline delimited rows of the buffer elements alongside their output lengths """
+
+        for element, row_output_lengths in zip(self._buffer, self._row_output_lengths):
+            yield from zip(element.split('\n'), row_output_lengths)
+
+    def _append(self, output: str):
+        row_output_lengths = self._row_output_lengths_of(output)
+
+        self._buffer.append(output)
+        self._row_output_lengths.append(row_output_lengths)
+        self._n_terminal_rows += self._n_occupied_terminal_rows(row_output_lengths)
+
+    def _append_to_last(self, output: str):
+        """ Continues the last row of the last buffer element by the first row of output """
+
+        first_row_output_length, *subsequent_row_output_lengths = self._row_output_lengths_of(output)
+        last_element_row_output_lengths = self._row_output_lengths[-1]
+
+        self._n_terminal_rows -= self._n_occupied_terminal_rows(last_element_row_output_lengths[-1:])
+        last_element_row_output_lengths[-1] += first_row_output_length
+        self._n_terminal_rows += self._n_occupied_terminal_rows(last_element_row_output_lengths[-1:] + subsequent_row_output_lengths)
+        last_element_row_output_lengths.extend(subsequent_row_output_lengths)
+
+        self._buffer[-1] += output
+
+    def _popleft(self):
+        self._buffer.popleft()  # type: ignore
+        self._n_terminal_rows -= self._n_occupied_terminal_rows(self._row_output_lengths.popleft())  # type: ignore
+
+    def _clear(self):
+        self._buffer.clear()
+        self._row_output_lengths.clear()
+        self._n_terminal_rows = 0
 
     def __call__(self, *args, end='\n'):
         """ Buffer and display passed print arguments """
 
         joined_output = ' '.join(args)
 
+        # count rows with respect to the current terminal width
+        self._recount_on_terminal_width_change()
+
         # append joined output to last buffer element if
         # _append_to_last_element set to True,
         # otherwise append to buffer
         if self._append_to_last_element:
-            self._buffer[-1] += joined_output
+            self._append_to_last(joined_output)
         else:
-            self._buffer.append(joined_output)
+            self._append(joined_output)
 
         # reset flag
         self._append_to_last_element = False
@@ -78,7 +136,7 @@ class UndoPrint(LineCounter):
 
     def undo(self):
         erase_lines(self._n_buffered_terminal_rows)
-        self._buffer.clear()
+        self._clear()
         self._append_to_last_element = False
 
     def add_rows_to_buffer(self, n_rows: int):
@@ -87,8 +145,9 @@ class UndoPrint(LineCounter):
 
         self._append_to_last_element = False
 
+        self._recount_on_terminal_width_change()
         for _ in range(n_rows):
-            self._buffer.append('')
+            self._append('')
 
 
 class RedoPrint(LineCounter):
@@ -110,14 +169,16 @@ class RedoPrint(LineCounter):
             third
             >>> redo_print.redo_partially(1)
             second
-            third """
+            third
 
-        erase_lines(self._n_buffered_terminal_rows)
+            Repaints merely the rows deviating from the displayed ones """
+
+        painted_rows = list(self._rows())
 
         for _ in range(n_deletion_rows):
-            self._buffer.popleft()  # type: ignore
+            self._popleft()
 
-        self.redo()
+        repaint(painted_rows, list(self._rows()))
 
     def redo(self):
         for line in self._buffer:
@@ -13,6 +13,7 @@ def indicate_erroneous_input(message=_INDISSOLUBILITY_MESSAGE, n_deletion_lines=
         - erase n_deletion_rows last rows or clear screen if n_deletion_rows = -1 """
 
     output.centered(f'\n{message}')
+    output.flush()
 
     time.sleep(sleep_duration)
 
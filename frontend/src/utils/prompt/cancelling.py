@@ -1,30 +1,17 @@
-from pynput import keyboard
+from __future__ import annotations
 
+from typing import Callable, Optional
 
-QUERY_CANCELLED = '{QUERY_CANCELLED}'
-
-
-def _cancelable(prompt: str) -> str:
-    print(prompt, end='', flush=True)
-
-    if _escape_key_pressed():
-        return QUERY_CANCELLED
+from frontend.src.utils.prompt.input_reader import input_reader
 
-    return _escape_unicode_stripped(input(''))
 
+QUERY_CANCELLED = '{QUERY_CANCELLED}'
 
-def _escape_key_pressed() -> bool:
-    pressed_key = None
-
-    def on_press(key):
-        nonlocal pressed_key
-        pressed_key = key
-        return False
-
-    with keyboard.Listener(on_press=on_press) as listener:
-        listener.join()
 
-    return pressed_key == keyboard.Key.esc
+def _cancelable(prompt: str, prefill: str = '', completion: Callable[[str], Optional[str]] | None = None) -> str:
+    if (response := input_reader.read_line(prompt, cancelable=True, prefill=prefill, completion=completion)) is None:
+        return QUERY_CANCELLED
+    return _escape_unicode_stripped(response)
 
 
 def _escape_unicode_stripped(string: str) -> str:
@@ -0,0 +1,256 @@
+""" Keystroke reader operating on stdin in non-canonical, non-echoing mode,
+    thus detecting ESC, arrow strokes and the like without requiring a
+    connection to an X server """
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum, auto
+from typing import Callable, Deque, Iterator, Optional, Union
+import codecs
+import os
+import select
+import sys
+import termios
+
+from frontend.src.utils.output._utils import display_width
+
+
+class Key(Enum):
+    Escape = auto()
+    Enter = auto()
+    Backspace = auto()
+    Delete = auto()
+    Tab = auto()
+    Up = auto()
+    Down = auto()
+    Right = auto()
+    Left = auto()
+    Home = auto()
+    End = auto()
+
+
+KeyStroke = Union[str, Key]
+
+_ESCAPE = '\x1b'
+
+_CONTROL_CHAR_2_KEY = {'\r': Key.Enter, '\n': Key.Enter, '\x7f': Key.Backspace, '\x08': Key.Backspace, '\t': Key.Tab}
+_CSI_FINAL_CHAR_2_KEY = {'A': Key.Up, 'B': Key.Down, 'C': Key.Right, 'D': Key.Left, 'H': Key.Home, 'F': Key.End}
+_CSI_TILDE_PARAMETER_2_KEY = {'1': Key.Home, '7': Key.Home, '4': Key.End, '8': Key.End, '3': Key.Delete}
+
+
+class KeyDecoder:
+    """ Incrementally decodes UTF-8 encoded terminal input into keystrokes
+
+        >>> decoder = KeyDecoder()
+        >>> decoder.feed(b'a\\x1b[A\\xc3'), decoder.feed(b'\\xa4\\r\\x1b')
+        (['a', <Key.Up: 6>], ['ä', <Key.Enter: 2>])
+        >>> decoder.pending_escape, decoder.flush()
+        (True, [<Key.Escape: 1>]) """
+
+    def __init__(self):
+        self._utf8_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._pending_chars = ''
+
+    @property
+    def pending_escape(self) -> bool:
+        """ Whether decoded chars end on an escape sequence, which is yet to be
+            either completed or flushed as lone ESC stroke """
+
+        return bool(self._pending_chars)
+
+    def feed(self, data: bytes) -> list[KeyStroke]:
+        self._pending_chars += self._utf8_decoder.decode(data)
+
+        keys = []
+        while self._pending_chars:
+            key, n_consumed_chars = _decoded_key(self._pending_chars)
+            if not n_consumed_chars:
+                break
+
+            if key is not None:
+                keys.append(key)
+            self._pending_chars = self._pending_chars[n_consumed_chars:]
+        return keys
+
+    def flush(self) -> list[KeyStroke]:
+        """ Returns:
+                incomplete escape sequence as ESC stroke, followed by the chars succeeding it """
+
+        pending_chars, self._pending_chars = self._pending_chars, ''
+        if not pending_chars:
+            return []
+        return [Key.Escape] + self.feed(pending_chars[1:].encode())
+
+
+def _decoded_key(chars: str) -> tuple[Optional[KeyStroke], int]:
+    """ Returns:
+            key corresponding to the beginning of chars, None if not of
+            interest, number of consumed chars, 0 if incomplete """
+
+    if chars[0] != _ESCAPE:
+        return _CONTROL_CHAR_2_KEY.get(chars[0], chars[0]), 1
+    elif len(chars) == 1:
+        return None, 0
+    elif chars[1] not in '[O':
+        return Key.Escape, 1
+
+    # CSI/SS3 sequence: parameter chars, terminated by final char
+    i = 2
+    while i < len(chars) and '0' <= chars[i] <= '?':
+        i += 1
+    if i == len(chars):
+        return None, 0
+
+    parameters, final_char = chars[2:i], chars[i]
+    if final_char == '~':
+        return _CSI_TILDE_PARAMETER_2_KEY.get(parameters.split(';')[0]), i + 1
+    return _CSI_FINAL_CHAR_2_KEY.get(final_char), i + 1
+
+
+class InputReader:
+    """ Long-lived reader retaining keystrokes typed ahead of a query
+
+        Blocks within select whilst awaiting input, thus not consuming any
+        cpu time whilst idle """
+
+    _ESCAPE_SEQUENCE_TIMEOUT = 0.05
+
+    def __init__(self):
+        self._decoder = KeyDecoder()
+        self._keys: Deque[KeyStroke] = deque()
+
+    @property
+    def _fd(self) -> int:
+        return sys.stdin.fileno()
+
+    @property
+    def available(self) -> bool:
+        try:
+            return os.isatty(self._fd)
+        except (AttributeError, ValueError, OSError):
+            return False
+
+    @contextmanager
+    def _non_canonical_mode(self) -> Iterator[None]:
+        attributes = termios.tcgetattr(self._fd)
+
+        non_canonical_attributes = termios.tcgetattr(self._fd)
+        non_canonical_attributes[3] &= ~(termios.ICANON | termios.ECHO)
+        non_canonical_attributes[6][termios.VMIN] = 1
+        non_canonical_attributes[6][termios.VTIME] = 0
+
+        termios.tcsetattr(self._fd, termios.TCSANOW, non_canonical_attributes)
+        try:
+            yield
+        finally:
+            termios.tcsetattr(self._fd, termios.TCSANOW, attributes)
+
+    def read_key(self) -> KeyStroke:
+        """ To be invoked within non-canonical mode """
+
+        while not self._keys:
+            select.select([self._fd], [], [])
+            self._keys.extend(self._decoder.feed(os.read(self._fd, 1024)))
+
+            # await remainder of escape sequence, otherwise regard as ESC stroke
+            if self._decoder.pending_escape and not select.select([self._fd], [], [], self._ESCAPE_SEQUENCE_TIMEOUT)[0]:
+                self._keys.extend(self._decoder.flush())
+
+        return self._keys.popleft()
+
+    def read_line(self,
+                  prompt: str = '',
+                  cancelable=False,
+                  prefill: str = '',
+                  completion: Callable[[str], Optional[str]] | None = None) -> Optional[str]:
+
+        """ Args:
+                prompt: to be displayed
+                cancelable: whether or not to enable canceling by means of an ESC stroke
+                prefill: editable text the line is to be initialized with
+                completion: invoked with the line after each typed char, returning
+                    the string the line is to be completed and returned as if any
+
+            Returns:
+                entered line, None if cancelled """
+
+        if not self.available:
+            return _fallback_line(prompt, prefill)
+
+        chars = list(prefill)
+        cursor = len(chars)
+        _write(prompt + prefill)
+
+        with self._non_canonical_mode():
+            while (key := self.read_key()) is not Key.Enter:
+                if key is Key.Escape and cancelable:
+                    return None
+
+                elif key is Key.Left and cursor:
+                    cursor -= 1
+                    _write(_cursor_back(display_width(chars[cursor])))
+
+                elif key is Key.Right and cursor < len(chars):
+                    _write(chars[cursor])
+                    cursor += 1
+
+                elif key is Key.Home:
+                    _write(_cursor_back(display_width(''.join(chars[:cursor]))))
+                    cursor = 0
+
+                elif key is Key.End:
+                    _write(''.join(chars[cursor:]))
+                    cursor = len(chars)
+
+                elif key is Key.Backspace and cursor:
+                    cursor -= 1
+                    erased_char = chars.pop(cursor)
+                    _write(_cursor_back(display_width(erased_char)) + _rewritten_tail(chars[cursor:], n_erased_columns=display_width(erased_char)))
+
+                elif key is Key.Delete and cursor < len(chars):
+                    erased_char = chars.pop(cursor)
+                    _write(_rewritten_tail(chars[cursor:], n_erased_columns=display_width(erased_char)))
+
+                elif isinstance(key, str) and key.isprintable():
+                    chars.insert(cursor, key)
+                    cursor += 1
+                    _write(key + _rewritten_tail(chars[cursor:], n_erased_columns=0))
+
+                    if completion is not None and (completed_line := completion(''.join(chars))) is not None:
+                        _write(f'{"".join(chars[cursor:])}{completed_line[len(chars):]}\n')
+                        return completed_line
+
+        _write(''.join(chars[cursor:]) + '\n')
+        return ''.join(chars)
+
+
+def _fallback_line(prompt: str, prefill: str) -> str:
+    """ Returns:
+            line read from stdin not being connected to a terminal, prefill if empty """
+
+    if not prefill:
+        return input(prompt)
+    return input(f'{prompt}[{prefill}] ') or prefill
+
+
+def _rewritten_tail(tail: list[str], n_erased_columns: int) -> str:
+    """ Returns:
+            string rewriting tail succeeding the cursor, blanking the n_erased_columns
+            following it and returning the cursor to its position """
+
+    rewritten = ''.join(tail) + ' ' * n_erased_columns
+    return rewritten + _cursor_back(display_width(rewritten))
+
+
+def _cursor_back(n_columns: int) -> str:
+    return f'{_ESCAPE}[{n_columns}D' if n_columns else ''
+
+
+def _write(string: str):
+    sys.stdout.write(string)
+    sys.stdout.flush()
+
+
+input_reader = InputReader()
@@ -1,24 +1,31 @@
-from typing import Optional, Sequence, Callable, Iterable, Tuple, Any
+from __future__ import annotations
+
+from typing import Optional, Sequence, Callable, Tuple, Any
 
 from frontend.src.utils import output
 from frontend.src.utils.prompt.cancelling import QUERY_CANCELLED, _cancelable, _escape_unicode_stripped
+from frontend.src.utils.prompt.input_reader import input_reader
 from frontend.src.utils.prompt._ops import indicate_erroneous_input, _INDISSOLUBILITY_MESSAGE
+from frontend.src.utils.prompt.resolution import OptionResolver
 
 
 def prompt_relentlessly(prompt: str = '',
                         indentation_percentage=0.0,
                         prompt_display_function: Optional[Callable] = None,
-                        options: Optional[Sequence[str]] = None,
+                        options: Optional[Sequence[str] | OptionResolver] = None,
                         applicability_verifier: Optional[Callable[[str], bool]] = None,
                         error_indication_message=_INDISSOLUBILITY_MESSAGE,
                         sleep_duration=1.0,
                         cancelable=False,
-                        n_deletion_rows=2) -> str:
+                        n_deletion_rows=2,
+                        single_key=False,
+                        prefill: str = '') -> str:
 
     """ Args:
             prompt: to be repeatedly displayed on query
             prompt_display_function: will be repeatedly invoked alongside display of prompt if passed
-            options: eligible options, one of which ought to be selected
+            options: eligible options, one of which ought to be selected, compiled into
+                an OptionResolver if not passed as such
             applicability_verifier: function verifying applicability of entered response
                 Note: either one of options/applicability_verifier has to be passed
             indentation_percentage: of display prompt
@@ -26,6 +33,9 @@ def prompt_relentlessly(prompt: str = '',
             sleep_duration: after display of error_indication_message
             cancelable: whether or not to enable canceling the query by means of an ESC stroke
             n_deletion_rows: n previous rows to be deleted before query repetition
+            single_key: whether or not to return an option as soon as the typed chars
+                unambiguously identify it, without awaiting an Enter stroke
+            prefill: editable text the response is to be initialized with
 
         Repeats query until response either unambiguously identifiable
         amongst passed options, or causing correctness verifier
@@ -37,6 +47,9 @@ def prompt_relentlessly(prompt: str = '',
 
     assert bool(options) ^ bool(applicability_verifier)
 
+    if options:
+        options = OptionResolver.of(options)
+
     # save args in case of repetition necessity occurring
     args = tuple(locals().values())
 
@@ -48,50 +61,24 @@ def prompt_relentlessly(prompt: str = '',
     if indentation_percentage:
         prompt = f'{output.column_percentual_indentation(indentation_percentage)}{prompt}'
 
+    completion = options.unambiguous_completion if single_key and options else None  # type: ignore
+
     # query in a cancelable manner if applicable, otherwise normally
     if cancelable:
-        if (response := _cancelable(prompt)) == QUERY_CANCELLED:
+        if (response := _cancelable(prompt, prefill=prefill, completion=completion)) == QUERY_CANCELLED:
             return QUERY_CANCELLED
     else:
-        response = _escape_unicode_stripped(input(prompt))
+        response = _escape_unicode_stripped(input_reader.read_line(prompt, prefill=prefill, completion=completion))  # type: ignore
 
     # return given response if either unambiguously identifiable element of options or
     # applicability verified, otherwise trigger repetition
-    if options and (resolved_response := _resolve_input(response, options=options)) is not None:
+    if options and (resolved_response := options.resolve(response)) is not None:  # type: ignore
         return resolved_response
     elif applicability_verifier and applicability_verifier(response):
         return response
     return _repeat(prompt_relentlessly, n_deletion_rows=n_deletion_rows, message=error_indication_message, args=args)
 
 
-def _resolve_input(_input: str, options: Iterable[str]) -> Optional[str]:
-    """ Attempts to resolve targeted options element by means of _input
-
-        cases of both _input and options will be leveled, however identified
-        options element returned in original case
-
-        Returns:
-            element of options if unambiguously identifiable, otherwise None
-
-        >>> _resolve_input('it', options=['Italian', 'French'])
-        'Italian'
-        >>> _resolve_input('It', options=['Italian', 'French'])
-        'Italian'
-        >>> _resolve_input('It', options=['italian', 'french'])
-        'italian'
-        >>> _resolve_input('i', options=['Italian', 'Icelandic'])
-        """
-
-    processed_input = _input.lower().strip()
-    options_starting_on_input = list(filter(lambda option: option.lower().startswith(processed_input), options))
-
-    if len(options_starting_on_input) == 1:
-        return options_starting_on_input[0]
-    elif processed_input in options_starting_on_input:
-        return _input
-    return None
-
-
 def _repeat(function: Callable,
             n_deletion_rows: int,
             message=_INDISSOLUBILITY_MESSAGE,
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import Iterator, Optional, Sequence
+
+
+class _TrieNode:
+    __slots__ = ('children', 'n_options', 'option')
+
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        self.n_options = 0
+        self.option: Optional[str] = None  # original case option, if the only one beneath node
+
+
+class OptionResolver(Sequence[str]):
+    """ Options compiled into a prefix trie over their lowercase forms, each node of
+        which holds the number of options beneath it, thus resolving an input in time
+        proportional to its length rather than to the number of options
+
+        >>> resolver = OptionResolver(['Italian', 'Icelandic', 'French'])
+        >>> resolver.resolve('it'), resolver.resolve('FR'), resolver.resolve('i'), resolver.resolve('Spanish')
+        ('Italian', 'French', None, None) """
+
+    def __init__(self, options: Sequence[str]):
+        self._options = list(options)
+        self._option_set = set(self._options)
+
+        self._root = _TrieNode()
+        for option in self._options:
+            self._insert(option)
+
+    def _insert(self, option: str):
+        for node in self._path(option.lower(), create=True):
+            node.n_options += 1
+            node.option = option if node.n_options == 1 else None
+
+    def _path(self, key: str, create=False) -> Iterator[_TrieNode]:
+        """ Yields:
+                root, as well as the nodes corresponding to the successive chars of key,
+                stopping at the first nonexistent one if not create """
+
+        node = self._root
+        yield node
+        for char in key:
+            if (child := node.children.get(char)) is None:
+                if not create:
+                    return
+                child = node.children[char] = _TrieNode()
+            node = child
+            yield node
+
+    def resolve(self, _input: str) -> Optional[str]:
+        """ Attempts to resolve targeted option by means of _input
+
+            cases of both _input and options will be leveled, however identified
+            option returned in original case
+
+            Returns:
+                option if unambiguously identifiable, _input if equaling the processed
+                input of an ambiguous option, otherwise None
+
+            >>> OptionResolver(['italian', 'french']).resolve('It')
+            'italian'
+            >>> OptionResolver(['no', 'nope']).resolve('No ')
+            'No ' """
+
+        processed_input = _input.lower().strip()
+
+        if (node := self._node(processed_input)) is None:
+            return None
+        elif node.n_options == 1:
+            return node.option
+        elif processed_input in self._option_set:
+            return _input
+        return None
+
+    def unambiguous_completion(self, _input: str) -> Optional[str]:
+        """ Returns:
+                option if the only one starting on the non-empty, processed _input
+
+            >>> resolver = OptionResolver(['add', 'alter', 'quit', ''])
+            >>> resolver.unambiguous_completion('q'), resolver.unambiguous_completion('a'), resolver.unambiguous_completion('')
+            ('quit', None, None) """
+
+        if not (processed_input := _input.lower().strip()) or (node := self._node(processed_input)) is None:
+            return None
+        return node.option if node.n_options == 1 else None
+
+    def _node(self, processed_input: str) -> Optional[_TrieNode]:
+        """ Returns:
+                node corresponding to processed_input, None if not prefix of any option """
+
+        for n_traversed_chars, node in enumerate(self._path(processed_input)):
+            pass
+
+        if n_traversed_chars < len(processed_input):
+            return None
+        return node
+
+    def __getitem__(self, index):
+        return self._options[index]
+
+    def __len__(self) -> int:
+        return len(self._options)
+
+    @classmethod
+    def of(cls, options: Sequence[str]) -> OptionResolver:
+        if isinstance(options, OptionResolver):
+            return options
+        return cls(options)
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import wraps
+from functools import lru_cache, wraps
+from pathlib import Path
 
 from backend.src.utils.io import PathLike
 from termcolor import colored
 
 from frontend.src.paths import RESOURCE_DIR_PATH
 from frontend.src.utils import output
+from frontend.src.utils.output._utils import _terminal_columns
 from frontend.src.utils.view import terminal
+from frontend.src.utils.view.render_cache import render_cache
 
 
 VERTICAL_OFFSET = '\n' * 2
 
+_BANNER_DIR_PATH = RESOURCE_DIR_PATH / 'banners'
+
 
 @dataclass(frozen=True)
 class Banner:
@@ -20,10 +25,48 @@ class Banner:
     color: str
 
     def display(self):
-        with open(RESOURCE_DIR_PATH / 'banners' / f'{self.kind}.txt') as f:
+        render_cache.display(
+            key=(str(self.kind), self.color, _banner_file_path(self.kind).stat().st_mtime_ns),
+            render=self._render
+        )
+
+    def _render(self):
+        with open(_banner_file_path(_fitting_banner_kind(self.kind, columns=_terminal_columns()))) as f:
             output.centered(colored(f.read(), self.color))
 
 
+def _banner_file_path(kind: PathLike) -> Path:
+    return _BANNER_DIR_PATH / f'{kind}.txt'
+
+
+@lru_cache
+def _banner_width(kind: PathLike) -> int:
+    with open(_banner_file_path(kind)) as f:
+        return max(map(len, f.read().splitlines()))
+
+
+def _fitting_banner_kind(kind: PathLike, columns: int) -> PathLike:
+    """ Returns:
+            kind if fitting into terminal of columns width, otherwise the widest
+            banner variant residing within the same directory which does, or the
+            narrowest one if none does
+
+        >>> _fitting_banner_kind('lingularity/impossible', columns=100)
+        'lingularity/5line-oblique'
+        >>> _fitting_banner_kind('lingularity/impossible', columns=10)
+        'lingularity/three-point' """
+
+    if _banner_width(kind) <= columns:
+        return kind
+
+    banner_directory = Path(kind).parent
+    variants = sorted(
+        (str(banner_directory / file_path.stem) for file_path in (_BANNER_DIR_PATH / banner_directory).glob('*.txt')),
+        key=_banner_width
+    )
+    return next((variant for variant in reversed(variants) if _banner_width(variant) <= columns), variants[0])
+
+
 def creator(title: str | None = None,
             header: str | None = None,
             banner: Banner | None = None,
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from contextlib import redirect_stdout
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Hashable
+import atexit
+import io
+import pickle
+import sys
+
+from frontend.src.utils.output._utils import _terminal_columns
+
+
+class _StdoutCapture(io.StringIO):
+    """ Poses as the terminal stdout is connected to, such that
+        terminal dependent output, e.g. termcolor colorings, gets
+        rendered in the same fashion as it would be if displayed directly """
+
+    def isatty(self) -> bool:
+        return sys.__stdout__ is not None and sys.__stdout__.isatty()
+
+
+class RenderCache:
+    """ Stores the final output of renderings, i.e. centered and colored
+        strings, for the current terminal width, such that consecutive displays
+        boil down to a single write
+
+        Renderings are invalidated on change of the terminal width """
+
+    def __init__(self):
+        self._columns: int | None = None
+        self._renderings: dict[Hashable, str] = {}
+
+    def display(self, key: Hashable, render: Callable[[], None]):
+        """ Displays output of render, which is captured and cached under key
+            on its first invocation for the current terminal width """
+
+        if (columns := _terminal_columns()) != self._columns:
+            self._columns = columns
+            self._renderings.clear()
+
+        if (rendering := self._renderings.get(key)) is None:
+            rendering = self._renderings[key] = _captured_output(render)
+
+        sys.stdout.write(rendering)
+        sys.stdout.flush()
+
+    def static(self, function: Callable[[], None]) -> Callable[[], None]:
+        """ Decorator for argumentless functions producing entirely static output,
+            whose renderings are cached henceforth
+
+            Cache key comprises the modification time of the module function
+            is defined in, thus invalidating persisted renderings on its alteration """
+
+        key = (function.__module__, function.__qualname__, _modification_time(Path(sys.modules[function.__module__].__file__)))  # type: ignore
+
+        @wraps(function)
+        def wrapper():
+            self.display(key, render=function)
+        return wrapper
+
+    # ------------------
+    # Persistence
+    # ------------------
+    def persist(self, file_path: Path):
+        """ Loads renderings stored at file_path if existent and
+            stores the current ones at program exit """
+
+        try:
+            with open(file_path, 'rb') as f:
+                self._columns, self._renderings = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, ValueError):
+            pass
+
+        atexit.register(self._store, file_path)
+
+    def _store(self, file_path: Path):
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, 'wb') as f:
+            pickle.dump((self._columns, self._renderings), f)
+
+
+def _captured_output(render: Callable[[], None]) -> str:
+    with redirect_stdout(_StdoutCapture()) as capture:
+        render()
+    return capture.getvalue()
+
+
+def _modification_time(file_path: Path) -> int:
+    return file_path.stat().st_mtime_ns
+
+
+render_cache = RenderCache()
@@ -1,10 +1,14 @@
-import subprocess
+from frontend.src.utils.output import terminal_control
 
 
 def set_title(title: str):
-    # TODO: fix on ubuntu 20.04
+    terminal_control.set_title(f'Lingularity - {title}')
 
-    subprocess.run(['wmctrl', '-r', ':ACTIVE:', '-N', f'"Lingularity - {title}"'])
+
+def maximize():
+    """ Line position not to be altered """
+
+    terminal_control.maximize_window()
 
 
 DEFAULT_TERMINAL_TITLE = 'Acquire Languages the Litboy Way'
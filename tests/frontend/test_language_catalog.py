@@ -0,0 +1,82 @@
+import importlib.metadata
+
+from frontend.src import language_catalog
+from frontend.src.language_catalog import _entry, LanguageCatalog, NormalizationQuality
+from frontend.src.utils.output import styling
+from frontend.src.utils.output._utils import ansi_escape_code_stripped
+
+
+def _catalog() -> LanguageCatalog:
+    return LanguageCatalog(
+        [
+            _entry('Italian', NormalizationQuality.High, tts_available=True, n_sentences=350),
+            _entry('Icelandic', NormalizationQuality.Low, tts_available=True, n_sentences=None),
+            _entry('French', NormalizationQuality.Medium, tts_available=False, n_sentences=2)
+        ]
+    )
+
+
+def test_label_rows(monkeypatch):
+    monkeypatch.setattr(styling, '_colorization_enabled', lambda: True)
+    catalog = _catalog()
+
+    assert list(map(ansi_escape_code_stripped, catalog.label_rows())) == ['French(2)', 'Icelandic(∞) Italian(350)']
+    assert list(map(ansi_escape_code_stripped, catalog.label_rows(excluded_languages={'French'}))) == ['Icelandic(∞) Italian(350)']
+    assert catalog.label_rows()[0] == '\033[35mFrench\033[0m(2)'
+    assert catalog.label_rows(reference=True)[0] == '\033[4;31mFrench\033[0m(2)'
+
+
+def test_label_rows_uncolored_if_colorization_disabled(monkeypatch):
+    monkeypatch.setattr(styling, '_colorization_enabled', lambda: False)
+
+    assert _catalog().label_rows() == ['French(2)', 'Icelandic(∞) Italian(350)']
+
+
+def test_load_builds_merely_on_version_key_change(tmp_path, monkeypatch):
+    n_builds = []
+    version_key = [1]
+
+    def build():
+        n_builds.append(None)
+        return _catalog()
+
+    monkeypatch.setattr(LanguageCatalog, 'build', build)
+    monkeypatch.setattr(language_catalog, '_version_key', lambda: version_key[0])
+
+    catalog_file_path = tmp_path / 'language-catalog.pickle'
+    for _ in range(3):
+        assert language_catalog.load(catalog_file_path).languages == ['French', 'Icelandic', 'Italian']
+    assert len(n_builds) == 1
+
+    version_key[0] = 2
+    language_catalog.load(catalog_file_path)
+    assert len(n_builds) == 2
+
+
+class FakeDistribution:
+    version = '0.1.0'
+
+    def __init__(self, record: str):
+        self.record = record
+
+    def read_text(self, file_name: str) -> str | None:
+        return self.record if file_name == 'RECORD' else None
+
+
+def test_backend_distribution_key_changes_on_reinstallation(monkeypatch):
+    distribution = FakeDistribution('backend/src/metadata/language-metadata.json,sha256=a,10\n')
+    monkeypatch.setattr(importlib.metadata, 'distribution', lambda name: distribution)
+
+    key = language_catalog._backend_distribution_key()
+    assert key == language_catalog._backend_distribution_key()
+
+    distribution.record = 'backend/src/metadata/language-metadata.json,sha256=b,10\n'
+    assert language_catalog._backend_distribution_key() != key
+
+
+def test_backend_distribution_key_none_if_not_installed(monkeypatch):
+    def distribution(name):
+        raise importlib.metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr(importlib.metadata, 'distribution', distribution)
+    assert language_catalog._backend_distribution_key() is None
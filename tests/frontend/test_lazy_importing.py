@@ -0,0 +1,55 @@
+import subprocess
+import sys
+
+
+_PRE_AUTHENTICATION_MODULES = (
+    'frontend.src.state',
+    'frontend.src.reentrypoint',
+    'frontend.src.logged_in_user',
+    'frontend.src.database_connection',
+    'frontend.src.model_downloads',
+    'frontend.src.navigation',
+    'frontend.src.state_snapshot',
+    'frontend.src.utils.view.render_cache',
+    'frontend.src.screen.authentication',
+    'frontend.src.screen.exit.on_connection_error',
+    'frontend.src.screen.exit.on_missing_internet'
+)
+
+_HEAVY_MODULE_PREFIXES = (
+    'frontend.src.trainer_frontends',
+    'frontend.src.screen.training_selection',
+    'frontend.src.screen.language_addition',
+    'backend.src.trainers',
+    'backend.src.components.tts',
+    'backend.src.ops.spacy_models',
+    'backend.src.ops.stemming',
+    'spacy'
+)
+
+
+def _modules_loaded_by(*module_names: str) -> set[str]:
+    """ Imports module_names in a pristine interpreter, the test
+        session itself having long since loaded the modules in question """
+
+    script = ';'.join(
+        ['import importlib, sys']
+        + [f'importlib.import_module({module_name!r})' for module_name in module_names]
+        + ['print("\\n".join(sys.modules))']
+    )
+    return set(subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout.split())
+
+
+def test_heavy_modules_not_loaded_before_authentication():
+    loaded_heavy_modules = {
+        module_name for module_name in _modules_loaded_by(*_PRE_AUTHENTICATION_MODULES)
+        if module_name.startswith(_HEAVY_MODULE_PREFIXES)
+    }
+    assert not loaded_heavy_modules
+
+
+def test_screen_package_import_defers_screen_modules():
+    assert not {
+        module_name for module_name in _modules_loaded_by('frontend.src.screen')
+        if module_name.startswith('frontend.src.screen.')
+    }
@@ -1,9 +1,50 @@
-from frontend.src.metadata import country_metadata, main_country_flag
+import json
+import os
 
+import pytest
 
-def test_country_metadata():
-    assert len(country_metadata) == 258
+from frontend.src import metadata
+from frontend.src.metadata import _built, main_country_flag
+
+
+@pytest.fixture(autouse=True)
+def cache_file_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata, '_CACHE_FILE_PATH', tmp_path / 'country-metadata.marshal')
+    metadata._indexes.cache_clear()
+    yield metadata._CACHE_FILE_PATH
+    metadata._indexes.cache_clear()
+
+
+def test_country_metadata(cache_file_path):
+    assert len(metadata.country_metadata) == 258
+    assert cache_file_path.exists()
 
 
 def test_main_country_flag():
-    assert main_country_flag('French') == '🇫🇷'
\ No newline at end of file
+    assert main_country_flag('French') == '🇫🇷'
+
+
+def test_indexes():
+    assert metadata.country('FR') == 'France'
+    assert metadata.ris_code('France') == 'FR'
+
+
+def test_load_rebuilds_merely_on_json_modification(tmp_path, monkeypatch):
+    country_metadata_path = tmp_path / 'country-metadata.json'
+    main_country_data_path = tmp_path / 'main-countries.json'
+    cache_file_path = tmp_path / 'country-metadata.marshal'
+
+    country_metadata_path.write_text(json.dumps({'France': {'flag': '🇫🇷', 'RIS': 'FR'}}), encoding='utf-8')
+    main_country_data_path.write_text(json.dumps({'French': 'France'}), encoding='utf-8')
+
+    built = []
+    monkeypatch.setattr(metadata, '_built', lambda *paths: built.append(None) or _built(*paths))
+
+    for _ in range(3):
+        assert metadata.load(country_metadata_path, main_country_data_path, cache_file_path).flag_by_language == {'French': '🇫🇷'}
+    assert len(built) == 1
+
+    main_country_data_path.write_text(json.dumps({'Breton': 'France'}), encoding='utf-8')
+    os.utime(main_country_data_path, ns=(0, 0))
+    assert metadata.load(country_metadata_path, main_country_data_path, cache_file_path).flag_by_language == {'Breton': '🇫🇷'}
+    assert len(built) == 2
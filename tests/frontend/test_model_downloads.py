@@ -0,0 +1,75 @@
+import json
+import sys
+
+import pytest
+
+from frontend.src import model_downloads
+from frontend.src.model_downloads import ModelDownloads
+
+
+def _exiting_command(exit_codes: dict[str, int], resumed_languages: list[str] | None = None):
+    def installation_command(language: str) -> list[str]:
+        if resumed_languages is not None:
+            resumed_languages.append(language)
+        return [sys.executable, '-c', f'import sys, time; time.sleep(0.2); print("{language}"); sys.exit({exit_codes[language]})']
+    return installation_command
+
+
+def test_model_downloads_persist_pending(tmp_path):
+    downloads = ModelDownloads(tmp_path, _exiting_command({'Italian': 0, 'Thai': 1}))
+    downloads.submit('Italian')
+    downloads.submit('Thai')
+
+    assert not downloads.ready('Italian')
+    assert downloads.ready('French')
+    assert downloads.status_rows() == ['Downloading Italian language model...', 'Downloading Thai language model...']
+    assert json.loads((tmp_path / 'pending.json').read_text()) == ['Italian', 'Thai']
+
+    assert downloads.wait('Italian', timeout=5)
+    assert not downloads.wait('Thai', timeout=5)
+    assert downloads.status_rows() == [f'Thai language model download failed, retrying on next startup, see {tmp_path / "Thai.log"}']
+    assert (tmp_path / 'Thai.log').read_text() == 'Thai\n'
+
+    # removal of installed languages from the pending ones being up to the installation process
+    resumed_languages: list[str] = []
+    resuming_downloads = ModelDownloads(tmp_path, _exiting_command({'Italian': 0, 'Thai': 0}, resumed_languages))
+    resuming_downloads.resume_pending()
+    resuming_downloads.wait('Thai', timeout=5)
+    assert resumed_languages == ['Italian', 'Thai']
+
+
+def test_failed_installation_resubmittable(tmp_path):
+    exit_codes = {'Thai': 1}
+    downloads = ModelDownloads(tmp_path, _exiting_command(exit_codes))
+
+    downloads.submit('Thai')
+    downloads.submit('Thai')
+    assert not downloads.wait('Thai', timeout=5)
+
+    exit_codes['Thai'] = 0
+    downloads.submit('Thai')
+    assert downloads.wait('Thai', timeout=5)
+
+
+def test_install_removes_pending_language(tmp_path):
+    installed_languages = []
+    model_downloads._add_pending(tmp_path, 'Italian')
+    model_downloads._add_pending(tmp_path, 'Thai')
+
+    model_downloads._install('Italian', tmp_path, download_model=installed_languages.append)
+    assert json.loads((tmp_path / 'pending.json').read_text()) == ['Thai']
+
+    # no longer pending, as having been installed by a preceding process
+    model_downloads._install('Italian', tmp_path, download_model=installed_languages.append)
+    assert installed_languages == ['Italian']
+
+
+def test_install_retains_pending_language_on_failure(tmp_path):
+    def download_model(language):
+        raise OSError('connection reset')
+
+    model_downloads._add_pending(tmp_path, 'Thai')
+
+    with pytest.raises(OSError):
+        model_downloads._install('Thai', tmp_path, download_model=download_model)
+    assert json.loads((tmp_path / 'pending.json').read_text()) == ['Thai']
@@ -0,0 +1,34 @@
+from frontend.src.navigation import Navigator, Transition
+from frontend.src.reentrypoint import ReentryPoint
+
+
+def test_navigator_loops_over_transitions():
+    n_sessions = 10_000
+    received_payloads = []
+
+    def training_selection(n_finished_sessions=0):
+        received_payloads.append(n_finished_sessions)
+        if n_finished_sessions == n_sessions:
+            return ReentryPoint.Exit
+        return Transition(ReentryPoint.TrainingSelection, payload=n_finished_sessions + 1)
+
+    navigator = Navigator(
+        {
+            ReentryPoint.Home: lambda: ReentryPoint.TrainingSelection,
+            ReentryPoint.TrainingSelection: training_selection,
+            ReentryPoint.Exit: lambda: None
+        },
+        n_retained_timings=3
+    )
+    recorded_destinations = []
+    navigator.transition_listeners.append(lambda timing: recorded_destinations.append(timing.destination))
+
+    navigator(ReentryPoint.Home)
+
+    assert received_payloads == list(range(n_sessions + 1))
+    assert len(recorded_destinations) == n_sessions + 3
+    assert [(timing.origin, timing.destination) for timing in navigator.timings] == [
+        (ReentryPoint.TrainingSelection, ReentryPoint.TrainingSelection),
+        (ReentryPoint.TrainingSelection, ReentryPoint.Exit),
+        (ReentryPoint.Exit, None)
+    ]
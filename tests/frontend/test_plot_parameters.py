@@ -0,0 +1,59 @@
+import datetime
+
+import pytest
+
+from frontend.src import plot_parameters
+
+
+@pytest.fixture(autouse=True)
+def windows(monkeypatch):
+    queried_windows = []
+    date = [datetime.date(2024, 3, 1)]
+
+    class _Date(datetime.date):
+        @classmethod
+        def today(cls):
+            return date[0]
+
+    def queried_training_chronic_window(trainer_shortform, dates):
+        queried_windows.append(list(dates)[-1])
+        return {str(date[0]): 10}
+
+    monkeypatch.setattr(plot_parameters.datetime, 'date', _Date)
+    monkeypatch.setattr(plot_parameters, '_chronic_window_key', lambda trainer_shortform: ('user', 'Italian', trainer_shortform, str(_Date.today())))
+    monkeypatch.setattr(plot_parameters, '_queried_training_chronic_window', queried_training_chronic_window)
+    monkeypatch.setattr(plot_parameters.database_connection, 'await_established', lambda: None)
+    monkeypatch.setattr(plot_parameters.database_connection, 'submit', lambda task: task())
+    monkeypatch.setattr(plot_parameters, '_training_chronic_windows', {})
+    return queried_windows, date
+
+
+def test_session_merged_into_window_fetched_prior_to_upsert(windows):
+    queried_windows, _ = windows
+
+    plot_parameters.prefetch_training_chronic_window('v')
+    plot_parameters.merge_session_into_training_chronic_window('v', n_faced_items=5, upserted_since=plot_parameters.time.monotonic())
+
+    assert plot_parameters.training_chronic_window('v') == {'2024-03-01': 15}
+    assert queried_windows == ['2024-03-01']
+
+
+def test_window_fetched_subsequent_to_upsert_is_queried_anew(windows):
+    queried_windows, _ = windows
+
+    upserted_since = plot_parameters.time.monotonic()
+    plot_parameters.prefetch_training_chronic_window('v')
+    plot_parameters.merge_session_into_training_chronic_window('v', n_faced_items=5, upserted_since=upserted_since)
+
+    assert plot_parameters.training_chronic_window('v') == {'2024-03-01': 10}
+    assert len(queried_windows) == 2
+
+
+def test_window_queried_anew_past_midnight(windows):
+    queried_windows, date = windows
+
+    plot_parameters.training_chronic_window('v')
+    date[0] = datetime.date(2024, 3, 2)
+
+    assert plot_parameters.training_chronic_window('v') == {'2024-03-02': 10}
+    assert queried_windows == ['2024-03-01', '2024-03-02']
@@ -0,0 +1,53 @@
+import tracemalloc
+
+from frontend.src.trainer_frontends.trainer_frontend import TrainerFrontend
+
+
+class ScriptedTrainerFrontend(TrainerFrontend):
+    def __init__(self, n_items: int):
+        self._quit_training = False
+        self._n_trained_items = 0
+
+        self._items = iter(range(n_items))
+        self.traced_memory_sizes: dict[int, int] = {}
+
+    def __call__(self):
+        self._training_loop()
+
+    def _display_training_screen_header_section(self):
+        pass
+
+    def _procured_training_item(self):
+        return next(self._items, None)
+
+    def _train_item(self, item: int):
+        response = f'response to item {item}' * 64
+        self._n_trained_items += bool(response)
+
+        if item in (1_000, 99_999):
+            self.traced_memory_sizes[item] = tracemalloc.get_traced_memory()[0]
+
+
+def test_training_loop_runs_unbounded_sessions_in_constant_memory():
+    trainer_frontend = ScriptedTrainerFrontend(n_items=100_000)
+
+    tracemalloc.start()
+    try:
+        trainer_frontend()
+    finally:
+        tracemalloc.stop()
+
+    assert trainer_frontend._n_trained_items == 100_000
+    assert trainer_frontend.traced_memory_sizes[99_999] - trainer_frontend.traced_memory_sizes[1_000] < 64 * 2 ** 10
+
+
+def test_training_quit_ends_loop():
+    class QuittingTrainerFrontend(ScriptedTrainerFrontend):
+        def _train_item(self, item: int):
+            self._n_trained_items += 1
+            self._quit_training = item == 2
+
+    trainer_frontend = QuittingTrainerFrontend(n_items=10)
+    trainer_frontend()
+
+    assert trainer_frontend._n_trained_items == 3
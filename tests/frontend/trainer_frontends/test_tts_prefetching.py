@@ -0,0 +1,157 @@
+import time
+
+from frontend.src.trainer_frontends.sentence_translation.tts_audio_cache import TTSAudioCache
+from frontend.src.trainer_frontends.sentence_translation.tts_prefetching import (
+    PipelinedTTSAudioPrefetcher,
+    SingleSlotTTSAudioPrefetcher,
+    tts_audio_prefetcher
+)
+
+
+class FakeTTSClient:
+    def __init__(self, synthesis_latency: float = 0.05):
+        self.language = 'Italian'
+        self.accent = 'US'
+        self.playback_speed = 1.0
+        self.played: list[tuple[bytes, float]] = []
+
+        self._synthesis_latency = synthesis_latency
+
+    def synthesize(self, text: str) -> bytes:
+        time.sleep(self._synthesis_latency)
+        return f'{text}|{self.accent}'.encode()
+
+    def play(self, audio: bytes):
+        self.played.append((audio, self.playback_speed))
+
+
+class FakeSingleSlotTTSClient:
+    def __init__(self):
+        self.played: list[str] = []
+        self._audio: str | None = None
+
+    def download_audio(self, text: str):
+        time.sleep(0.01)
+        self._audio = text
+
+    def play_audio(self):
+        self.played.append(self._audio)
+
+
+def test_prefetched_audio_played():
+    tts = FakeTTSClient()
+    prefetcher = tts_audio_prefetcher(tts)
+    assert isinstance(prefetcher, PipelinedTTSAudioPrefetcher)
+
+    prefetcher.prefetch(['Ciao', 'Buongiorno'])
+    time.sleep(0.2)
+
+    prefetcher.play('Ciao')
+    prefetcher.play('Buongiorno')
+    assert tts.played == [(b'Ciao|US', 1.0), (b'Buongiorno|US', 1.0)]
+    assert (prefetcher.n_hits, prefetcher.n_misses) == (2, 0)
+
+    prefetcher.close()
+
+
+def test_invalidation_on_accent_change():
+    tts = FakeTTSClient()
+    prefetcher = tts_audio_prefetcher(tts)
+
+    prefetcher.prefetch(['Ciao'])
+    time.sleep(0.1)
+
+    tts.accent = 'UK'
+    prefetcher.invalidate()
+    prefetcher.play('Ciao')
+    assert tts.played == [(b'Ciao|UK', 1.0)]
+
+    prefetcher.close()
+
+
+def test_prefetched_audio_played_at_altered_playback_speed():
+    tts = FakeTTSClient()
+    prefetcher = tts_audio_prefetcher(tts)
+
+    prefetcher.prefetch(['Ciao'])
+    time.sleep(0.1)
+
+    tts.playback_speed = 1.5
+    prefetcher.play('Ciao')
+    assert tts.played == [(b'Ciao|US', 1.5)]
+    assert prefetcher.n_hits == 1
+
+    prefetcher.close()
+
+
+def test_lookahead_adapts_to_synthesis_latency():
+    tts = FakeTTSClient(synthesis_latency=0.1)
+    prefetcher = PipelinedTTSAudioPrefetcher(tts, max_lookahead=6)
+    assert prefetcher.lookahead == 1
+
+    # play in quicker succession than audio can be synthesized
+    for i in range(5):
+        prefetcher.play(str(i))
+        time.sleep(0.01)
+    assert prefetcher.lookahead > 1
+
+    prefetcher.close()
+
+
+def test_single_slot_fallback():
+    tts = FakeSingleSlotTTSClient()
+    prefetcher = tts_audio_prefetcher(tts)
+    assert isinstance(prefetcher, SingleSlotTTSAudioPrefetcher)
+    assert prefetcher.lookahead == 0
+    assert prefetcher.cache is None
+
+    prefetcher.prefetch(['Ciao', 'Buongiorno'])
+    prefetcher.play('Ciao')
+    prefetcher.play('Buongiorno')
+    assert tts.played == ['Ciao', 'Buongiorno']
+
+    prefetcher.close()
+
+
+def test_skipped_prefetches_discarded():
+    tts = FakeTTSClient()
+    prefetcher = PipelinedTTSAudioPrefetcher(tts)
+
+    prefetcher.prefetch(['Ciao', 'Buongiorno'])
+    prefetcher.prefetch(['Arrivederci', 'Grazie'])
+    assert prefetcher._text_2_audio.keys() == {'Arrivederci', 'Grazie'}
+
+    prefetcher.close()
+
+
+def test_cached_audio_reused_across_sessions(tmp_path):
+    tts = FakeTTSClient(synthesis_latency=0)
+
+    for _ in range(2):
+        cache = TTSAudioCache(dir_path=tmp_path)
+        prefetcher = tts_audio_prefetcher(tts, create_cache=lambda: cache)
+        prefetcher.play('Ciao')
+        prefetcher.close()
+
+    assert (cache.n_hits, cache.n_misses) == (1, 0)
+    assert cache.n_saved_bytes == len(b'Ciao|US')
+
+    tts.accent = 'UK'
+    prefetcher = tts_audio_prefetcher(tts, create_cache=lambda: cache)
+    prefetcher.play('Ciao')
+    assert cache.n_misses == 1
+    assert tts.played[-1] == (b'Ciao|UK', 1.0)
+
+
+def test_least_recently_used_audio_evicted(tmp_path):
+    cache = TTSAudioCache(dir_path=tmp_path, max_bytes=25)
+
+    cache.put('a', b'0' * 10)
+    time.sleep(0.01)
+    cache.put('b', b'0' * 10)
+    time.sleep(0.01)
+    assert cache.get('a') is not None
+    cache.put('c', b'0' * 10)
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
@@ -0,0 +1,171 @@
+from types import SimpleNamespace
+import time
+
+from pymongo import errors
+import pytest
+
+from frontend.src.trainer_frontends import vocabulary_write_queue
+from frontend.src.trainer_frontends.vocabulary_write_queue import VocabularyWriteQueue
+
+
+class FakeVocabularyCollection:
+    def __init__(self):
+        self.writes: list[tuple] = []
+        self.failing_write_indices: set[int] = set()
+        self.failure: Exception = errors.AutoReconnect('connection lost')
+        self._n_attempted_writes = 0
+
+    def _write(self, *write):
+        self._n_attempted_writes += 1
+        if self._n_attempted_writes - 1 in self.failing_write_indices:
+            raise self.failure
+        self.writes.append(write)
+
+    def update_entry(self, vocable, score):
+        self._write('update_entry', vocable, score)
+
+    def upsert_entry(self, entry):
+        self._write('upsert_entry', entry.vocable)
+
+    def alter_entry(self, old_vocable, entry):
+        self._write('alter_entry', old_vocable, entry.vocable)
+
+    def delete_entry(self, entry):
+        self._write('delete_entry', entry.vocable)
+
+
+def _entry(vocable: str) -> SimpleNamespace:
+    return SimpleNamespace(vocable=vocable)
+
+
+@pytest.fixture
+def vocabulary_collection(monkeypatch) -> FakeVocabularyCollection:
+    collection = FakeVocabularyCollection()
+    user_database = SimpleNamespace(vocabulary_collection=collection)
+    monkeypatch.setattr(vocabulary_write_queue, 'UserDatabase', SimpleNamespace(instance=lambda: user_database))
+    return collection
+
+
+@pytest.fixture
+def queue(vocabulary_collection):
+    queue = VocabularyWriteQueue(flush_interval=3600)
+    yield queue
+    queue.close()
+
+
+def test_score_updates_coalesce(queue, vocabulary_collection):
+    queue.update_entry('il gatto', 1)
+    queue.update_entry('il cane', 1)
+    queue.update_entry('il gatto', 2)
+    queue.update_entry('il gatto', 3)
+
+    assert queue.depth == 2
+    queue.flush()
+
+    assert vocabulary_collection.writes == [('update_entry', 'il gatto', 3), ('update_entry', 'il cane', 1)]
+    assert queue.n_coalesced_writes == 2
+
+
+def test_score_updates_dont_coalesce_across_barriers(queue, vocabulary_collection):
+    queue.update_entry('il gatto', 1)
+    queue.upsert_entry(_entry('il gatto'))
+    queue.update_entry('il gatto', 2)
+    queue.alter_entry('il gatto', _entry('il gatto nero'))
+    queue.update_entry('il gatto', 3)
+    queue.delete_entry(_entry('il gatto'))
+    queue.update_entry('il gatto', 4)
+    queue.flush()
+
+    assert vocabulary_collection.writes == [
+        ('update_entry', 'il gatto', 1),
+        ('upsert_entry', 'il gatto'),
+        ('update_entry', 'il gatto', 2),
+        ('alter_entry', 'il gatto', 'il gatto nero'),
+        ('update_entry', 'il gatto', 3),
+        ('delete_entry', 'il gatto'),
+        ('update_entry', 'il gatto', 4)
+    ]
+    assert queue.n_coalesced_writes == 0
+
+
+def test_failed_writes_are_retried_in_order(queue, vocabulary_collection):
+    vocabulary_collection.failing_write_indices = {1}
+
+    queue.upsert_entry(_entry('il gatto'))
+    queue.update_entry('il cane', 1)
+    queue.delete_entry(_entry('il topo'))
+    queue.flush()
+
+    assert vocabulary_collection.writes == [('upsert_entry', 'il gatto')]
+    assert queue.depth == 2
+
+    queue.update_entry('il gatto', 2)
+    queue.flush()
+
+    assert vocabulary_collection.writes == [
+        ('upsert_entry', 'il gatto'),
+        ('update_entry', 'il cane', 1),
+        ('delete_entry', 'il topo'),
+        ('update_entry', 'il gatto', 2)
+    ]
+    assert queue.depth == 0
+
+
+def test_non_database_write_failures_are_discarded(queue, vocabulary_collection):
+    vocabulary_collection.failing_write_indices = {0}
+    vocabulary_collection.failure = ValueError('invalid entry')
+
+    queue.upsert_entry(_entry('il gatto'))
+    queue.update_entry('il cane', 1)
+    queue.flush()
+
+    assert vocabulary_collection.writes == [('update_entry', 'il cane', 1)]
+    assert queue.depth == 0
+
+
+def test_close_flushes_pending_writes(vocabulary_collection):
+    queue = VocabularyWriteQueue(flush_interval=3600)
+    queue.update_entry('il gatto', 1)
+    queue.close()
+
+    assert vocabulary_collection.writes == [('update_entry', 'il gatto', 1)]
+
+
+def test_pending_writes_are_flushed_periodically(vocabulary_collection):
+    queue = VocabularyWriteQueue(flush_interval=0.01)
+    try:
+        queue.update_entry('il gatto', 1)
+
+        deadline = time.monotonic() + 5
+        while not vocabulary_collection.writes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert vocabulary_collection.writes == [('update_entry', 'il gatto', 1)]
+    finally:
+        queue.close()
+
+
+def test_periodic_flushing_survives_failures(monkeypatch, vocabulary_collection):
+    user_database = vocabulary_write_queue.UserDatabase.instance()
+    n_instance_calls = []
+
+    def instance():
+        n_instance_calls.append(None)
+        if len(n_instance_calls) == 1:
+            raise RuntimeError('database client not connected')
+        return user_database
+
+    monkeypatch.setattr(vocabulary_write_queue, 'UserDatabase', SimpleNamespace(instance=instance))
+
+    queue = VocabularyWriteQueue(flush_interval=0.01)
+    try:
+        queue.update_entry('il gatto', 1)
+
+        deadline = time.monotonic() + 5
+        while not vocabulary_collection.writes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert queue._flushing_thread.is_alive()
+    finally:
+        queue.close()
+
+    assert len(n_instance_calls) >= 2
+    assert vocabulary_collection.writes == [('update_entry', 'il gatto', 1)]
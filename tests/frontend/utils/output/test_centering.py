@@ -0,0 +1,20 @@
+from termcolor import colored
+
+from frontend.src.utils.output.centering import align, block_centering_indentation, centering_indentation
+
+
+def test_centering_regards_display_width(monkeypatch):
+    monkeypatch.setattr('frontend.src.utils.output.centering._terminal_columns', lambda: 80)
+
+    japanese_sentence = '私は毎朝コーヒーを飲みます。'  # 14 chars, 28 columns
+    assert centering_indentation(japanese_sentence) == ' ' * 26
+    assert centering_indentation(colored('I drink coffee every morning.', 'red', force_color=True)) == ' ' * 25
+
+    assert block_centering_indentation(['Ich trinke jeden Morgen Kaffee', japanese_sentence]) == ' ' * 25
+
+
+def test_align_regards_display_width():
+    assert align(['他在看书', colored('quit', 'red', force_color=True)], ['reading', 'exit']) == [
+        '他在看书 reading',
+        f'{colored("quit", "red", force_color=True)}     exit'
+    ]
@@ -0,0 +1,32 @@
+import io
+import sys
+
+from frontend.src.utils.output.framing import frame, Frame
+
+
+class WriteRecordingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes: list[str] = []
+
+    def write(self, string: str) -> int:
+        self.writes.append(string)
+        return super().write(string)
+
+
+def test_frame_writes_once_per_flush(monkeypatch):
+    stream = WriteRecordingStream()
+    monkeypatch.setattr('sys.stdout', stream)
+
+    with frame():
+        assert isinstance(sys.stdout, Frame)
+        for i in range(100):
+            print(f'row {i}')
+        sys.stdout.flush()
+
+        with frame():
+            print('nested')
+        print('last', end='')
+
+    assert sys.stdout is stream
+    assert stream.writes == [''.join(f'row {i}\n' for i in range(100)), 'nested\nlast']
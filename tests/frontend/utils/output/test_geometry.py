@@ -0,0 +1,46 @@
+import os
+import signal
+
+import pytest
+
+from frontend.src.utils.output.geometry import TerminalGeometry
+
+
+@pytest.fixture
+def terminal_size(monkeypatch):
+    """ Returns:
+            dict holding the size reported by the patched shutil.get_terminal_size,
+            as well as the number of queries """
+
+    original_handler = signal.getsignal(signal.SIGWINCH)
+    state = {'size': os.terminal_size((80, 24)), 'n_queries': 0}
+
+    def get_terminal_size():
+        state['n_queries'] += 1
+        return state['size']
+
+    monkeypatch.setattr('shutil.get_terminal_size', get_terminal_size)
+    yield state
+
+    signal.signal(signal.SIGWINCH, original_handler)
+
+
+def test_size_refreshed_on_sigwinch_only(terminal_size):
+    geometry = TerminalGeometry()
+    n_notifications = []
+    geometry.subscribe(lambda: n_notifications.append(geometry.columns))
+
+    for _ in range(1_000):
+        assert (geometry.columns, geometry.lines) == (80, 24)
+    assert terminal_size['n_queries'] == 1
+
+    terminal_size['size'] = os.terminal_size((120, 40))
+    assert geometry.columns == 80
+
+    os.kill(os.getpid(), signal.SIGWINCH)
+    assert (geometry.columns, geometry.lines) == (120, 40)
+    assert n_notifications == [120]
+
+    # unchanged size doesn't notify
+    os.kill(os.getpid(), signal.SIGWINCH)
+    assert n_notifications == [120]
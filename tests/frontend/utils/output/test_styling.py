@@ -0,0 +1,20 @@
+from termcolor import colored
+
+from frontend.src.utils.output._utils import ansi_escape_code_stripped
+from frontend.src.utils.output.colorizing import colorize_chars
+
+
+def test_colorize_chars_emits_escapes_per_run(monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', '1')
+
+    ground_truth = 'la dichiarazione dei redditi'
+    char_mask = [10 <= i < 13 or i == 20 for i in range(len(ground_truth))]
+
+    colorized = colorize_chars(ground_truth, char_mask, color_kwargs={'color': 'green', 'attrs': ['underline']}, fallback_color_kwargs={'color': 'green'})
+
+    assert ansi_escape_code_stripped(colorized) == ground_truth
+    assert colorized.count('\033[') == 2 * 5  # escape sequence and reset per run
+    assert colorized.startswith(f'\033[32m{ground_truth[:10]}\033[0m\033[4;32m{ground_truth[10:13]}\033[0m')
+
+    per_char_colorized = str().join(colored(char, 'green', attrs=['underline'] if apply else None) for apply, char in zip(char_mask, ground_truth))
+    assert len(colorized) < len(per_char_colorized) / 3
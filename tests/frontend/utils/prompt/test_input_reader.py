@@ -0,0 +1,63 @@
+import os
+import pty
+import tty
+
+import pytest
+
+from frontend.src.utils.prompt.input_reader import InputReader, Key, KeyDecoder
+
+
+def test_key_decoder_awaits_split_sequences():
+    decoder = KeyDecoder()
+
+    assert decoder.feed(b'\x1b[') == [] and decoder.pending_escape
+    assert decoder.feed(b'3~\x1b[D\xe2\x82') == [Key.Delete, Key.Left]
+    assert decoder.feed(b'\xac\x7f') == ['€', Key.Backspace]
+
+
+@pytest.fixture
+def typed(monkeypatch):
+    """ Returns:
+            function writing to the master end of a pseudo terminal, whose slave end serves as stdin """
+
+    master_fd, slave_fd = pty.openpty()
+
+    # let keystrokes typed ahead of reading reach the reader unprocessed by the line discipline
+    tty.setcbreak(slave_fd)
+    monkeypatch.setattr('sys.stdin', os.fdopen(slave_fd))
+
+    yield lambda data: os.write(master_fd, data)
+
+    os.close(master_fd)
+
+
+def test_line_editing(typed):
+    typed('\x1b[Aadd\x7f\x7fß\r'.encode())
+    assert InputReader().read_line() == 'aß'
+
+
+def test_escape_cancels(typed):
+    typed(b'qu\x1b')
+    assert InputReader().read_line(cancelable=True) is None
+
+
+def test_single_key_completion(typed):
+    typed(b'q')
+    assert InputReader().read_line(completion=lambda line: 'quit' if line == 'q' else None) == 'quit'
+
+
+def test_prefill_editable(typed):
+    typed(b'\x7f5\r')
+    assert InputReader().read_line(prefill='1.0') == '1.5'
+
+
+def test_cursor_editing(typed):
+    typed(b'ac\x1b[Db\x1b[H\x1b[3~x\x1b[F!\x1b[D\x1b[D\x7f\r')
+    assert InputReader().read_line() == 'xc!'
+
+
+def test_fallback_retains_prefill_on_empty_line(monkeypatch):
+    monkeypatch.setattr('builtins.input', lambda prompt: '')
+    monkeypatch.setattr(InputReader, 'available', False)
+
+    assert InputReader().read_line('> ', prefill='il gatto - the cat') == 'il gatto - the cat'
@@ -0,0 +1,36 @@
+from typing import Iterable, Optional
+
+from hypothesis import given, strategies as st
+
+from frontend.src.utils.prompt.resolution import OptionResolver
+
+
+def reference_resolution(_input: str, options: Iterable[str]) -> Optional[str]:
+    """ Linear scan resolution, formerly employed by prompt_relentlessly """
+
+    processed_input = _input.lower().strip()
+    options_starting_on_input = list(filter(lambda option: option.lower().startswith(processed_input), options))
+
+    if len(options_starting_on_input) == 1:
+        return options_starting_on_input[0]
+    elif processed_input in options_starting_on_input:
+        return _input
+    return None
+
+
+# small alphabet comprising case-, whitespace- and length-altering lowercasing
+# characters, in order for prefixes, ambiguities and duplicates to be frequent
+_texts = st.text(alphabet='abAB İßé', max_size=5)
+
+
+@given(options=st.lists(_texts, max_size=8), _input=_texts)
+def test_resolution_equals_reference_resolution(options, _input):
+    assert OptionResolver(options).resolve(_input) == reference_resolution(_input, options)
+
+
+@given(options=st.lists(_texts, min_size=1, max_size=8), data=st.data())
+def test_resolution_of_option_prefixes_equals_reference_resolution(options, data):
+    option = data.draw(st.sampled_from(options))
+    _input = option[:data.draw(st.integers(min_value=0, max_value=len(option)))]
+
+    assert OptionResolver(options).resolve(_input) == reference_resolution(_input, options)